@@ -8,8 +8,6 @@ from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import (
     Count,
     F,
-    Func,
-    OuterRef,
     Q,
     Sum,
 )
@@ -36,8 +34,6 @@ from plane.db.models import (
     CycleIssue,
     Issue,
     Project,
-    FileAsset,
-    IssueLink,
     ProjectMember,
     UserFavorite,
 )
@@ -802,12 +798,7 @@ class CycleIssueListCreateAPIEndpoint(BaseAPIView):
 
     def get_queryset(self):
         return (
-            CycleIssue.objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("issue_id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            CycleIssue.objects.annotate(sub_issues_count=F("issue__sub_issues_count"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(
@@ -849,12 +840,6 @@ class CycleIssueListCreateAPIEndpoint(BaseAPIView):
         order_by = request.GET.get("order_by", "created_at")
         issues = (
             Issue.issue_objects.filter(issue_cycle__cycle_id=cycle_id, issue_cycle__deleted_at__isnull=True)
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
             .annotate(bridge_id=F("issue_cycle__id"))
             .filter(project_id=project_id)
             .filter(workspace__slug=slug)
@@ -865,21 +850,6 @@ class CycleIssueListCreateAPIEndpoint(BaseAPIView):
             .prefetch_related("assignees")
             .prefetch_related("labels")
             .order_by(order_by)
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
         )
 
         return self.paginate(
@@ -1014,12 +984,7 @@ class CycleIssueDetailAPIEndpoint(BaseAPIView):
 
     def get_queryset(self):
         return (
-            CycleIssue.objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("issue_id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            CycleIssue.objects.annotate(sub_issues_count=F("issue__sub_issues_count"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(
@@ -13,7 +13,8 @@ from plane.db.models import (
     ProjectIdentifier,
     DeployBoard,
     ProjectPublicMember,
-    IssueSequence
+    IssueSequence,
+    IssueSequenceCounter,
 )
 from plane.utils.content_validator import (
     validate_html_content,
@@ -118,8 +119,15 @@ class ProjectListSerializer(DynamicBaseSerializer):
 
     def get_next_work_item_sequence(self, obj):
         """Get the next sequence ID that will be assigned to a new issue"""
-        max_sequence = IssueSequence.objects.filter(project_id=obj.id).aggregate(max_seq=Max("sequence"))["max_seq"]
-        return (max_sequence + 1) if max_sequence else 1
+        last_sequence = (
+            IssueSequenceCounter.objects.filter(project_id=obj.id).values_list("last_sequence", flat=True).first()
+        )
+        if last_sequence is None:
+            # The counter row is created with the project's first issue
+            last_sequence = IssueSequence.objects.filter(project_id=obj.id).aggregate(max_seq=Max("sequence"))[
+                "max_seq"
+            ]
+        return (last_sequence + 1) if last_sequence else 1
 
     class Meta:
         model = Project
@@ -2,6 +2,7 @@ from collections import defaultdict
 from decimal import Decimal
 
 
+from django.db import models
 from django.db.models import Count
 from django.db.models.expressions import result
 from django.utils import timezone
@@ -42,8 +43,15 @@ class CaseModuleListSerializer(serializers.ModelSerializer):
         """
         递归获取所有子节点
         """
-        # 获取直接子节点（未删除的）
-        direct_children = obj.children.filter(deleted_at__isnull=True).order_by('sort_order')
+        # 按物化路径一次查出整棵子树，子节点在同一 context 中复用
+        children_map = self.context.setdefault('module_children', {})
+        if obj.id not in children_map:
+            subtree = CaseModule.objects.filter(path__startswith=obj.path).exclude(id=obj.id).order_by('sort_order')
+            children_map[obj.id] = []
+            for module in subtree:
+                children_map.setdefault(module.id, [])
+                children_map.setdefault(module.parent_id, []).append(module)
+        direct_children = children_map[obj.id]
 
         # 使用相同的序列化器递归序列化子节点
         serializer = CaseModuleListSerializer(direct_children, many=True, context=self.context)
@@ -220,10 +228,33 @@ class CaseCreateUpdateSerializer(ModelSerializer):
         return instance
 
 
+class CaseModuleLiteSerializer(serializers.ModelSerializer):
+    """用例所在模块，不展开子树"""
+
+    class Meta:
+        model = CaseModule
+        fields = ['id', 'name', 'sort_order', 'parent', 'repository']
+
+
+class CaseListListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        cases = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        # 本页用例所在模块的祖先名称一次查出
+        ancestor_ids = {
+            ancestor_id
+            for case in cases if case.module_id and case.module
+            for ancestor_id in CaseModule.path_ids(case.module.path)
+        }
+        self.context['module_names'] = dict(
+            CaseModule.all_objects.filter(id__in=ancestor_ids).values_list('id', 'name')) if ancestor_ids else {}
+        return super().to_representation(cases)
+
+
 class CaseListSerializer(ModelSerializer):
     """用例查询"""
     # 替换 depth=1，改为显式序列化需要的关联字段
-    module = CaseModuleListSerializer(read_only=True)
+    module = CaseModuleLiteSerializer(read_only=True)
+    module_path = serializers.SerializerMethodField()
     assignee = UserLiteSerializer(read_only=True)
     labels = CaseLabelListSerializer(many=True, read_only=True)
     repository_name = serializers.CharField(source='repository.name', read_only=True)
@@ -232,26 +263,49 @@ class CaseListSerializer(ModelSerializer):
     # 保持原有的 review 字段
     review = serializers.SerializerMethodField()
 
+    def get_module_path(self, obj: TestCase):
+        if not obj.module_id or not obj.module:
+            return None
+        ancestor_ids = CaseModule.path_ids(obj.module.path)
+        names = self.context.get('module_names')
+        if names is None:
+            names = dict(CaseModule.all_objects.filter(id__in=ancestor_ids).values_list('id', 'name'))
+        return '/'.join(names.get(ancestor_id, '') for ancestor_id in ancestor_ids)
+
     def get_review(self, obj):
+        # 列表查询通过 annotate_case_list 预先取回最新评审结果
+        if hasattr(obj, 'latest_review'):
+            return obj.latest_review if obj.latest_review is not None else CaseReviewThrough.Result.NOT_START
         return obj.review
 
     def get_version(self, obj: TestCase):
-        if not obj.versions.exists():
+        if hasattr(obj, 'latest_version'):
+            version, version_updated_at = obj.latest_version, obj.latest_version_updated_at
+        else:
+            last_version = obj.versions.order_by('-version').first()
+            version = last_version.version if last_version else None
+            version_updated_at = last_version.updated_at if last_version else None
+        if version is None:
             return 1.0
-        last_version = obj.versions.order_by('-version').first()
-        if obj.updated_at == last_version.updated_at:
-            return last_version.version
+        if obj.updated_at == version_updated_at:
+            return version
         else:
-            return str(Decimal(str(last_version.version)) + Decimal(str(0.1)))
+            return str(Decimal(str(version)) + Decimal(str(0.1)))
 
     class Meta:
         model = TestCase
         fields = '__all__'
+        list_serializer_class = CaseListListSerializer
 
 
 class CaseModuleCreateUpdateSerializer(ModelSerializer):
     """创建和更新用例"""
 
+    def validate_parent(self, parent):
+        if parent and self.instance and self.instance.id.hex in parent.path.split('/'):
+            raise serializers.ValidationError('不能将模块移动到自身或其子模块下')
+        return parent
+
     class Meta:
         model = CaseModule
         fields = ['name', 'sort_order', 'parent', 'repository']
@@ -7,6 +7,7 @@ from plane.app.views import (
     FileAssetViewSet,
     # V2 Endpoints
     WorkspaceFileAssetEndpoint,
+    WorkspaceAssetSignedURLEndpoint,
     UserAssetsV2Endpoint,
     StaticFileAssetEndpoint,
     AssetRestoreEndpoint,
@@ -57,6 +58,11 @@ urlpatterns = [
         WorkspaceBulkAssetEndpoint.as_view(),
         name="workspace-file-assets",
     ),
+    path(
+        "assets/v2/workspaces/<str:slug>/signed-urls/",
+        WorkspaceAssetSignedURLEndpoint.as_view(),
+        name="workspace-asset-signed-urls",
+    ),
     path(
         "assets/v2/user-assets/",
         UserAssetsV2Endpoint.as_view(),
@@ -101,6 +101,7 @@ from .cycle.archive import CycleArchiveUnarchiveEndpoint
 from .asset.base import FileAssetEndpoint, UserAssetsEndpoint, FileAssetViewSet
 from .asset.v2 import (
     WorkspaceFileAssetEndpoint,
+    WorkspaceAssetSignedURLEndpoint,
     UserAssetsV2Endpoint,
     StaticFileAssetEndpoint,
     AssetRestoreEndpoint,
@@ -1,6 +1,7 @@
 from rest_framework.response import Response
 from rest_framework import status
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+from django.conf import settings
 from django.db.models import QuerySet, Q, Count
 from django.http import HttpRequest
 from django.db.models.functions import TruncMonth
@@ -17,6 +18,13 @@ from plane.db.models import (
     ProjectPage,
     Workspace,
     ProjectMember,
+    IssueRollup,
+)
+from plane.utils.analytics_rollup import (
+    filter_rollups_by_date,
+    get_rollup_monthly_stats,
+    get_rollup_state_group_counts,
+    rollup_count,
 )
 from plane.utils.build_chart import build_analytics_chart
 from plane.utils.date_utils import (
@@ -35,6 +43,12 @@ class AdvanceAnalyticsBaseView(BaseAPIView):
             project_ids=self.request.GET.get("project_ids", None),
         )
 
+    def get_issue_rollups(self) -> Optional[QuerySet]:
+        """Work item rollups matching the base filters, when analytics are served from rollups"""
+        if not settings.USE_ANALYTICS_ROLLUPS:
+            return None
+        return IssueRollup.objects.filter(**self.filters["base_filters"])
+
 
 class AdvanceAnalyticsEndpoint(AdvanceAnalyticsBaseView):
     def get_filtered_counts(self, queryset: QuerySet) -> Dict[str, int]:
@@ -59,6 +73,14 @@ class AdvanceAnalyticsEndpoint(AdvanceAnalyticsBaseView):
             # "filter_count": get_previous_count(),
         }
 
+    def get_rollup_counts(self, rollups: QuerySet) -> Dict[str, int]:
+        analytics_date_range = self.filters["analytics_date_range"]
+        if analytics_date_range:
+            rollups = filter_rollups_by_date(
+                rollups, (analytics_date_range["current"]["gte"], analytics_date_range["current"]["lte"])
+            )
+        return get_rollup_state_group_counts(rollups)
+
     def get_overview_data(self) -> Dict[str, Dict[str, int]]:
         members_query = WorkspaceMember.objects.filter(
             workspace__slug=self._workspace_slug, is_active=True, member__is_bot=False
@@ -77,7 +99,7 @@ class AdvanceAnalyticsEndpoint(AdvanceAnalyticsBaseView):
             "total_members": self.get_filtered_counts(members_query.filter(role=ROLE.MEMBER.value)),
             "total_guests": self.get_filtered_counts(members_query.filter(role=ROLE.GUEST.value)),
             "total_projects": self.get_filtered_counts(Project.objects.filter(**self.filters["project_filters"])),
-            "total_work_items": self.get_filtered_counts(Issue.issue_objects.filter(**self.filters["base_filters"])),
+            "total_work_items": self.get_work_items_count(),
             "total_cycles": self.get_filtered_counts(Cycle.objects.filter(**self.filters["base_filters"])),
             "total_intake": self.get_filtered_counts(
                 Issue.objects.filter(**self.filters["base_filters"]).filter(
@@ -86,7 +108,27 @@ class AdvanceAnalyticsEndpoint(AdvanceAnalyticsBaseView):
             ),
         }
 
+    def get_work_items_count(self) -> Dict[str, int]:
+        rollups = self.get_issue_rollups()
+        if rollups is not None:
+            return {"count": self.get_rollup_counts(rollups)["total_work_items"]}
+        return self.get_filtered_counts(Issue.issue_objects.filter(**self.filters["base_filters"]))
+
     def get_work_items_stats(self) -> Dict[str, Dict[str, int]]:
+        rollups = self.get_issue_rollups()
+        if rollups is not None:
+            counts = self.get_rollup_counts(rollups)
+            return {
+                key: {"count": counts[key]}
+                for key in [
+                    "total_work_items",
+                    "started_work_items",
+                    "backlog_work_items",
+                    "un_started_work_items",
+                    "completed_work_items",
+                ]
+            }
+
         base_queryset = Issue.issue_objects.filter(**self.filters["base_filters"])
 
         return {
@@ -138,6 +180,20 @@ class AdvanceAnalyticsStatsEndpoint(AdvanceAnalyticsBaseView):
         )
 
     def get_work_items_stats(self) -> Dict[str, Dict[str, int]]:
+        rollups = self.get_issue_rollups()
+        if rollups is not None:
+            return (
+                rollups.values("project_id", "project__name")
+                .annotate(
+                    cancelled_work_items=rollup_count("cancelled"),
+                    completed_work_items=rollup_count("completed"),
+                    backlog_work_items=rollup_count("backlog"),
+                    un_started_work_items=rollup_count("unstarted"),
+                    started_work_items=rollup_count("started"),
+                )
+                .order_by("project_id")
+            )
+
         base_queryset = Issue.issue_objects.filter(**self.filters["base_filters"])
         return (
             base_queryset.values("project_id", "project__name")
@@ -179,7 +235,13 @@ class AdvanceAnalyticsChartEndpoint(AdvanceAnalyticsBaseView):
                 "created_at__date__lte": end_date,
             }
 
-        total_work_items = base_queryset.filter(**date_filter).count()
+        rollups = self.get_issue_rollups()
+        if rollups is not None:
+            total_work_items = get_rollup_state_group_counts(
+                filter_rollups_by_date(rollups, self.filters["chart_period_range"])
+            )["total_work_items"]
+        else:
+            total_work_items = base_queryset.filter(**date_filter).count()
         total_cycles = Cycle.objects.filter(**self.filters["base_filters"], **date_filter).count()
         total_modules = Module.objects.filter(**self.filters["base_filters"], **date_filter).count()
         total_intake = Issue.objects.filter(
@@ -211,6 +273,8 @@ class AdvanceAnalyticsChartEndpoint(AdvanceAnalyticsBaseView):
         ]
 
     def work_item_completion_chart(self) -> Dict[str, Any]:
+        rollups = self.get_issue_rollups()
+
         # Get the base queryset
         queryset = (
             Issue.issue_objects.filter(**self.filters["base_filters"])
@@ -227,15 +291,20 @@ class AdvanceAnalyticsChartEndpoint(AdvanceAnalyticsBaseView):
             queryset = queryset.filter(created_at__date__gte=start_date, created_at__date__lte=end_date)
 
         # Annotate by month and count
-        monthly_stats = (
-            queryset.annotate(month=TruncMonth("created_at"))
-            .values("month")
-            .annotate(
-                created_count=Count("id"),
-                completed_count=Count("id", filter=Q(state__group="completed")),
+        if rollups is not None:
+            monthly_stats = get_rollup_monthly_stats(
+                filter_rollups_by_date(rollups, self.filters["chart_period_range"])
+            )
+        else:
+            monthly_stats = (
+                queryset.annotate(month=TruncMonth("created_at"))
+                .values("month")
+                .annotate(
+                    created_count=Count("id"),
+                    completed_count=Count("id", filter=Q(state__group="completed")),
+                )
+                .order_by("month")
             )
-            .order_by("month")
-        )
 
         # Create dictionary of month -> counts
         stats_dict = {
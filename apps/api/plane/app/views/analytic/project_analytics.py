@@ -1,6 +1,7 @@
 from rest_framework.response import Response
 from rest_framework import status
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Type
+from django.conf import settings
 from django.db.models import QuerySet, Q, Count
 from django.http import HttpRequest
 from django.db.models.functions import TruncMonth
@@ -15,10 +16,18 @@ from plane.db.models import (
     Module,
     CycleIssue,
     ModuleIssue,
+    IssueRollup,
+    IssueAssigneeRollup,
 )
 from django.db import models
 from django.db.models import F, Case, When, Value
 from django.db.models.functions import Concat
+from plane.utils.analytics_rollup import (
+    filter_rollups_by_date,
+    get_rollup_monthly_stats,
+    get_rollup_state_group_counts,
+    rollup_count,
+)
 from plane.utils.build_chart import build_analytics_chart
 from plane.utils.date_utils import (
     get_analytics_filters,
@@ -36,6 +45,12 @@ class ProjectAdvanceAnalyticsBaseView(BaseAPIView):
             project_ids=self.request.GET.get("project_ids", None),
         )
 
+    def get_issue_rollups(self, project_id, model: Type[models.Model] = IssueRollup) -> Optional[QuerySet]:
+        """Rollups of the project matching the base filters, when analytics are served from rollups"""
+        if not settings.USE_ANALYTICS_ROLLUPS:
+            return None
+        return model.objects.filter(**self.filters["base_filters"], project_id=project_id)
+
 
 class ProjectAdvanceAnalyticsEndpoint(ProjectAdvanceAnalyticsBaseView):
     def get_filtered_counts(self, queryset: QuerySet) -> Dict[str, int]:
@@ -73,6 +88,30 @@ class ProjectAdvanceAnalyticsEndpoint(ProjectAdvanceAnalyticsBaseView):
             ).values_list("issue_id", flat=True)
             base_queryset = Issue.issue_objects.filter(id__in=module_issues)
         else:
+            rollups = self.get_issue_rollups(project_id)
+            if rollups is not None:
+                analytics_date_range = self.filters["analytics_date_range"]
+                if analytics_date_range:
+                    rollups = filter_rollups_by_date(
+                        rollups,
+                        (
+                            analytics_date_range["current"]["gte"],
+                            analytics_date_range["current"]["lte"],
+                        ),
+                    )
+                counts = get_rollup_state_group_counts(rollups)
+                return {
+                    key: {"count": counts[key]}
+                    for key in [
+                        "total_work_items",
+                        "started_work_items",
+                        "backlog_work_items",
+                        "un_started_work_items",
+                        "completed_work_items",
+                        "cancelled_work_items",
+                    ]
+                }
+
             base_queryset = Issue.issue_objects.filter(
                 **self.filters["base_filters"], project_id=project_id
             )
@@ -150,6 +189,10 @@ class ProjectAdvanceAnalyticsStatsEndpoint(ProjectAdvanceAnalyticsBaseView):
             ).values_list("issue_id", flat=True)
             base_queryset = Issue.issue_objects.filter(id__in=module_issues)
         else:
+            rollups = self.get_issue_rollups(project_id, model=IssueAssigneeRollup)
+            if rollups is not None:
+                return self.get_assignee_rollup_stats(rollups)
+
             base_queryset = Issue.issue_objects.filter(
                 **self.filters["base_filters"], project_id=project_id
             )
@@ -197,6 +240,37 @@ class ProjectAdvanceAnalyticsStatsEndpoint(ProjectAdvanceAnalyticsBaseView):
             .order_by("display_name")
         )
 
+    def get_assignee_rollup_stats(self, rollups: QuerySet) -> QuerySet:
+        return (
+            rollups.annotate(display_name=F("assignee__display_name"))
+            .annotate(
+                avatar_url=Case(
+                    # If `avatar_asset` exists, use it to generate the asset URL
+                    When(
+                        assignee__avatar_asset__isnull=False,
+                        then=Concat(
+                            Value("/api/assets/v2/static/"),
+                            "assignee__avatar_asset",
+                            Value("/"),
+                        ),
+                    ),
+                    # If `avatar_asset` is None, fall back to using `avatar` field directly
+                    When(assignee__avatar_asset__isnull=True, then="assignee__avatar"),
+                    default=Value(None),
+                    output_field=models.CharField(),
+                )
+            )
+            .values("display_name", "assignee_id", "avatar_url")
+            .annotate(
+                cancelled_work_items=rollup_count("cancelled"),
+                completed_work_items=rollup_count("completed"),
+                backlog_work_items=rollup_count("backlog"),
+                un_started_work_items=rollup_count("unstarted"),
+                started_work_items=rollup_count("started"),
+            )
+            .order_by("display_name")
+        )
+
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
     def get(self, request: HttpRequest, slug: str, project_id: str) -> Response:
         self.initialize_workspace(slug, type="chart")
@@ -310,15 +384,21 @@ class ProjectAdvanceAnalyticsChartEndpoint(ProjectAdvanceAnalyticsBaseView):
                 )
 
             # Annotate by month and count
-            monthly_stats = (
-                queryset.annotate(month=TruncMonth("created_at"))
-                .values("month")
-                .annotate(
-                    created_count=Count("id"),
-                    completed_count=Count("id", filter=Q(state__group="completed")),
+            rollups = self.get_issue_rollups(project_id)
+            if rollups is not None:
+                monthly_stats = get_rollup_monthly_stats(
+                    filter_rollups_by_date(rollups, self.filters["chart_period_range"])
+                )
+            else:
+                monthly_stats = (
+                    queryset.annotate(month=TruncMonth("created_at"))
+                    .values("month")
+                    .annotate(
+                        created_count=Count("id"),
+                        completed_count=Count("id", filter=Q(state__group="completed")),
+                    )
+                    .order_by("month")
                 )
-                .order_by("month")
-            )
 
             # Create dictionary of month -> counts
             stats_dict = {
@@ -6,6 +6,7 @@ from django.conf import settings
 from django.http import HttpResponseRedirect
 from django.utils import timezone
 from django.db import IntegrityError
+from django.db.models import Exists, OuterRef, Q
 
 # Third party imports
 from rest_framework import status
@@ -14,10 +15,11 @@ from rest_framework.permissions import AllowAny
 
 # Module imports
 from ..base import BaseAPIView
-from plane.db.models import FileAsset, Workspace, Project, User
+from plane.db.models import FileAsset, Workspace, Project, ProjectMember, User
 from plane.settings.storage import S3Storage
 from plane.app.permissions import allow_permission, ROLE
 from plane.utils.cache import invalidate_cache_directly
+from plane.utils.issue_filters import filter_valid_uuids
 from plane.bgtasks.storage_metadata_task import get_asset_object_metadata
 from plane.throttles.asset import AssetRateThrottle
 
@@ -470,6 +472,66 @@ class WorkspaceBulkAssetEndpoint(BaseAPIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class WorkspaceAssetSignedURLEndpoint(BaseAPIView):
+    """This endpoint is used to get the signed URLs of many workspace assets at once."""
+
+    # Upper bound of the assets resolved by one request
+    max_assets = 200
+
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
+    def post(self, request, slug):
+        asset_ids = request.data.get("asset_ids", [])
+
+        # Check if the asset ids are provided
+        if not asset_ids or not isinstance(asset_ids, list):
+            return Response({"error": "No asset ids provided."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if len(asset_ids) > self.max_assets:
+            return Response(
+                {"error": f"At most {self.max_assets} assets can be requested at once."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        disposition = request.data.get("disposition", "inline")
+        if disposition not in ["inline", "attachment"]:
+            return Response({"error": "Invalid disposition."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Workspace assets are open to its members, project assets to the project members
+        assets = (
+            FileAsset.objects.filter(
+                id__in=filter_valid_uuids([str(asset_id) for asset_id in asset_ids]),
+                workspace__slug=slug,
+                is_uploaded=True,
+            )
+            .filter(
+                Q(project_id__isnull=True)
+                | Q(
+                    Exists(
+                        ProjectMember.objects.filter(
+                            project_id=OuterRef("project_id"),
+                            member=request.user,
+                            is_active=True,
+                        )
+                    )
+                )
+            )
+            .values("id", "asset", "attributes")
+        )
+
+        # Sign every asset with the one storage client, unresolved ids are left out
+        storage = S3Storage(request=request)
+        signed_urls = {
+            str(asset["id"]): storage.generate_presigned_url(
+                object_name=asset["asset"],
+                disposition=disposition,
+                filename=(asset["attributes"] or {}).get("name"),
+            )
+            for asset in assets
+        }
+
+        return Response(signed_urls, status=status.HTTP_200_OK)
+
+
 class StaticFileAssetEndpoint(BaseAPIView):
     """This endpoint is used to get the signed URL for a static asset."""
 
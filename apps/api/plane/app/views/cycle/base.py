@@ -25,6 +25,7 @@ from django.db import models
 from django.db.models.functions import Coalesce, Cast, Concat
 from django.utils import timezone
 from django.core.serializers.json import DjangoJSONEncoder
+from django.conf import settings
 
 # Third party imports
 from rest_framework import status
@@ -53,7 +54,15 @@ from plane.db.models import (
 from plane.utils.analytics_plot import burndown_plot
 from plane.bgtasks.recent_visited_task import recent_visited_task
 from plane.utils.host import base_host
-from plane.utils.cycle_transfer_issues import transfer_cycle_issues
+from plane.utils.cycle_transfer_issues import (
+    acquire_transfer_lock,
+    get_transfer_status,
+    get_transferable_cycle_issues,
+    release_transfer_lock,
+    set_transfer_status,
+    transfer_cycle_issues,
+)
+from plane.bgtasks.cycle_transfer_task import transfer_cycle_issues_task
 from .. import BaseAPIView, BaseViewSet
 from plane.bgtasks.webhook_task import model_activity
 from plane.utils.timezone_converter import convert_to_utc, user_timezone_converter
@@ -649,15 +658,50 @@ class TransferCycleIssueEndpoint(BaseAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Transfer cycle issues and create progress snapshot
-        result = transfer_cycle_issues(
-            slug=slug,
-            project_id=project_id,
-            cycle_id=cycle_id,
-            new_cycle_id=new_cycle_id,
-            request=request,
-            user_id=request.user.id,
-        )
+        if not acquire_transfer_lock(cycle_id):
+            return Response(
+                {"error": "A transfer of this cycle is already running"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Large cycles are transferred in the background, the progress is
+        # read back from the status endpoint
+        try:
+            transfer_async = (
+                get_transferable_cycle_issues(project_id=project_id, cycle_id=cycle_id).count()
+                > settings.CYCLE_TRANSFER_ASYNC_THRESHOLD
+            )
+            if transfer_async:
+                set_transfer_status(cycle_id, "queued", new_cycle_id=str(new_cycle_id))
+                transfer_cycle_issues_task.delay(
+                    slug=slug,
+                    project_id=str(project_id),
+                    cycle_id=str(cycle_id),
+                    new_cycle_id=str(new_cycle_id),
+                    user_id=str(request.user.id),
+                    origin=base_host(request=request, is_app=True),
+                )
+        except Exception:
+            # The lock is only handed over to the task once it is queued
+            set_transfer_status(cycle_id, "failed", new_cycle_id=str(new_cycle_id), error="Something went wrong")
+            release_transfer_lock(cycle_id)
+            raise
+
+        if transfer_async:
+            return Response({"status": "queued"}, status=status.HTTP_202_ACCEPTED)
+
+        try:
+            # Transfer cycle issues and create progress snapshot
+            result = transfer_cycle_issues(
+                slug=slug,
+                project_id=project_id,
+                cycle_id=cycle_id,
+                new_cycle_id=new_cycle_id,
+                request=request,
+                user_id=request.user.id,
+            )
+        finally:
+            release_transfer_lock(cycle_id)
 
         # Handle error response
         if result.get("error"):
@@ -668,6 +712,13 @@ class TransferCycleIssueEndpoint(BaseAPIView):
 
         return Response({"message": "Success"}, status=status.HTTP_200_OK)
 
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
+    def get(self, request, slug, project_id, cycle_id):
+        transfer_status = get_transfer_status(cycle_id)
+        if transfer_status is None:
+            return Response({"error": "No transfer found for the cycle"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(transfer_status, status=status.HTTP_200_OK)
+
 
 class CycleUserPropertiesEndpoint(BaseAPIView):
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
@@ -4,7 +4,7 @@ import json
 
 # Django imports
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db.models import OuterRef, Q, Prefetch, Exists, Subquery, Count
+from django.db.models import OuterRef, Q, Prefetch, Exists, Subquery
 from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
@@ -22,7 +22,6 @@ from plane.app.serializers import (
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import (
     Issue,
-    FileAsset,
     IssueLink,
     IssueSubscriber,
     IssueReaction,
@@ -54,41 +53,11 @@ class IssueArchiveViewSet(BaseViewSet):
     filterset_class = IssueFilterSet
 
     def apply_annotations(self, issues):
-        return (
-            issues.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
+        return issues.annotate(
+            cycle_id=Subquery(
+                CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
             )
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .prefetch_related("assignees", "labels", "issue_module__module")
-        )
+        ).prefetch_related("assignees", "labels", "issue_module__module")
 
     def get_queryset(self):
         return (
@@ -333,7 +302,10 @@ class BulkArchiveIssuesEndpoint(BaseAPIView):
                 origin=base_host(request=request, is_app=True),
             )
             issue.archived_at = timezone.now().date()
+            # bulk_update skips auto_now, the delta sync finds archived issues by updated_at
+            issue.updated_at = timezone.now()
             bulk_archive_issues.append(issue)
-        Issue.objects.bulk_update(bulk_archive_issues, ["archived_at"])
+        Issue.objects.bulk_update(bulk_archive_issues, ["archived_at", "updated_at"])
+        Issue.refresh_counters([issue.parent_id for issue in bulk_archive_issues], fields=["sub_issues_count"])
 
         return Response({"archived_at": str(timezone.now().date())}, status=status.HTTP_200_OK)
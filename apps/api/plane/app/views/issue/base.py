@@ -7,11 +7,9 @@ import time
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
 from django.db.models import (
-    Count,
     Exists,
-    F,
-    Func,
     OuterRef,
     Prefetch,
     Q,
@@ -37,13 +35,12 @@ from plane.app.serializers import (
     IssueSerializer,
     IssueUserPropertySerializer,
 )
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import issue_activity, issue_activity_batch
 from plane.bgtasks.issue_description_version_task import issue_description_version_task
 from plane.bgtasks.recent_visited_task import recent_visited_task
 from plane.bgtasks.webhook_task import model_activity
 from plane.db.models import (
     CycleIssue,
-    FileAsset,
     IntakeIssue,
     Issue,
     IssueActivity,
@@ -62,14 +59,14 @@ from plane.db.models import (
     UserRecentVisit, IssueType, ProjectIssueType,
 )
 from plane.utils.filters import ComplexFilterBackend, IssueFilterSet
-from plane.utils.global_paginator import paginate
+from plane.utils.global_paginator import delta_sync, paginate
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
     issue_queryset_grouper,
 )
 from plane.utils.host import base_host
-from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_filters import filters_require_distinct, issue_filters
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
 from plane.utils.timezone_converter import user_timezone_converter
@@ -101,6 +98,14 @@ class IssueListEndpoint(BaseAPIView):
         filters = issue_filters(request.query_params, "GET")
         issue_queryset = queryset.filter(**filters)
 
+        # Group by
+        group_by = request.GET.get("group_by", False)
+        sub_group_by = request.GET.get("sub_group_by", False)
+
+        # Rich filters use semi-joins, only legacy relation lookups can repeat rows
+        if filters_require_distinct(Issue, [*filters, group_by, sub_group_by]):
+            issue_queryset = issue_queryset.distinct()
+
         # Add select_related, prefetch_related if fields or expand is not None
         if self.fields or self.expand:
             issue_queryset = issue_queryset.select_related("workspace", "project", "state", "parent").prefetch_related(
@@ -108,44 +113,16 @@ class IssueListEndpoint(BaseAPIView):
             )
 
         # Add annotations
-        issue_queryset = (
-            issue_queryset.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+        issue_queryset = issue_queryset.annotate(
+            cycle_id=Subquery(
+                CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
             )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .distinct()
         )
 
         order_by_param = request.GET.get("order_by", "-created_at")
         # Issue queryset
         issue_queryset, _ = order_issue_queryset(issue_queryset=issue_queryset, order_by_param=order_by_param)
 
-        # Group by
-        group_by = request.GET.get("group_by", False)
-        sub_group_by = request.GET.get("sub_group_by", False)
-
         # issue queryset
         issue_queryset = issue_queryset_grouper(queryset=issue_queryset, group_by=group_by, sub_group_by=sub_group_by)
 
@@ -207,7 +184,7 @@ class IssueViewSet(BaseViewSet):
         issues = Issue.issue_objects.filter(
             project_id=self.kwargs.get("project_id"),
             workspace__slug=self.kwargs.get("slug"),
-        ).distinct()
+        )
 
         return issues
 
@@ -218,33 +195,6 @@ class IssueViewSet(BaseViewSet):
                     CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
                 )
             )
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
         )
 
         return issues
@@ -270,6 +220,14 @@ class IssueViewSet(BaseViewSet):
         # Apply legacy filters
         issue_queryset = issue_queryset.filter(**filters, **extra_filters)
 
+        # Group by
+        group_by = request.GET.get("group_by", False)
+        sub_group_by = request.GET.get("sub_group_by", False)
+
+        # Rich filters use semi-joins, only legacy relation lookups can repeat rows
+        if filters_require_distinct(Issue, [*filters, group_by, sub_group_by]):
+            issue_queryset = issue_queryset.distinct()
+
         # Keeping a copy of the queryset before applying annotations
         filtered_issue_queryset = copy.deepcopy(issue_queryset)
 
@@ -281,10 +239,6 @@ class IssueViewSet(BaseViewSet):
             issue_queryset=issue_queryset, order_by_param=order_by_param
         )
 
-        # Group by
-        group_by = request.GET.get("group_by", False)
-        sub_group_by = request.GET.get("sub_group_by", False)
-
         # issue queryset
         issue_queryset = issue_queryset_grouper(queryset=issue_queryset, group_by=group_by, sub_group_by=sub_group_by)
 
@@ -499,33 +453,6 @@ class IssueViewSet(BaseViewSet):
             )
             .select_related("state")
             .annotate(cycle_id=Subquery(CycleIssue.objects.filter(issue=OuterRef("id")).values("cycle_id")[:1]))
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
             .annotate(
                 label_ids=Coalesce(
                     Subquery(
@@ -866,8 +793,12 @@ class BulkDeleteIssuesEndpoint(BaseAPIView):
         # Then, delete all related module issues
         ModuleIssue.objects.filter(issue_id__in=issue_ids).delete()
 
-        # Finally, delete the issues themselves
-        issues.delete()
+        # Finally, delete the issues themselves, the queryset update skips the
+        # save that recounts the sub work items of their parents
+        parent_ids = set(issues.filter(parent_id__isnull=False).values_list("parent_id", flat=True))
+        with transaction.atomic():
+            issues.delete()
+            Issue.refresh_counters(parent_ids, fields=["sub_issues_count"])
 
         return Response(
             {"message": f"{total_issues} issues were deleted"},
@@ -901,33 +832,6 @@ class IssuePaginatedViewSet(BaseViewSet):
         return (
             issue_queryset.select_related("state")
             .annotate(cycle_id=Subquery(CycleIssue.objects.filter(issue=OuterRef("id")).values("cycle_id")[:1]))
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
         )
 
     def process_paginated_result(self, fields, results, timezone):
@@ -1038,6 +942,41 @@ class IssuePaginatedViewSet(BaseViewSet):
             ),
         )
 
+        # Sync only the changes since the previous sync, with tombstones for the removed issues
+        if request.GET.get("sync") == "delta":
+            tombstone_queryset = Issue.all_objects.filter(workspace__slug=slug, project_id=project_id).filter(
+                Q(archived_at__isnull=False) | Q(deleted_at__isnull=False)
+            )
+            if project_member.exists() and not project.guest_view_all_features:
+                tombstone_queryset = tombstone_queryset.filter(created_by=request.user)
+            try:
+                synced_data = delta_sync(
+                    queryset=queryset,
+                    tombstone_queryset=tombstone_queryset,
+                    cursor=cursor,
+                    sync_token=request.GET.get("sync_token", None),
+                    on_result=lambda results: self.process_paginated_result(
+                        required_fields, results, request.user.user_timezone
+                    ),
+                    page_size=self.get_per_page(request),
+                )
+            except ValueError:
+                return Response({"error": "Invalid sync cursor"}, status=status.HTTP_400_BAD_REQUEST)
+            return Response(synced_data, status=status.HTTP_200_OK)
+
+        # Seek through the issues by `updated_at` when the client asks for keyset cursors,
+        # `id` orders the issues updated at the same instant
+        if request.GET.get(self.cursor_mode_name) == "keyset":
+            return self.paginate(
+                request=request,
+                order_by=["updated_at", "id"],
+                queryset=queryset,
+                total_count_queryset=base_queryset,
+                on_results=lambda results: self.process_paginated_result(
+                    required_fields, results, request.user.user_timezone
+                ),
+            )
+
         paginated_data = paginate(
             base_queryset=base_queryset,
             queryset=queryset,
@@ -1061,27 +1000,6 @@ class IssueDetailEndpoint(BaseAPIView):
                     CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
                 )
             )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
             .prefetch_related(
                 Prefetch(
                     "issue_assignee",
@@ -1211,6 +1129,7 @@ class IssueBulkUpdateDateEndpoint(BaseAPIView):
         issues = list(Issue.objects.filter(id__in=issue_ids))
         issues_dict = {str(issue.id): issue for issue in issues}
         issues_to_update = []
+        activity_records = []
 
         for update in updates:
             issue_id = update["id"]
@@ -1229,27 +1148,27 @@ class IssueBulkUpdateDateEndpoint(BaseAPIView):
                 )
 
             if start_date:
-                issue_activity.delay(
-                    type="issue.activity.updated",
-                    requested_data=json.dumps({"start_date": update.get("start_date")}),
-                    current_instance=json.dumps({"start_date": str(issue.start_date)}),
-                    issue_id=str(issue_id),
-                    actor_id=str(request.user.id),
-                    project_id=str(project_id),
-                    epoch=epoch,
+                activity_records.append(
+                    {
+                        "type": "issue.activity.updated",
+                        "requested_data": json.dumps({"start_date": update.get("start_date")}),
+                        "current_instance": json.dumps({"start_date": str(issue.start_date)}),
+                        "issue_id": str(issue_id),
+                        "project_id": str(project_id),
+                    }
                 )
                 issue.start_date = start_date
                 issues_to_update.append(issue)
 
             if target_date:
-                issue_activity.delay(
-                    type="issue.activity.updated",
-                    requested_data=json.dumps({"target_date": update.get("target_date")}),
-                    current_instance=json.dumps({"target_date": str(issue.target_date)}),
-                    issue_id=str(issue_id),
-                    actor_id=str(request.user.id),
-                    project_id=str(project_id),
-                    epoch=epoch,
+                activity_records.append(
+                    {
+                        "type": "issue.activity.updated",
+                        "requested_data": json.dumps({"target_date": update.get("target_date")}),
+                        "current_instance": json.dumps({"target_date": str(issue.target_date)}),
+                        "issue_id": str(issue_id),
+                        "project_id": str(project_id),
+                    }
                 )
                 issue.target_date = target_date
                 issues_to_update.append(issue)
@@ -1257,6 +1176,10 @@ class IssueBulkUpdateDateEndpoint(BaseAPIView):
         # Bulk update issues
         Issue.objects.bulk_update(issues_to_update, ["start_date", "target_date"])
 
+        # Track the activities of all the issues in one task
+        if activity_records:
+            issue_activity_batch.delay(records=activity_records, actor_id=str(request.user.id), epoch=epoch)
+
         return Response({"message": "Issues updated successfully"}, status=status.HTTP_200_OK)
 
 
@@ -1313,27 +1236,6 @@ class IssueDetailIdentifierEndpoint(BaseAPIView):
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
             .annotate(cycle_id=Subquery(CycleIssue.objects.filter(issue=OuterRef("id")).values("cycle_id")[:1]))
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
             .filter(sequence_id=issue_identifier)
             .annotate(
                 label_ids=Coalesce(
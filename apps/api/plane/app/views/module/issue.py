@@ -2,7 +2,7 @@
 import copy
 import json
 
-from django.db.models import F, Func, OuterRef, Q, Subquery
+from django.db.models import OuterRef, Q, Subquery
 
 # Django Imports
 from django.utils import timezone
@@ -16,11 +16,9 @@ from rest_framework.response import Response
 
 from plane.app.permissions import allow_permission, ROLE
 from plane.app.serializers import ModuleIssueSerializer
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import issue_activity, issue_activity_batch
 from plane.db.models import (
     Issue,
-    FileAsset,
-    IssueLink,
     ModuleIssue,
     Project,
     CycleIssue,
@@ -54,27 +52,6 @@ class ModuleIssueViewSet(BaseViewSet):
                     CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
                 )
             )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
             .prefetch_related("assignees", "labels", "issue_module__module")
         )
 
@@ -226,20 +203,22 @@ class ModuleIssueViewSet(BaseViewSet):
             ignore_conflicts=True,
         )
         # Bulk Update the activity
-        _ = [
-            issue_activity.delay(
-                type="module.activity.created",
-                requested_data=json.dumps({"module_id": str(module_id)}),
-                actor_id=str(request.user.id),
-                issue_id=str(issue),
-                project_id=project_id,
-                current_instance=None,
-                epoch=int(timezone.now().timestamp()),
-                notification=True,
-                origin=base_host(request=request, is_app=True),
-            )
-            for issue in issues
-        ]
+        issue_activity_batch.delay(
+            records=[
+                {
+                    "type": "module.activity.created",
+                    "requested_data": json.dumps({"module_id": str(module_id)}),
+                    "current_instance": None,
+                    "issue_id": str(issue),
+                    "project_id": str(project_id),
+                }
+                for issue in issues
+            ],
+            actor_id=str(request.user.id),
+            epoch=int(timezone.now().timestamp()),
+            notification=True,
+            origin=base_host(request=request, is_app=True),
+        )
         return Response({"message": "success"}, status=status.HTTP_201_CREATED)
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
@@ -266,20 +245,22 @@ class ModuleIssueViewSet(BaseViewSet):
                 ignore_conflicts=True,
             )
             # Bulk Update the activity
-            _ = [
-                issue_activity.delay(
-                    type="module.activity.created",
-                    requested_data=json.dumps({"module_id": module}),
-                    actor_id=str(request.user.id),
-                    issue_id=issue_id,
-                    project_id=project_id,
-                    current_instance=None,
-                    epoch=int(timezone.now().timestamp()),
-                    notification=True,
-                    origin=base_host(request=request, is_app=True),
-                )
-                for module in modules
-            ]
+            issue_activity_batch.delay(
+                records=[
+                    {
+                        "type": "module.activity.created",
+                        "requested_data": json.dumps({"module_id": module}),
+                        "current_instance": None,
+                        "issue_id": str(issue_id),
+                        "project_id": str(project_id),
+                    }
+                    for module in modules
+                ],
+                actor_id=str(request.user.id),
+                epoch=int(timezone.now().timestamp()),
+                notification=True,
+                origin=base_host(request=request, is_app=True),
+            )
 
         for module_id in removed_modules:
             module_issue = ModuleIssue.objects.filter(
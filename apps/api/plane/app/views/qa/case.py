@@ -1,7 +1,9 @@
+import uuid
 from pathlib import Path
 
 from collections import defaultdict
 
+from django.conf import settings
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.http import FileResponse
 from django.db.models import Count
@@ -10,7 +12,6 @@ from rest_framework.response import Response
 from rest_framework import status
 from django.db import transaction
 from django.shortcuts import get_object_or_404
-from django.db.utils import IntegrityError
 from django.core.exceptions import ValidationError
 
 from plane.app.serializers.qa import CaseAttachmentSerializer, IssueListSerializer, CaseIssueSerializer, \
@@ -18,10 +19,14 @@ from plane.app.serializers.qa import CaseAttachmentSerializer, IssueListSerializ
     IssueUnselectSerializer, ReviewCaseRecordsSerializer
 from plane.app.serializers.qa.case import CaseExecuteRecordSerializer
 from plane.app.views import BaseAPIView, BaseViewSet
-from plane.utils.import_export import parser_case_file
+from plane.bgtasks.case_import_task import import_cases_task
+from plane.utils.case_import import get_import_status, import_cases, set_import_status, store_import_files
+from plane.utils.import_export import count_case_file, iter_case_file, parser_case_file
 from plane.db.models import TestCase, FileAsset, TestCaseComment, PlanCase, Issue, CaseModule, CaseLabel, \
-    CaseReview, CaseReviewThrough, CaseReviewRecord, TestCaseRepository, TestPlan, TestCaseVersion
+    CaseReview, CaseReviewThrough, CaseReviewRecord, TestCaseRepository, TestPlan
 from plane.utils.paginator import CustomPaginator
+from plane.utils.qa import annotate_case_list
+from plane.utils.qa_tree import build_case_tree
 from plane.utils.response import list_response
 
 
@@ -190,7 +195,6 @@ class CaseAPI(BaseViewSet):
             .distinct()
         )
 
-        repo_ids: set[str] = set()
         repo_name_by_id: dict[str, str] = {}
         module_ids_by_repo: dict[str, set[str]] = defaultdict(set)
 
@@ -199,105 +203,13 @@ class CaseAPI(BaseViewSet):
             if not repo_id:
                 continue
             repo_id = str(repo_id)
-            repo_ids.add(repo_id)
             repo_name_by_id[repo_id] = r.get('case__repository__name') or repo_id
             module_id = r.get('case__module_id')
             if module_id:
                 module_ids_by_repo[repo_id].add(str(module_id))
 
-        if not repo_ids:
-            return Response({"id": "all", "name": "全部用例库", "kind": "root", "children": []},
-                            status=status.HTTP_200_OK)
-
-        expanded_ids_by_repo: dict[str, set[str]] = {rid: set(mids) for rid, mids in module_ids_by_repo.items()}
-        for repo_id, mids in list(expanded_ids_by_repo.items()):
-            frontier = set(mids)
-            while frontier:
-                parent_ids = set(
-                    CaseModule.objects.filter(id__in=list(frontier), deleted_at__isnull=True, repository_id=repo_id)
-                    .exclude(parent_id__isnull=True)
-                    .values_list('parent_id', flat=True)
-                )
-                parent_ids = {str(pid) for pid in parent_ids if pid}
-                new_parents = parent_ids - mids
-                if not new_parents:
-                    break
-                mids.update(new_parents)
-                frontier = new_parents
-            expanded_ids_by_repo[repo_id] = mids
-
-        all_module_ids: set[str] = set()
-        for mids in expanded_ids_by_repo.values():
-            all_module_ids.update(mids)
-
-        module_rows_by_repo: dict[str, list[dict]] = defaultdict(list)
-        if all_module_ids:
-            for m in CaseModule.objects.filter(id__in=list(all_module_ids), deleted_at__isnull=True).values(
-                    'id', 'name', 'parent_id', 'repository_id'
-            ):
-                module_rows_by_repo[str(m.get('repository_id'))].append(m)
-
-        def build_module_tree(repo_id: str):
-            items = module_rows_by_repo.get(repo_id, [])
-            by_id = {str(m.get('id')): m for m in items if m.get('id')}
-            children_map: dict[str, list[str]] = defaultdict(list)
-
-            for m in items:
-                mid = str(m.get('id'))
-                pid = str(m.get('parent_id')) if m.get('parent_id') else None
-                if pid and pid in by_id:
-                    children_map[pid].append(mid)
-
-            roots: list[str] = []
-            for mid, m in by_id.items():
-                pid = str(m.get('parent_id')) if m.get('parent_id') else None
-                if not pid or pid not in by_id:
-                    roots.append(mid)
-
-            def name_key(mid: str):
-                return (by_id.get(mid, {}).get('name') or '').lower()
-
-            roots.sort(key=name_key)
-            for pid in list(children_map.keys()):
-                children_map[pid].sort(key=name_key)
-
-            def build(mid: str):
-                m = by_id.get(mid) or {}
-                return {
-                    "id": mid,
-                    "name": m.get("name") or "-",
-                    "kind": "module",
-                    "repository_id": repo_id,
-                    "children": [build(child) for child in children_map.get(mid, [])],
-                }
-
-            return [build(mid) for mid in roots]
-
-        repo_pairs = [(rid, repo_name_by_id.get(rid) or rid) for rid in repo_ids]
-        repo_pairs.sort(key=lambda x: (x[1] or '').lower())
-
-        children = []
-        for repo_id, repo_name in repo_pairs:
-            module_tree = build_module_tree(repo_id)
-            children.append(
-                {
-                    "id": repo_id,
-                    "name": repo_name or "-",
-                    "kind": "repository",
-                    "repository_id": repo_id,
-                    "children": [
-                        {
-                            "id": f"{repo_id}:all_modules",
-                            "name": "全部模块",
-                            "kind": "repository_modules_all",
-                            "repository_id": repo_id,
-                            "children": module_tree,
-                        }
-                    ],
-                }
-            )
-
-        return Response({"id": "all", "name": "全部用例库", "kind": "root", "children": children},
+        repositories = sorted(repo_name_by_id.items(), key=lambda x: (x[1] or '').lower())
+        return Response(build_case_tree(repositories, module_ids_by_repository=module_ids_by_repo),
                         status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['get'], url_path='review-case-tree')
@@ -314,7 +226,6 @@ class CaseAPI(BaseViewSet):
             .distinct()
         )
 
-        repo_ids: set[str] = set()
         repo_name_by_id: dict[str, str] = {}
         module_ids_by_repo: dict[str, set[str]] = defaultdict(set)
 
@@ -323,105 +234,13 @@ class CaseAPI(BaseViewSet):
             if not repo_id:
                 continue
             repo_id = str(repo_id)
-            repo_ids.add(repo_id)
             repo_name_by_id[repo_id] = r.get('case__repository__name') or repo_id
             module_id = r.get('case__module_id')
             if module_id:
                 module_ids_by_repo[repo_id].add(str(module_id))
 
-        if not repo_ids:
-            return Response({"id": "all", "name": "全部用例库", "kind": "root", "children": []},
-                            status=status.HTTP_200_OK)
-
-        expanded_ids_by_repo: dict[str, set[str]] = {rid: set(mids) for rid, mids in module_ids_by_repo.items()}
-        for repo_id, mids in list(expanded_ids_by_repo.items()):
-            frontier = set(mids)
-            while frontier:
-                parent_ids = set(
-                    CaseModule.objects.filter(id__in=list(frontier), deleted_at__isnull=True, repository_id=repo_id)
-                    .exclude(parent_id__isnull=True)
-                    .values_list('parent_id', flat=True)
-                )
-                parent_ids = {str(pid) for pid in parent_ids if pid}
-                new_parents = parent_ids - mids
-                if not new_parents:
-                    break
-                mids.update(new_parents)
-                frontier = new_parents
-            expanded_ids_by_repo[repo_id] = mids
-
-        all_module_ids: set[str] = set()
-        for mids in expanded_ids_by_repo.values():
-            all_module_ids.update(mids)
-
-        module_rows_by_repo: dict[str, list[dict]] = defaultdict(list)
-        if all_module_ids:
-            for m in CaseModule.objects.filter(id__in=list(all_module_ids), deleted_at__isnull=True).values(
-                    'id', 'name', 'parent_id', 'repository_id'
-            ):
-                module_rows_by_repo[str(m.get('repository_id'))].append(m)
-
-        def build_module_tree(repo_id: str):
-            items = module_rows_by_repo.get(repo_id, [])
-            by_id = {str(m.get('id')): m for m in items if m.get('id')}
-            children_map: dict[str, list[str]] = defaultdict(list)
-
-            for m in items:
-                mid = str(m.get('id'))
-                pid = str(m.get('parent_id')) if m.get('parent_id') else None
-                if pid and pid in by_id:
-                    children_map[pid].append(mid)
-
-            roots: list[str] = []
-            for mid, m in by_id.items():
-                pid = str(m.get('parent_id')) if m.get('parent_id') else None
-                if not pid or pid not in by_id:
-                    roots.append(mid)
-
-            def name_key(mid: str):
-                return (by_id.get(mid, {}).get('name') or '').lower()
-
-            roots.sort(key=name_key)
-            for pid in list(children_map.keys()):
-                children_map[pid].sort(key=name_key)
-
-            def build(mid: str):
-                m = by_id.get(mid) or {}
-                return {
-                    "id": mid,
-                    "name": m.get("name") or "-",
-                    "kind": "module",
-                    "repository_id": repo_id,
-                    "children": [build(child) for child in children_map.get(mid, [])],
-                }
-
-            return [build(mid) for mid in roots]
-
-        repo_pairs = [(rid, repo_name_by_id.get(rid) or rid) for rid in repo_ids]
-        repo_pairs.sort(key=lambda x: (x[1] or '').lower())
-
-        children = []
-        for repo_id, repo_name in repo_pairs:
-            module_tree = build_module_tree(repo_id)
-            children.append(
-                {
-                    "id": repo_id,
-                    "name": repo_name or "-",
-                    "kind": "repository",
-                    "repository_id": repo_id,
-                    "children": [
-                        {
-                            "id": f"{repo_id}:all_modules",
-                            "name": "全部模块",
-                            "kind": "repository_modules_all",
-                            "repository_id": repo_id,
-                            "children": module_tree,
-                        }
-                    ],
-                }
-            )
-
-        return Response({"id": "all", "name": "全部用例库", "kind": "root", "children": children},
+        repositories = sorted(repo_name_by_id.items(), key=lambda x: (x[1] or '').lower())
+        return Response(build_case_tree(repositories, module_ids_by_repository=module_ids_by_repo),
                         status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['get'], url_path='plan-unassociated-tree')
@@ -434,117 +253,22 @@ class CaseAPI(BaseViewSet):
 
         repositories = list(
             TestCaseRepository.objects.filter(project_id=plan.project_id, workspace__slug=slug, deleted_at__isnull=True)
-            .values('id', 'name')
+            .values_list('id', 'name')
             .order_by('name')
         )
-        repo_ids = [str(r['id']) for r in repositories]
-
-        modules = list(
-            CaseModule.objects.filter(repository_id__in=repo_ids, deleted_at__isnull=True)
-            .values('id', 'name', 'parent_id', 'repository_id')
-        )
+        repo_ids = [r[0] for r in repositories]
 
-        unassociated = (
+        cases = (
             TestCase.objects.filter(repository_id__in=repo_ids, deleted_at__isnull=True)
             .exclude(plan_cases__plan__id=plan_id, plan_cases__deleted_at__isnull=True)
         )
 
-        repo_counts = {
-            str(r['repository_id']): int(r['count'])
-            for r in unassociated.values('repository_id').annotate(count=Count('id'))
+        case_counts = {
+            (r['repository_id'], r['module_id']): int(r['count'])
+            for r in cases.values('repository_id', 'module_id').annotate(count=Count('id'))
             if r.get('repository_id')
         }
-
-        base_module_counts = {
-            str(r['module_id']): int(r['count'])
-            for r in unassociated.exclude(module_id__isnull=True).values('module_id').annotate(count=Count('id'))
-            if r.get('module_id')
-        }
-        modules_by_repo: dict[str, list[dict]] = defaultdict(list)
-        for m in modules:
-            rid = m.get('repository_id')
-            if rid:
-                modules_by_repo[str(rid)].append(m)
-
-        def build_module_tree_with_counts(repo_id: str):
-            items = modules_by_repo.get(repo_id, [])
-            by_id = {str(m['id']): m for m in items if m.get('id')}
-            children_map: dict[str, list[str]] = defaultdict(list)
-
-            for m in items:
-                mid = str(m.get('id'))
-                pid = str(m.get('parent_id')) if m.get('parent_id') else None
-                if pid and pid in by_id:
-                    children_map[pid].append(mid)
-
-            def name_key(mid: str):
-                return (by_id.get(mid, {}).get('name') or '').lower()
-
-            roots: list[str] = []
-            for mid, m in by_id.items():
-                pid = str(m.get('parent_id')) if m.get('parent_id') else None
-                if not pid or pid not in by_id:
-                    roots.append(mid)
-            roots.sort(key=name_key)
-            for pid in list(children_map.keys()):
-                children_map[pid].sort(key=name_key)
-
-            memo: dict[str, int] = {}
-
-            def subtree_count(mid: str) -> int:
-                if mid in memo:
-                    return memo[mid]
-                total = int(base_module_counts.get(mid, 0))
-                for child in children_map.get(mid, []):
-                    total += subtree_count(child)
-                memo[mid] = total
-                return total
-
-            def build(mid: str):
-                m = by_id.get(mid) or {}
-                return {
-                    "id": mid,
-                    "name": m.get("name") or "-",
-                    "kind": "module",
-                    "repository_id": repo_id,
-                    "count": subtree_count(mid),
-                    "children": [build(child) for child in children_map.get(mid, [])],
-                }
-
-            return [build(mid) for mid in roots]
-
-        children = []
-        total = 0
-        for r in repositories:
-            repo_id = str(r['id'])
-            repo_name = r.get('name') or "-"
-            repo_total = int(repo_counts.get(repo_id, 0))
-            total += repo_total
-            module_tree = build_module_tree_with_counts(repo_id)
-            children.append(
-                {
-                    "id": repo_id,
-                    "name": repo_name,
-                    "kind": "repository",
-                    "repository_id": repo_id,
-                    "count": repo_total,
-                    "children": [
-                        {
-                            "id": f"{repo_id}:all_modules",
-                            "name": "全部模块",
-                            "kind": "repository_modules_all",
-                            "repository_id": repo_id,
-                            "count": repo_total,
-                            "children": module_tree,
-                        }
-                    ],
-                }
-            )
-
-        return Response(
-            {"id": "all", "name": "全部用例库", "kind": "root", "count": total, "children": children},
-            status=status.HTTP_200_OK,
-        )
+        return Response(build_case_tree(repositories, case_counts=case_counts), status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['get'], url_path='plan-unassociated-cases')
     def plan_unassociated_cases(self, request, slug):
@@ -574,7 +298,7 @@ class CaseAPI(BaseViewSet):
         if name__icontains:
             cases = cases.filter(name__icontains=name__icontains)
 
-        cases = cases.order_by('-created_at')
+        cases = annotate_case_list(cases.order_by('-created_at'))
         paginator = self.pagination_class()
         paginated_queryset = paginator.paginate_queryset(cases, request)
         serializer = CaseListSerializer(paginated_queryset, many=True)
@@ -617,115 +341,19 @@ class CaseAPI(BaseViewSet):
 
         repositories = list(
             TestCaseRepository.objects.filter(project_id=project_id, workspace__slug=slug, deleted_at__isnull=True)
-            .values('id', 'name')
+            .values_list('id', 'name')
             .order_by('name')
         )
-        repo_ids = [str(r['id']) for r in repositories]
+        repo_ids = [r[0] for r in repositories]
 
-        modules = list(
-            CaseModule.objects.filter(repository_id__in=repo_ids, deleted_at__isnull=True)
-            .values('id', 'name', 'parent_id', 'repository_id')
-        )
-
-        all_cases = TestCase.objects.filter(repository_id__in=repo_ids, deleted_at__isnull=True)
+        cases = TestCase.objects.filter(repository_id__in=repo_ids, deleted_at__isnull=True)
 
-        repo_counts = {
-            str(r['repository_id']): int(r['count'])
-            for r in all_cases.values('repository_id').annotate(count=Count('id'))
+        case_counts = {
+            (r['repository_id'], r['module_id']): int(r['count'])
+            for r in cases.values('repository_id', 'module_id').annotate(count=Count('id'))
             if r.get('repository_id')
         }
-
-        base_module_counts = {
-            str(r['module_id']): int(r['count'])
-            for r in all_cases.exclude(module_id__isnull=True).values('module_id').annotate(count=Count('id'))
-            if r.get('module_id')
-        }
-
-        modules_by_repo: dict[str, list[dict]] = defaultdict(list)
-        for m in modules:
-            rid = m.get('repository_id')
-            if rid:
-                modules_by_repo[str(rid)].append(m)
-
-        def build_module_tree_with_counts(repo_id: str):
-            items = modules_by_repo.get(repo_id, [])
-            by_id = {str(m['id']): m for m in items if m.get('id')}
-            children_map: dict[str, list[str]] = defaultdict(list)
-
-            for m in items:
-                mid = str(m.get('id'))
-                pid = str(m.get('parent_id')) if m.get('parent_id') else None
-                if pid and pid in by_id:
-                    children_map[pid].append(mid)
-
-            def name_key(mid: str):
-                return (by_id.get(mid, {}).get('name') or '').lower()
-
-            roots: list[str] = []
-            for mid, m in by_id.items():
-                pid = str(m.get('parent_id')) if m.get('parent_id') else None
-                if not pid or pid not in by_id:
-                    roots.append(mid)
-            roots.sort(key=name_key)
-            for pid in list(children_map.keys()):
-                children_map[pid].sort(key=name_key)
-
-            memo: dict[str, int] = {}
-
-            def subtree_count(mid: str) -> int:
-                if mid in memo:
-                    return memo[mid]
-                total = int(base_module_counts.get(mid, 0))
-                for child in children_map.get(mid, []):
-                    total += subtree_count(child)
-                memo[mid] = total
-                return total
-
-            def build(mid: str):
-                m = by_id.get(mid) or {}
-                return {
-                    "id": mid,
-                    "name": m.get("name") or "-",
-                    "kind": "module",
-                    "repository_id": repo_id,
-                    "count": subtree_count(mid),
-                    "children": [build(child) for child in children_map.get(mid, [])],
-                }
-
-            return [build(mid) for mid in roots]
-
-        children = []
-        total = 0
-        for r in repositories:
-            repo_id = str(r['id'])
-            repo_name = r.get('name') or "-"
-            repo_total = int(repo_counts.get(repo_id, 0))
-            total += repo_total
-            module_tree = build_module_tree_with_counts(repo_id)
-            children.append(
-                {
-                    "id": repo_id,
-                    "name": repo_name,
-                    "kind": "repository",
-                    "repository_id": repo_id,
-                    "count": repo_total,
-                    "children": [
-                        {
-                            "id": f"{repo_id}:all_modules",
-                            "name": "全部模块",
-                            "kind": "repository_modules_all",
-                            "repository_id": repo_id,
-                            "count": repo_total,
-                            "children": module_tree,
-                        }
-                    ],
-                }
-            )
-
-        return Response(
-            {"id": "all", "name": "全部用例库", "kind": "root", "count": total, "children": children},
-            status=status.HTTP_200_OK,
-        )
+        return Response(build_case_tree(repositories, case_counts=case_counts), status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['get'], url_path='project-cases')
     def project_cases(self, request, slug):
@@ -752,7 +380,7 @@ class CaseAPI(BaseViewSet):
         if name__icontains:
             cases = cases.filter(name__icontains=name__icontains)
 
-        cases = cases.order_by('-created_at')
+        cases = annotate_case_list(cases.order_by('-created_at'))
         paginator = self.pagination_class()
         paginated_queryset = paginator.paginate_queryset(cases, request)
         serializer = CaseListSerializer(paginated_queryset, many=True)
@@ -794,118 +422,22 @@ class CaseAPI(BaseViewSet):
         repositories = list(
             TestCaseRepository.objects.filter(project_id=review.project_id, workspace__slug=slug,
                                               deleted_at__isnull=True)
-            .values('id', 'name')
+            .values_list('id', 'name')
             .order_by('name')
         )
-        repo_ids = [str(r['id']) for r in repositories]
+        repo_ids = [r[0] for r in repositories]
 
-        modules = list(
-            CaseModule.objects.filter(repository_id__in=repo_ids, deleted_at__isnull=True)
-            .values('id', 'name', 'parent_id', 'repository_id')
-        )
-
-        unassociated = (
+        cases = (
             TestCase.objects.filter(repository_id__in=repo_ids, deleted_at__isnull=True)
             .exclude(review_cases__review_id=review_id, review_cases__deleted_at__isnull=True)
         )
 
-        repo_counts = {
-            str(r['repository_id']): int(r['count'])
-            for r in unassociated.values('repository_id').annotate(count=Count('id'))
+        case_counts = {
+            (r['repository_id'], r['module_id']): int(r['count'])
+            for r in cases.values('repository_id', 'module_id').annotate(count=Count('id'))
             if r.get('repository_id')
         }
-
-        base_module_counts = {
-            str(r['module_id']): int(r['count'])
-            for r in unassociated.exclude(module_id__isnull=True).values('module_id').annotate(count=Count('id'))
-            if r.get('module_id')
-        }
-
-        modules_by_repo: dict[str, list[dict]] = defaultdict(list)
-        for m in modules:
-            rid = m.get('repository_id')
-            if rid:
-                modules_by_repo[str(rid)].append(m)
-
-        def build_module_tree_with_counts(repo_id: str):
-            items = modules_by_repo.get(repo_id, [])
-            by_id = {str(m['id']): m for m in items if m.get('id')}
-            children_map: dict[str, list[str]] = defaultdict(list)
-
-            for m in items:
-                mid = str(m.get('id'))
-                pid = str(m.get('parent_id')) if m.get('parent_id') else None
-                if pid and pid in by_id:
-                    children_map[pid].append(mid)
-
-            def name_key(mid: str):
-                return (by_id.get(mid, {}).get('name') or '').lower()
-
-            roots: list[str] = []
-            for mid, m in by_id.items():
-                pid = str(m.get('parent_id')) if m.get('parent_id') else None
-                if not pid or pid not in by_id:
-                    roots.append(mid)
-            roots.sort(key=name_key)
-            for pid in list(children_map.keys()):
-                children_map[pid].sort(key=name_key)
-
-            memo: dict[str, int] = {}
-
-            def subtree_count(mid: str) -> int:
-                if mid in memo:
-                    return memo[mid]
-                total = int(base_module_counts.get(mid, 0))
-                for child in children_map.get(mid, []):
-                    total += subtree_count(child)
-                memo[mid] = total
-                return total
-
-            def build(mid: str):
-                m = by_id.get(mid) or {}
-                return {
-                    "id": mid,
-                    "name": m.get("name") or "-",
-                    "kind": "module",
-                    "repository_id": repo_id,
-                    "count": subtree_count(mid),
-                    "children": [build(child) for child in children_map.get(mid, [])],
-                }
-
-            return [build(mid) for mid in roots]
-
-        children = []
-        total = 0
-        for r in repositories:
-            repo_id = str(r['id'])
-            repo_name = r.get('name') or "-"
-            repo_total = int(repo_counts.get(repo_id, 0))
-            total += repo_total
-            module_tree = build_module_tree_with_counts(repo_id)
-            children.append(
-                {
-                    "id": repo_id,
-                    "name": repo_name,
-                    "kind": "repository",
-                    "repository_id": repo_id,
-                    "count": repo_total,
-                    "children": [
-                        {
-                            "id": f"{repo_id}:all_modules",
-                            "name": "全部模块",
-                            "kind": "repository_modules_all",
-                            "repository_id": repo_id,
-                            "count": repo_total,
-                            "children": module_tree,
-                        }
-                    ],
-                }
-            )
-
-        return Response(
-            {"id": "all", "name": "全部用例库", "kind": "root", "count": total, "children": children},
-            status=status.HTTP_200_OK,
-        )
+        return Response(build_case_tree(repositories, case_counts=case_counts), status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['get'], url_path='review-unassociated-cases')
     def review_unassociated_cases(self, request, slug):
@@ -936,7 +468,7 @@ class CaseAPI(BaseViewSet):
         if name__icontains:
             cases = cases.filter(name__icontains=name__icontains)
 
-        cases = cases.order_by('-created_at')
+        cases = annotate_case_list(cases.order_by('-created_at'))
         paginator = self.pagination_class()
         paginated_queryset = paginator.paginate_queryset(cases, request)
         serializer = CaseListSerializer(paginated_queryset, many=True)
@@ -1013,7 +545,7 @@ class CaseAPI(BaseViewSet):
     def get_issue_case(self, request, slug):
         issue_id = request.query_params.get('issue_id')
         issue = Issue.objects.get(id=issue_id)
-        cases = issue.cases.all()
+        cases = annotate_case_list(issue.cases.all())
         serializer = CaseListSerializer(cases, many=True)
         return Response(data=serializer.data, status=status.HTTP_200_OK)
 
@@ -1033,7 +565,7 @@ class CaseAPI(BaseViewSet):
         if name__icontains:
             cases = cases.filter(name__icontains=name__icontains)
         cases = cases.exclude(id__in=case_id)
-        cases = cases.order_by('-created_at')
+        cases = annotate_case_list(cases.order_by('-created_at'))
 
         paginator = self.pagination_class()
         paginated_queryset = paginator.paginate_queryset(cases, request)
@@ -1071,77 +603,52 @@ class CaseAPI(BaseViewSet):
         repository_id = request.data.get('repository_id')
         if not repository_id:
             return Response({'error': 'repository_id is required'}, status=status.HTTP_400_BAD_REQUEST)
-        get_object_or_404(TestCaseRepository, id=repository_id, workspace__slug=slug, deleted_at__isnull=True)
+        repository = get_object_or_404(TestCaseRepository, id=repository_id, workspace__slug=slug,
+                                       deleted_at__isnull=True)
 
         files: list[InMemoryUploadedFile] = request.FILES.getlist('file')
         if not files:
             return Response({'error': 'file is required'}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            case_data = parser_case_file(files)
+            total_count = count_case_file(files)
         except Exception as e:
             return Response({'error': f'用例导入失败:{str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
-        total_count = len(case_data)
-        success_count = 0
-        fail_list = []
-        for data in case_data:
-            try:
-                code_key = data.get('code') or ''
-                defaults = dict(
-                    name=data['name'],
-                    repository_id=repository_id,
-                )
-                remark = data.get('remark')
-                if remark not in (None, ''):
-                    defaults['remark'] = remark
-
-                precondition = data.get('precondition')
-                if precondition not in (None, ''):
-                    defaults['precondition'] = precondition
 
-                steps = data.get('steps')
-                if steps not in (None, ''):
-                    defaults['steps'] = steps
-
-                priority_key = data.get('priority')
-                if priority_key not in (None, ''):
-                    defaults['priority'] = TestCase.Priority[priority_key].value
-
-                instance, _ = TestCase.objects.update_or_create(
-                    code=code_key,
-                    repository_id=repository_id,
-                    defaults=defaults
-                )
-
-                # 创建模块
-                if data.get('module'):
-                    case_module, _ = CaseModule.objects.get_or_create(repository_id=repository_id, name=data['module'])
-                    instance.module = case_module
-                # 创建标签
-                # if data.get('label'):
-                #     for label in data['label']:
-                #         label_instance, _ = CaseLabel.objects.get_or_create(repository_id=repository_id, name=label)
-                #         instance.labels.add(label_instance)
-                instance.save()
-
-                # 创建历史版本
-                TestCaseVersion.create_from_case(instance)
-            except IntegrityError as e:
-                fail_list.append(dict(name=data['name'], error='case name already exists'))
-                continue
-            except Exception as e:
-                fail_list.append(dict(name=data['name'], error=str(e).replace('\n', '')))
-                continue
-            success_count += 1
+        if total_count > settings.CASE_IMPORT_ASYNC_THRESHOLD:
+            # 大批量导入先保存上传文件，由后台任务逐行读取，通过 import-case-status 查询进度
+            import_id = str(uuid.uuid4())
+            try:
+                stored_files = store_import_files(import_id, files)
+            except OSError as e:
+                return Response({'error': f'用例导入失败:{str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
+            set_import_status(import_id, 'queued', total_count=total_count, processed_count=0)
+            import_cases_task.delay(import_id, str(repository.id), stored_files, str(request.user.id),
+                                    total_count=total_count)
+            return Response(data={'import_id': import_id, 'status': 'queued'}, status=status.HTTP_202_ACCEPTED)
 
-        return Response(data={'total_count': total_count, 'success_count': success_count, 'fail': fail_list},
-                        status=status.HTTP_200_OK)
+        try:
+            result = import_cases(repository.id, iter_case_file(files), request.user.id)
+        except Exception as e:
+            return Response({'error': f'用例导入失败:{str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(data=result, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='import-case-status')
+    def import_case_status(self, request, slug):
+        import_id = request.query_params.get('import_id')
+        if not import_id:
+            return Response({'error': 'import_id is required'}, status=status.HTTP_400_BAD_REQUEST)
+        import_status = get_import_status(import_id)
+        if import_status is None:
+            return Response({'error': 'No import found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(data=import_status, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['post'], url_path='validate-import-case')
     def validate_import_case(self, request, slug):
         repository_id = request.data.get('repository_id')
         if not repository_id:
             return Response({'error': 'repository_id is required'}, status=status.HTTP_400_BAD_REQUEST)
-        get_object_or_404(TestCaseRepository, id=repository_id, workspace__slug=slug, deleted_at__isnull=True)
+        repository = get_object_or_404(TestCaseRepository, id=repository_id, workspace__slug=slug,
+                                       deleted_at__isnull=True)
 
         files: list[InMemoryUploadedFile] = request.FILES.getlist('file')
         if not files:
@@ -1270,6 +777,8 @@ class CaseAPI(BaseViewSet):
         if source_cases.exclude(repository_id=target_module.repository_id).exists():
             return Response({"error": "Target module repository mismatch"}, status=status.HTTP_400_BAD_REQUEST)
 
+        source_cases = list(source_cases)
+        codes = iter(TestCase.allocate_codes(target_module.repository, len(source_cases)))
         created = []
         for source_case in source_cases:
             base_fields = dict(
@@ -1287,7 +796,7 @@ class CaseAPI(BaseViewSet):
             )
             base_fields = {k: v for k, v in base_fields.items() if v is not None}
 
-            new_case = TestCase.objects.create(code="", **base_fields)
+            new_case = TestCase.objects.create(code=next(codes), **base_fields)
 
             new_case.labels.set(list(source_case.labels.all()))
             new_case.issues.set(list(source_case.issues.all()))
@@ -18,6 +18,7 @@ from plane.app.views.qa.filters import TestPlanFilter
 from plane.db.models import TestPlan, TestCaseRepository, TestCase, CaseModule, CaseLabel, FileAsset, Workspace, \
     PlanModule, PlanCase, PlanCaseRecord, Issue, Cycle, CycleIssue
 from plane.utils.paginator import CustomPaginator
+from plane.utils.qa import annotate_case_list
 from plane.utils.response import list_response
 from plane.app.views import BaseAPIView, BaseViewSet
 from plane.app.serializers import TestPlanCreateUpdateSerializer, TestCaseRepositorySerializer, \
@@ -337,33 +338,7 @@ class PlanView(BaseViewSet):
 
         module_ids = request.query_params.getlist('module_id') or request.query_params.getlist('module_ids')
         if module_ids:
-            expanded = set(module_ids)
-            frontier = list(module_ids)
-            while frontier:
-                children = list(
-                    CaseModule.objects.filter(parent_id__in=frontier, deleted_at__isnull=True).values_list('id',
-                                                                                                           flat=True))
-                new_children = [c for c in children if c not in expanded]
-                if not new_children:
-                    break
-                expanded.update(new_children)
-                frontier = new_children
-            query = query.filter(case__module_id__in=list(expanded))
-        else:
-            module_id = request.query_params.get('module_id')
-            if module_id:
-                expanded = {module_id}
-                frontier = [module_id]
-                while frontier:
-                    children = list(
-                        CaseModule.objects.filter(parent_id__in=frontier, deleted_at__isnull=True).values_list('id',
-                                                                                                               flat=True))
-                    new_children = [c for c in children if c not in expanded]
-                    if not new_children:
-                        break
-                    expanded.update(new_children)
-                    frontier = new_children
-                query = query.filter(case__module_id__in=list(expanded))
+            query = query.filter(case__module_id__in=CaseModule.descendant_ids(module_ids))
         paginator = self.pagination_class()
         paginated_queryset = paginator.paginate_queryset(query, request)
         serializer = PlanCaseCardSerializer(instance=paginated_queryset, many=True)
@@ -575,7 +550,7 @@ class CaseAPIView(BaseAPIView):
     ordering_fields = ['updated_at', 'code']
 
     def get(self, request, slug):
-        cases = self.filter_queryset(self.queryset)
+        cases = self.filter_queryset(annotate_case_list(self.queryset))
         paginator = self.pagination_class()
         paginated_queryset = paginator.paginate_queryset(cases, request)
         serializer = self.serializer_class(instance=paginated_queryset, many=True)
@@ -200,33 +200,7 @@ class CaseReviewView(BaseViewSet):
             query = query.filter(case__name__icontains=name)
         module_ids = request.query_params.getlist('module_id') or request.query_params.getlist('module_ids')
         if module_ids:
-            expanded = set(module_ids)
-            frontier = list(module_ids)
-            while frontier:
-                children = list(
-                    CaseModule.objects.filter(parent_id__in=frontier, deleted_at__isnull=True).values_list('id',
-                                                                                                           flat=True))
-                new_children = [c for c in children if c not in expanded]
-                if not new_children:
-                    break
-                expanded.update(new_children)
-                frontier = new_children
-            query = query.filter(case__module_id__in=list(expanded))
-        else:
-            module_id = request.query_params.get('module_id')
-            if module_id:
-                expanded = {module_id}
-                frontier = [module_id]
-                while frontier:
-                    children = list(
-                        CaseModule.objects.filter(parent_id__in=frontier, deleted_at__isnull=True).values_list('id',
-                                                                                                               flat=True))
-                    new_children = [c for c in children if c not in expanded]
-                    if not new_children:
-                        break
-                    expanded.update(new_children)
-                    frontier = new_children
-                query = query.filter(case__module_id__in=list(expanded))
+            query = query.filter(case__module_id__in=CaseModule.descendant_ids(module_ids))
 
         query = NumericSuffixCodeOrderingFilter().filter_queryset(request, query, self)
         paginator = self.pagination_class()
@@ -240,23 +214,21 @@ class CaseReviewView(BaseViewSet):
         review = CaseReview.objects.get(id=review_id)
         case_ids = CaseReviewThrough.objects.filter(review_id=review_id).values_list('case_id', flat=True)
         modules = list(
-            CaseModule.objects.filter(repository_id=review.module.repository_id, deleted_at__isnull=True).values('id',
-                                                                                                                 'parent_id'))
-        base_counts = {m['id']: 0 for m in modules}
-        aggregates = TestCase.objects.filter(id__in=case_ids).values('module_id').annotate(count=Count('id'))
-        for item in aggregates:
-            if item['module_id']:
-                base_counts[item['module_id']] = item['count']
-        children_map = {}
-        for m in modules:
-            pid = m['parent_id']
-            if pid:
-                children_map.setdefault(pid, []).append(m['id'])
-        result = {str(m['id']): base_counts.get(m['id'], 0) for m in modules}
-        for m in modules:
-            mid = m['id']
-            for child in children_map.get(mid, []):
-                result[str(mid)] += base_counts.get(child, 0)
+            CaseModule.objects.filter(repository_id=review.module.repository_id).values_list('id', 'path'))
+        result = {str(mid): 0 for mid, _ in modules}
+        base_counts = {
+            item['module_id']: item['count']
+            for item in TestCase.objects.filter(id__in=case_ids).values('module_id').annotate(count=Count('id'))
+            if item['module_id']
+        }
+        # 用例数沿物化路径累加到所有祖先模块
+        for mid, path in modules:
+            count = base_counts.get(mid, 0)
+            if not count:
+                continue
+            for ancestor_id in CaseModule.path_ids(path):
+                if str(ancestor_id) in result:
+                    result[str(ancestor_id)] += count
         result['total'] = len(case_ids)
         return Response(data=result, status=status.HTTP_200_OK)
 
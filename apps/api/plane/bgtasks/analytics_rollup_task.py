@@ -0,0 +1,140 @@
+# Python imports
+import logging
+from collections import defaultdict
+from datetime import date
+from typing import Iterable, List, Optional
+from uuid import UUID
+
+# Django imports
+from django.db import connection, transaction
+from django.db.models import Count, Exists, F, OuterRef
+from django.db.models.functions import TruncDate
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import Issue, IssueAssignee, IssueAssigneeRollup, IssueRollup, Project
+from plane.utils.exception_logger import log_exception
+from plane.utils.uuid import convert_uuid_to_integer
+
+logger = logging.getLogger("plane.worker")
+
+
+def refresh_project_rollups(project_id: UUID | str, dates: Optional[Iterable[date]] = None) -> None:
+    """
+    Recompute the analytics rollups of a project for the given creation dates.
+
+    The rows of every date are rebuilt from `Issue.issue_objects`, so a refresh is
+    correct whatever changed on the work items created that day. Passing no dates
+    rebuilds the whole project.
+    """
+    workspace_id = Project.all_objects.filter(pk=project_id).values_list("workspace_id", flat=True).first()
+    if workspace_id is None:
+        return
+
+    issues = Issue.issue_objects.filter(project_id=project_id)
+    if dates is not None:
+        dates = sorted(set(dates))
+        if not dates:
+            return
+        issues = issues.filter(created_at__date__in=dates)
+
+    issue_rows = (
+        issues.annotate(date=TruncDate("created_at"))
+        .values("date", "priority", state_group=F("state__group"))
+        .annotate(issue_count=Count("id"))
+        .order_by()
+    )
+    assignee_rows = (
+        IssueAssignee.objects.filter(issue_id__in=issues.values("id"))
+        .annotate(date=TruncDate("issue__created_at"))
+        .values("date", "assignee_id", state_group=F("issue__state__group"))
+        .annotate(issue_count=Count("issue_id", distinct=True))
+        .order_by()
+    )
+    unassigned_rows = (
+        issues.filter(~Exists(IssueAssignee.objects.filter(issue_id=OuterRef("id"))))
+        .annotate(date=TruncDate("created_at"))
+        .values("date", state_group=F("state__group"))
+        .annotate(issue_count=Count("id"))
+        .order_by()
+    )
+
+    with transaction.atomic():
+        # Serialize the refreshes of a project so concurrent rebuilds cannot interleave
+        lock_key = convert_uuid_to_integer(f"analytics-rollup-{project_id}")
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [lock_key])
+
+        existing_rollups = IssueRollup.all_objects.filter(project_id=project_id)
+        existing_assignee_rollups = IssueAssigneeRollup.all_objects.filter(project_id=project_id)
+        if dates is not None:
+            existing_rollups = existing_rollups.filter(date__in=dates)
+            existing_assignee_rollups = existing_assignee_rollups.filter(date__in=dates)
+        existing_rollups.delete()
+        existing_assignee_rollups.delete()
+
+        IssueRollup.objects.bulk_create(
+            [
+                IssueRollup(
+                    project_id=project_id,
+                    workspace_id=workspace_id,
+                    date=row["date"],
+                    state_group=row["state_group"],
+                    priority=row["priority"],
+                    issue_count=row["issue_count"],
+                )
+                for row in issue_rows
+            ],
+            batch_size=1000,
+        )
+        IssueAssigneeRollup.objects.bulk_create(
+            [
+                IssueAssigneeRollup(
+                    project_id=project_id,
+                    workspace_id=workspace_id,
+                    date=row["date"],
+                    assignee_id=row.get("assignee_id"),
+                    state_group=row["state_group"],
+                    issue_count=row["issue_count"],
+                )
+                for row in [*assignee_rows, *unassigned_rows]
+            ],
+            batch_size=1000,
+        )
+
+
+@shared_task
+def refresh_issue_rollups(issue_ids: List[str]) -> None:
+    """Refresh the rollups of the days the given work items were created on"""
+    try:
+        project_dates = defaultdict(set)
+        for project_id, created_date in (
+            Issue.all_objects.filter(pk__in=issue_ids)
+            .annotate(date=TruncDate("created_at"))
+            .values_list("project_id", "date")
+            .distinct()
+        ):
+            project_dates[project_id].add(created_date)
+
+        for project_id, dates in project_dates.items():
+            refresh_project_rollups(project_id, dates)
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def backfill_issue_rollups(project_ids: Optional[List[str]] = None) -> None:
+    """Rebuild the rollups of the given projects, or of every project"""
+    projects = Project.objects.all()
+    if project_ids:
+        projects = projects.filter(pk__in=project_ids)
+
+    for project_id in projects.values_list("id", flat=True).iterator():
+        try:
+            refresh_project_rollups(project_id)
+            logger.info(f"Analytics rollups rebuilt for project {project_id}")
+        except Exception as e:
+            log_exception(e)
@@ -0,0 +1,26 @@
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.utils.case_import import delete_import_files, import_cases, iter_stored_case_rows, set_import_status
+from plane.utils.exception_logger import log_exception
+
+
+@shared_task
+def import_cases_task(import_id, repository_id, files, user_id, total_count=None):
+    """
+    Import a large test case workbook outside the request. `files` are the
+    (object key, file name) pairs of the uploads saved to storage, their
+    rows are streamed from storage rather than passed in the message.
+    """
+    set_import_status(import_id, "running", total_count=total_count, processed_count=0)
+    try:
+        result = import_cases(
+            repository_id, iter_stored_case_rows(files), user_id, import_id=import_id, total_count=total_count
+        )
+        set_import_status(import_id, "completed", **result)
+    except Exception as e:
+        log_exception(e)
+        set_import_status(import_id, "failed", error="Something went wrong")
+    finally:
+        delete_import_files(files)
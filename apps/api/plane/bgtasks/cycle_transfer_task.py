@@ -0,0 +1,35 @@
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.utils.cycle_transfer_issues import release_transfer_lock, set_transfer_status, transfer_cycle_issues
+from plane.utils.exception_logger import log_exception
+
+
+@shared_task
+def transfer_cycle_issues_task(slug, project_id, cycle_id, new_cycle_id, user_id, origin):
+    """Transfer the incomplete work items of a large cycle outside the request"""
+    set_transfer_status(cycle_id, "running", new_cycle_id=str(new_cycle_id))
+    try:
+        result = transfer_cycle_issues(
+            slug=slug,
+            project_id=project_id,
+            cycle_id=cycle_id,
+            new_cycle_id=new_cycle_id,
+            user_id=user_id,
+            origin=origin,
+        )
+        if result.get("error"):
+            set_transfer_status(cycle_id, "failed", new_cycle_id=str(new_cycle_id), error=result["error"])
+        else:
+            set_transfer_status(
+                cycle_id,
+                "completed",
+                new_cycle_id=str(new_cycle_id),
+                transferred_issues=result["transferred_issues"],
+            )
+    except Exception as e:
+        log_exception(e)
+        set_transfer_status(cycle_id, "failed", new_cycle_id=str(new_cycle_id), error="Something went wrong")
+    finally:
+        release_transfer_lock(cycle_id)
@@ -1,189 +1,344 @@
+# Python imports
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
 # Django imports
 from django.utils import timezone
 from django.apps import apps
 from django.conf import settings
-from django.db import models
-from django.db.models.fields.related import OneToOneRel
+from django.db import IntegrityError, models, transaction
+from django.db.models import QuerySet
+from django.db.models.deletion import Collector
 
 
 # Third party imports
 from celery import shared_task
 
+# Module imports
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
 
-@shared_task
-def soft_delete_related_objects(app_label, model_name, instance_pk, using=None):
-    """
-    Soft delete related objects for a given model instance
-    """
-    # Get the model class using app registry
-    model_class = apps.get_model(app_label, model_name)
+logger = logging.getLogger("plane.worker")
 
-    # Get the instance using all_objects to ensure we can get even if it's already soft deleted
-    try:
-        instance = model_class.all_objects.get(pk=instance_pk)
-    except model_class.DoesNotExist:
-        return
+HARD_DELETE_LOCK_KEY = "hard_delete:lock"
+HARD_DELETE_CURSOR_KEY = "hard_delete:cursor"
 
-    # Get all related fields that are reverse relationships
-    all_related = [
-        f for f in instance._meta.get_fields() if (f.one_to_many or f.one_to_one) and f.auto_created and not f.concrete
-    ]
+# Work items recounted per update after a cascade
+COUNTER_REFRESH_BATCH_SIZE = 1000
 
-    # Handle each related field
-    for relation in all_related:
-        related_name = relation.get_accessor_name()
 
-        # Skip if the relation doesn't exist
-        if not hasattr(instance, related_name):
-            continue
+@dataclass(frozen=True)
+class CascadeRelation:
+    """A reverse relation followed when soft deleting or restoring a row"""
+
+    related_model: Type[models.Model]
+    field_name: str
+    set_null: bool
+
 
-        # Get the on_delete behavior name
-        on_delete_name = relation.on_delete.__name__ if hasattr(relation.on_delete, "__name__") else ""
+@lru_cache(maxsize=None)
+def get_cascade_relations(model: Type[models.Model]) -> Tuple[CascadeRelation, ...]:
+    """
+    The reverse relations of a model that a soft delete cascades over.
+
+    `DO_NOTHING` relations are skipped, `SET_NULL` relations are nulled and every
+    other relation to a soft deletable model is soft deleted with its parent.
+    """
+    relations = []
+    for relation in model._meta.get_fields():
+        if not ((relation.one_to_many or relation.one_to_one) and relation.auto_created and not relation.concrete):
+            continue
 
+        on_delete_name = getattr(relation.on_delete, "__name__", "")
         if on_delete_name == "DO_NOTHING":
             continue
 
-        elif on_delete_name == "SET_NULL":
-            # Handle SET_NULL relationships
-            if isinstance(relation, OneToOneRel):
-                # For OneToOne relationships
-                related_obj = getattr(instance, related_name, None)
-                if related_obj and isinstance(related_obj, models.Model):
-                    setattr(related_obj, relation.remote_field.name, None)
-                    related_obj.save(update_fields=[relation.remote_field.name])
-            else:
-                # For other relationships
-                related_queryset = getattr(instance, related_name).all()
-                related_queryset.update(**{relation.remote_field.name: None})
+        if on_delete_name == "SET_NULL":
+            relations.append(CascadeRelation(relation.related_model, relation.remote_field.name, True))
+        elif hasattr(relation.related_model, "deleted_at"):
+            relations.append(CascadeRelation(relation.related_model, relation.remote_field.name, False))
+    return tuple(relations)
 
-        else:
-            # Handle CASCADE and other delete behaviors
-            try:
-                if relation.one_to_one:
-                    # Handle OneToOne relationships
-                    related_obj = getattr(instance, related_name, None)
-                    if related_obj:
-                        if hasattr(related_obj, "deleted_at"):
-                            if not related_obj.deleted_at:
-                                related_obj.deleted_at = timezone.now()
-                                related_obj.save()
-                                # Recursively handle related objects
-                                soft_delete_related_objects(
-                                    related_obj._meta.app_label,
-                                    related_obj._meta.model_name,
-                                    related_obj.pk,
-                                    using,
-                                )
-                else:
-                    # Handle other relationships
-                    related_queryset = getattr(instance, related_name)(manager="objects").all()
-
-                    for related_obj in related_queryset:
-                        if hasattr(related_obj, "deleted_at"):
-                            if not related_obj.deleted_at:
-                                related_obj.deleted_at = timezone.now()
-                                related_obj.save()
-                                # Recursively handle related objects
-                                soft_delete_related_objects(
-                                    related_obj._meta.app_label,
-                                    related_obj._meta.model_name,
-                                    related_obj.pk,
-                                    using,
-                                )
-            except Exception as e:
-                # Log the error or handle as needed
-                print(f"Error handling relation {related_name}: {str(e)}")
-                continue
 
-    # Finally, soft delete the instance itself if it hasn't been deleted yet
-    if hasattr(instance, "deleted_at") and not instance.deleted_at:
-        instance.deleted_at = timezone.now()
-        instance.save()
+# A cascade step applies a relation to the rows referencing the parent rows and
+# returns the number of rows changed along with the rows to descend into, if any
+CascadeStep = Callable[[CascadeRelation, QuerySet], Tuple[int, Optional[QuerySet]]]
+
+
+def walk_cascade(model: Type[models.Model], rows: QuerySet, step: CascadeStep, action: str) -> Dict[str, int]:
+    """
+    Apply a cascade level by level starting from the given rows.
+
+    Every level is a list of `(model, rows)` pairs whose rows are expressed as a
+    queryset, so each relation is handled with one `UPDATE ... WHERE fk IN
+    (subquery)` whatever the number of rows involved. Returns the number of
+    rows changed per model.
+    """
+    totals: Dict[str, int] = defaultdict(int)
+    level: List[Tuple[Type[models.Model], QuerySet]] = [(model, rows)]
+    depth = 0
+    while level:
+        depth += 1
+        next_level = []
+        level_count = 0
+        for parent_model, parent_rows in level:
+            for relation in get_cascade_relations(parent_model):
+                related_rows = relation.related_model._base_manager.using(parent_rows.db).filter(
+                    **{f"{relation.field_name}__in": parent_rows.values("pk")}
+                )
+                count, descend_rows = step(relation, related_rows)
+                if count:
+                    totals[relation.related_model._meta.label] += count
+                    level_count += count
+                if descend_rows is not None:
+                    next_level.append((relation.related_model, descend_rows))
+
+        if level_count:
+            logger.info(f"{action} cascade of {model._meta.label}: {level_count} rows at level {depth}")
+        level = next_level
+    return dict(totals)
+
+
+def get_counted_issue_ids(model: Type[models.Model], rows: QuerySet) -> set:
+    """
+    The work items whose stored link, attachment or sub work item counts
+    include the given rows. The cascade updates bypass `save()` and the
+    signals that keep those counts current.
+    """
+    from plane.db.models import FileAsset, Issue, IssueLink
+
+    model = model._meta.concrete_model
+    if model is Issue:
+        return set(rows.filter(parent_id__isnull=False).values_list("parent_id", flat=True))
+    if model is IssueLink:
+        return set(rows.values_list("issue_id", flat=True))
+    if model is FileAsset:
+        return set(
+            rows.filter(entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT, issue_id__isnull=False).values_list(
+                "issue_id", flat=True
+            )
+        )
+    return set()
+
 
+def refresh_issue_counters(issue_ids) -> None:
+    from plane.db.models import Issue
 
-# @shared_task
-def restore_related_objects(app_label, model_name, instance_pk, using=None):
-    pass
+    issue_ids = list(issue_ids)
+    for start in range(0, len(issue_ids), COUNTER_REFRESH_BATCH_SIZE):
+        Issue.refresh_counters(issue_ids[start : start + COUNTER_REFRESH_BATCH_SIZE])
 
 
 @shared_task
-def hard_delete():
-    from plane.db.models import (
-        Workspace,
-        Project,
-        Cycle,
-        Module,
-        Issue,
-        Page,
-        IssueView,
-        Label,
-        State,
-        IssueActivity,
-        IssueComment,
-        IssueLink,
-        IssueReaction,
-        UserFavorite,
-        ModuleIssue,
-        CycleIssue,
-        Estimate,
-        EstimatePoint,
+def soft_delete_related_objects(app_label, model_name, instance_pk, using=None):
+    """
+    Soft delete related objects for a given model instance
+    """
+    # Get the model class using app registry
+    model_class = apps.get_model(app_label, model_name)
+
+    # Get the instance using all_objects to ensure we can get even if it's already soft deleted
+    try:
+        instance = model_class.all_objects.using(using).get(pk=instance_pk)
+    except model_class.DoesNotExist:
+        return
+
+    # The whole cascade shares the deletion time of the instance so it can be restored as a unit
+    deleted_at = instance.deleted_at or timezone.now()
+    counted_issue_ids = set()
+
+    def soft_delete(relation: CascadeRelation, related_rows: QuerySet) -> Tuple[int, Optional[QuerySet]]:
+        if relation.set_null:
+            related_rows.update(**{relation.field_name: None})
+            return 0, None
+
+        # Rows deleted earlier keep their own deletion time and are not descended into again
+        count = related_rows.filter(deleted_at__isnull=True).update(deleted_at=deleted_at)
+        if not count:
+            return 0, None
+        deleted_rows = related_rows.filter(deleted_at=deleted_at)
+        counted_issue_ids.update(get_counted_issue_ids(relation.related_model, deleted_rows))
+        return count, deleted_rows
+
+    deleted_counts = walk_cascade(
+        model_class, model_class.all_objects.using(using).filter(pk=instance_pk), soft_delete, "Soft delete"
     )
 
-    days = settings.HARD_DELETE_AFTER_DAYS
-    # check delete workspace
-    _ = Workspace.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+    # Finally, soft delete the instance itself if it hasn't been deleted yet
+    if not instance.deleted_at:
+        instance.deleted_at = deleted_at
+        instance.save(update_fields=["deleted_at"])
 
-    # check delete project
-    _ = Project.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+    refresh_issue_counters(counted_issue_ids)
 
-    # check delete cycle
-    _ = Cycle.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+    logger.info(
+        f"Soft deleted {model_class._meta.label} {instance_pk} with "
+        f"{sum(deleted_counts.values())} related rows: {deleted_counts}"
+    )
+    return deleted_counts
 
-    # check delete module
-    _ = Module.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
 
-    # check delete issue
-    _ = Issue.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+@shared_task
+def restore_related_objects(app_label, model_name, instance_pk, deleted_at=None, using=None):
+    """
+    Restore a soft deleted instance and the related objects deleted along with it.
 
-    # check delete page
-    _ = Page.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+    Only the rows that share the deletion time of the instance are restored, so
+    rows deleted on their own before the instance stay deleted. Relations that
+    were nulled by the deletion cannot be restored.
+    """
+    model_class = apps.get_model(app_label, model_name)
 
-    # check delete view
-    _ = IssueView.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+    try:
+        instance = model_class.all_objects.using(using).get(pk=instance_pk)
+    except model_class.DoesNotExist:
+        return
 
-    # check delete label
-    _ = Label.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+    deleted_at = deleted_at or instance.deleted_at
+    if deleted_at is None:
+        return
+    counted_issue_ids = set()
+
+    def restore(relation: CascadeRelation, related_rows: QuerySet) -> Tuple[int, Optional[QuerySet]]:
+        if relation.set_null:
+            return 0, None
+
+        try:
+            # Keep a conflicting relation from aborting the rest of the restore
+            with transaction.atomic(using=related_rows.db):
+                count = related_rows.filter(deleted_at=deleted_at).update(deleted_at=None)
+        except IntegrityError as e:
+            log_exception(e)
+            return 0, None
+
+        if not count:
+            return 0, None
+        restored_rows = related_rows.filter(deleted_at__isnull=True)
+        counted_issue_ids.update(get_counted_issue_ids(relation.related_model, restored_rows))
+        return count, restored_rows
+
+    instance_rows = model_class.all_objects.using(using).filter(pk=instance_pk)
+    if instance_rows.filter(deleted_at=deleted_at).update(deleted_at=None):
+        counted_issue_ids.update(get_counted_issue_ids(model_class, instance_rows))
+
+    restored_counts = walk_cascade(model_class, instance_rows, restore, "Restore")
+    refresh_issue_counters(counted_issue_ids)
+
+    logger.info(
+        f"Restored {model_class._meta.label} {instance_pk} with "
+        f"{sum(restored_counts.values())} related rows: {restored_counts}"
+    )
+    return restored_counts
 
-    # check delete state
-    _ = State.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
 
-    _ = IssueActivity.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+def get_purge_order() -> List[Type[models.Model]]:
+    """
+    The soft deletable models ordered so that every model comes before the
+    models it cascades from, so parents are purged once their children are gone
+    and each chunked delete only has a small cascade left to collect.
+    """
+    order: List[Type[models.Model]] = []
+    visited = set()
 
-    _ = IssueComment.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+    def visit(model: Type[models.Model]) -> None:
+        if model in visited:
+            return
+        visited.add(model)
+        for relation in get_cascade_relations(model):
+            if not relation.set_null:
+                visit(relation.related_model)
+        order.append(model)
 
-    _ = IssueLink.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+    for model in apps.get_models():
+        if hasattr(model, "deleted_at") and model._meta.managed and not model._meta.proxy:
+            visit(model)
+    return order
 
-    _ = IssueReaction.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
 
-    _ = UserFavorite.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+def purge_model(model: Type[models.Model], cutoff, batch_size: int, deadline: float) -> Tuple[int, bool]:
+    """
+    Hard delete the rows of a model soft deleted before the cutoff in batches of ids.
 
-    _ = ModuleIssue.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+    Batches whose rows have no cascades or signals to handle are removed with a
+    single raw delete, the others go through the collector of the batch only.
+    Returns the number of rows deleted and whether the model was fully purged
+    before the deadline.
+    """
+    expired_ids = model._base_manager.filter(deleted_at__lt=cutoff).values_list("pk", flat=True)
+    deleted = 0
+    while time.monotonic() < deadline:
+        batch_ids = list(expired_ids[:batch_size])
+        if not batch_ids:
+            return deleted, True
+
+        batch = model._base_manager.filter(pk__in=batch_ids)
+        if Collector(using=batch.db).can_fast_delete(batch):
+            deleted += batch._raw_delete(batch.db)
+        else:
+            _, deleted_per_model = batch.delete()
+            deleted += deleted_per_model.get(model._meta.label, 0)
+
+        if len(batch_ids) < batch_size:
+            return deleted, True
+    return deleted, False
 
-    _ = CycleIssue.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
 
-    _ = Estimate.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+@shared_task
+def hard_delete():
+    """
+    Purge the rows soft deleted more than `HARD_DELETE_AFTER_DAYS` ago.
+
+    The purge stops once `HARD_DELETE_TIME_BUDGET` is spent and the next run
+    resumes from the model it stopped at. Returns the rows deleted and the
+    seconds spent per model.
+    """
+    redis_client = redis_instance()
+    if not redis_client.set(HARD_DELETE_LOCK_KEY, "true", nx=True, ex=settings.HARD_DELETE_TIME_BUDGET + 300):
+        logger.info("Hard delete is already running")
+        return
 
-    _ = EstimatePoint.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+    try:
+        cutoff = timezone.now() - timezone.timedelta(days=settings.HARD_DELETE_AFTER_DAYS)
+        deadline = time.monotonic() + settings.HARD_DELETE_TIME_BUDGET
+
+        # Start from the model the previous run stopped at, wrapping around to the others
+        purge_order = get_purge_order()
+        cursor = redis_client.get(HARD_DELETE_CURSOR_KEY)
+        labels = [model._meta.label for model in purge_order]
+        if cursor and cursor.decode() in labels:
+            start = labels.index(cursor.decode())
+            purge_order = purge_order[start:] + purge_order[:start]
+
+        metrics = {}
+        for model in purge_order:
+            if time.monotonic() >= deadline:
+                redis_client.set(HARD_DELETE_CURSOR_KEY, model._meta.label)
+                logger.info(f"Hard delete ran out of time, resuming from {model._meta.label} on the next run")
+                break
+
+            started_at = time.monotonic()
+            try:
+                deleted, completed = purge_model(model, cutoff, settings.HARD_DELETE_BATCH_SIZE, deadline)
+            except Exception as e:
+                log_exception(e)
+                continue
 
-    # at last, check for every thing which ever is left and delete it
-    # Get all Django models
-    all_models = apps.get_models()
+            duration = round(time.monotonic() - started_at, 3)
+            if deleted:
+                metrics[model._meta.label] = {"deleted": deleted, "duration": duration}
+                logger.info(f"Hard deleted {deleted} rows of {model._meta.label} in {duration}s")
 
-    # Iterate through all models
-    for model in all_models:
-        # Check if the model has a 'deleted_at' field
-        if hasattr(model, "deleted_at"):
-            # Get all instances where 'deleted_at' is greater than 30 days ago
-            _ = model.all_objects.filter(deleted_at__lt=timezone.now() - timezone.timedelta(days=days)).delete()
+            if not completed:
+                redis_client.set(HARD_DELETE_CURSOR_KEY, model._meta.label)
+                logger.info(f"Hard delete ran out of time, resuming from {model._meta.label} on the next run")
+                break
+        else:
+            redis_client.delete(HARD_DELETE_CURSOR_KEY)
 
-    return
+        return metrics
+    finally:
+        redis_client.delete(HARD_DELETE_LOCK_KEY)
@@ -3,9 +3,6 @@ import uuid
 import random
 from datetime import datetime, timedelta
 
-# Django imports
-from django.db.models import Max
-
 # Third party imports
 from celery import shared_task
 from faker import Faker
@@ -22,7 +19,6 @@ from plane.db.models import (
     Cycle,
     Module,
     Issue,
-    IssueSequence,
     IssueAssignee,
     IssueLabel,
     IssueActivity,
@@ -273,18 +269,6 @@ def create_issues(workspace, project, user_id, issue_count):
 
     issues = []
 
-    # Get the maximum sequence_id
-    last_id = IssueSequence.objects.filter(project=project).aggregate(largest=Max("sequence"))["largest"]
-
-    last_id = 1 if last_id is None else last_id + 1
-
-    # Get the maximum sort order
-    largest_sort_order = Issue.objects.filter(
-        project=project, state_id=states[random.randint(0, len(states) - 1)]
-    ).aggregate(largest=Max("sort_order"))["largest"]
-
-    largest_sort_order = 65535 if largest_sort_order is None else largest_sort_order + 10000
-
     for _ in range(0, issue_count):
         start_date = [None, fake.date_this_year()][random.randint(0, 1)]
         end_date = (
@@ -305,8 +289,6 @@ def create_issues(workspace, project, user_id, issue_count):
                 name=text[:254],
                 description_html=f"<p>{text}</p>",
                 description_stripped=text,
-                sequence_id=last_id,
-                sort_order=largest_sort_order,
                 start_date=start_date,
                 target_date=end_date,
                 priority=["urgent", "high", "medium", "low", "none"][random.randint(0, 4)],
@@ -314,23 +296,8 @@ def create_issues(workspace, project, user_id, issue_count):
             )
         )
 
-        largest_sort_order = largest_sort_order + random.randint(0, 1000)
-        last_id = last_id + 1
-
-    issues = Issue.objects.bulk_create(issues, ignore_conflicts=True, batch_size=1000)
-    # Sequences
-    _ = IssueSequence.objects.bulk_create(
-        [
-            IssueSequence(
-                issue=issue,
-                sequence=issue.sequence_id,
-                project=project,
-                workspace=workspace,
-            )
-            for issue in issues
-        ],
-        batch_size=100,
-    )
+    # Reserves the sequence ids and creates the issue sequences
+    issues = Issue.bulk_create_with_sequences(issues, batch_size=1000)
 
     # Track the issue activities
     IssueActivity.objects.bulk_create(
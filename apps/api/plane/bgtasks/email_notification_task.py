@@ -1,11 +1,14 @@
 import logging
 import re
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 
 from bs4 import BeautifulSoup
 
 # Third party imports
 from celery import shared_task
+from django.conf import settings
 from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 
@@ -18,6 +21,7 @@ from plane.db.models import EmailNotificationLog, Issue, User
 from plane.license.utils.instance_value import get_email_configuration
 from plane.settings.redis import redis_instance
 from plane.utils.exception_logger import log_exception
+from plane.utils.issue_filters import filter_valid_uuids
 
 
 def remove_unwanted_characters(input_text):
@@ -40,41 +44,44 @@ def release_lock(lock_id):
 
 
 @shared_task
-def stack_email_notification():
-    # get all email notifications
-    email_notifications = EmailNotificationLog.objects.filter(processed_at__isnull=True).order_by("receiver").values()
+def stack_email_notification(batch_size=None):
+    """
+    Group the unprocessed email notifications by receiver and queue one send
+    task per receiver.
+
+    The logs are streamed ordered by receiver, so a single pass groups them
+    without holding the whole backlog in memory. They are marked processed
+    every `batch_size` rows, at receiver boundaries.
+    """
+    batch_size = batch_size or settings.EMAIL_DIGEST_BATCH_SIZE
+    email_notifications = (
+        EmailNotificationLog.objects.filter(processed_at__isnull=True)
+        .order_by("receiver_id", "created_at")
+        .values("id", "receiver_id", "entity_identifier", "triggered_by_id", "data")
+        .iterator(chunk_size=batch_size)
+    )
 
-    # Create the below format for each of the issues
-    # {"issue_id" : { "actor_id1": [ { data }, { data } ], "actor_id2": [ { data }, { data } ] }}
-
-    # Convert to unique receivers list
-    receivers = list(set([str(notification.get("receiver_id")) for notification in email_notifications]))
     processed_notifications = []
-    # Loop through all the issues to create the emails
-    for receiver_id in receivers:
-        # Notification triggered for the receiver
-        receiver_notifications = [
-            notification for notification in email_notifications if str(notification.get("receiver_id")) == receiver_id
-        ]
-        # create payload for all issues
+    for receiver_id, receiver_notifications in groupby(email_notifications, key=itemgetter("receiver_id")):
+        # Create the below format for each of the issues
+        # {"issue_id": {"notification_data": {"actor_id": [data, ...]}, "email_notification_ids": [...]}}
         payload = {}
-        email_notification_ids = []
         for receiver_notification in receiver_notifications:
-            payload.setdefault(receiver_notification.get("entity_identifier"), {}).setdefault(
-                str(receiver_notification.get("triggered_by_id")), []
-            ).append(receiver_notification.get("data"))
-            # append processed notifications
-            processed_notifications.append(receiver_notification.get("id"))
-            email_notification_ids.append(receiver_notification.get("id"))
-
-        # Create emails for all the issues
-        for issue_id, notification_data in payload.items():
-            send_email_notification.delay(
-                issue_id=issue_id,
-                notification_data=notification_data,
-                receiver_id=receiver_id,
-                email_notification_ids=email_notification_ids,
+            issue_payload = payload.setdefault(
+                str(receiver_notification.get("entity_identifier")),
+                {"notification_data": {}, "email_notification_ids": []},
             )
+            issue_payload["notification_data"].setdefault(str(receiver_notification.get("triggered_by_id")), []).append(
+                receiver_notification.get("data")
+            )
+            issue_payload["email_notification_ids"].append(str(receiver_notification.get("id")))
+            processed_notifications.append(receiver_notification.get("id"))
+
+        send_receiver_email_notifications.delay(receiver_id=str(receiver_id), payload=payload)
+
+        if len(processed_notifications) >= batch_size:
+            EmailNotificationLog.objects.filter(pk__in=processed_notifications).update(processed_at=timezone.now())
+            processed_notifications = []
 
     # Update the email notification log
     EmailNotificationLog.objects.filter(pk__in=processed_notifications).update(processed_at=timezone.now())
@@ -123,67 +130,159 @@ def create_payload(notification_data):
     return data
 
 
-def process_mention(mention_component):
+def process_mention(mention_component, users):
     soup = BeautifulSoup(mention_component, "html.parser")
     mentions = soup.find_all("mention-component")
+
+    # Load the mentioned users missing from the users cache in one query
+    missing_user_ids = {mention["entity_identifier"] for mention in mentions} - set(users)
+    if missing_user_ids:
+        users.update({str(user.id): user for user in User.objects.filter(pk__in=missing_user_ids)})
+
     for mention in mentions:
         user_id = mention["entity_identifier"]
-        user = User.objects.get(pk=user_id)
+        user = users.get(user_id)
+        if user is None:
+            raise User.DoesNotExist
         user_name = user.display_name
         highlighted_name = f"@{user_name}"
         mention.replace_with(highlighted_name)
     return str(soup)
 
 
-def process_html_content(content):
+def process_html_content(content, users):
     if content is None:
         return None
     processed_content_list = []
     for html_content in content:
-        processed_content = process_mention(html_content)
+        processed_content = process_mention(html_content, users)
         processed_content_list.append(processed_content)
     return processed_content_list
 
 
+@shared_task
+def send_receiver_email_notifications(receiver_id, payload):
+    """
+    Send the digest emails of one receiver, one email per issue.
+
+    The receiver, the issues and the actors are loaded in bulk, and the
+    emails share one SMTP connection.
+    """
+    receiver = User.objects.filter(pk=receiver_id).first()
+    if receiver is None:
+        return
+
+    issue_ids = filter_valid_uuids(list(payload))
+    issues = {
+        str(issue.id): issue
+        for issue in Issue.objects.filter(pk__in=issue_ids).select_related("project", "project__workspace")
+    }
+    actor_ids = {actor_id for issue_payload in payload.values() for actor_id in issue_payload["notification_data"]}
+    users = {str(user.id): user for user in User.objects.filter(pk__in=filter_valid_uuids(list(actor_ids)))}
+    users[str(receiver.id)] = receiver
+
+    # The base api of every issue in one round trip
+    issue_keys = list(issues)
+    base_apis = dict(zip(issue_keys, redis_instance().mget(issue_keys))) if issue_keys else {}
+
+    # A failed connection or login leaves the logs unsent for the next run
+    try:
+        connection, email_from = get_email_connection()
+        with connection:
+            for issue_id, issue_payload in payload.items():
+                issue = issues.get(issue_id)
+                base_api = base_apis.get(issue_id)
+                # Skip if the issue is gone or base api is not present
+                if issue is None or not base_api:
+                    continue
+                send_issue_email(
+                    issue=issue,
+                    receiver=receiver,
+                    users=users,
+                    base_api=base_api.decode(),
+                    notification_data=issue_payload["notification_data"],
+                    email_notification_ids=issue_payload["email_notification_ids"],
+                    email_from=email_from,
+                    connection=connection,
+                )
+    except Exception as e:
+        log_exception(e)
+
+
 @shared_task
 def send_email_notification(issue_id, notification_data, receiver_id, email_notification_ids):
+    """Send the digest email of one issue, kept for the tasks queued per issue"""
+    # get the redis instance
+    ri = redis_instance()
+    base_api = ri.get(str(issue_id))
+
+    # Skip if base api is not present
+    if not base_api:
+        return
+
+    try:
+        receiver = User.objects.get(pk=receiver_id)
+        issue = Issue.objects.select_related("project", "project__workspace").get(pk=issue_id)
+    except (Issue.DoesNotExist, User.DoesNotExist):
+        return
+
+    users = {str(user.id): user for user in User.objects.filter(pk__in=filter_valid_uuids(list(notification_data)))}
+    connection, email_from = get_email_connection()
+    send_issue_email(
+        issue=issue,
+        receiver=receiver,
+        users=users,
+        base_api=base_api.decode(),
+        notification_data=notification_data,
+        email_notification_ids=email_notification_ids,
+        email_from=email_from,
+        connection=connection,
+    )
+
+
+def get_email_connection():
+    """Return an SMTP connection built from the instance email configuration, and the sender"""
+    (
+        EMAIL_HOST,
+        EMAIL_HOST_USER,
+        EMAIL_HOST_PASSWORD,
+        EMAIL_PORT,
+        EMAIL_USE_TLS,
+        EMAIL_USE_SSL,
+        EMAIL_FROM,
+    ) = get_email_configuration()
+    connection = get_connection(
+        host=EMAIL_HOST,
+        port=int(EMAIL_PORT),
+        username=EMAIL_HOST_USER,
+        password=EMAIL_HOST_PASSWORD,
+        use_tls=EMAIL_USE_TLS == "1",
+        use_ssl=EMAIL_USE_SSL == "1",
+    )
+    return connection, EMAIL_FROM
+
+
+def send_issue_email(
+    issue, receiver, users, base_api, notification_data, email_notification_ids, email_from, connection
+):
     # Convert UUIDs to a sorted, concatenated string
     sorted_ids = sorted(email_notification_ids)
     ids_str = "_".join(str(id) for id in sorted_ids)
-    lock_id = f"send_email_notif_{issue_id}_{receiver_id}_{ids_str}"
+    lock_id = f"send_email_notif_{issue.id}_{receiver.id}_{ids_str}"
 
     # acquire the lock for sending emails
     try:
         if acquire_lock(lock_id=lock_id):
-            # get the redis instance
-            ri = redis_instance()
-            base_api = ri.get(str(issue_id)).decode() if ri.get(str(issue_id)) else None
-
-            # Skip if base api is not present
-            if not base_api:
-                return
-
             data = create_payload(notification_data=notification_data)
 
-            # Get email configurations
-            (
-                EMAIL_HOST,
-                EMAIL_HOST_USER,
-                EMAIL_HOST_PASSWORD,
-                EMAIL_PORT,
-                EMAIL_USE_TLS,
-                EMAIL_USE_SSL,
-                EMAIL_FROM,
-            ) = get_email_configuration()
-
-            receiver = User.objects.get(pk=receiver_id)
-            issue = Issue.objects.get(pk=issue_id)
             template_data = []
             total_changes = 0
             comments = []
             actors_involved = []
             for actor_id, changes in data.items():
-                actor = User.objects.get(pk=actor_id)
+                actor = users.get(actor_id)
+                if actor is None:
+                    raise User.DoesNotExist
                 total_changes = total_changes + len(changes)
                 comment = changes.pop("comment", False)
                 mention = changes.pop("mention", False)
@@ -200,8 +299,8 @@ def send_email_notification(issue_id, notification_data, receiver_id, email_noti
                         }
                     )
                 if mention:
-                    mention["new_value"] = process_html_content(mention.get("new_value"))
-                    mention["old_value"] = process_html_content(mention.get("old_value"))
+                    mention["new_value"] = process_html_content(mention.get("new_value"), users)
+                    mention["old_value"] = process_html_content(mention.get("old_value"), users)
                     comments.append(
                         {
                             "actor_comments": mention,
@@ -259,19 +358,10 @@ def send_email_notification(issue_id, notification_data, receiver_id, email_noti
             text_content = strip_tags(html_content)
 
             try:
-                connection = get_connection(
-                    host=EMAIL_HOST,
-                    port=int(EMAIL_PORT),
-                    username=EMAIL_HOST_USER,
-                    password=EMAIL_HOST_PASSWORD,
-                    use_tls=EMAIL_USE_TLS == "1",
-                    use_ssl=EMAIL_USE_SSL == "1",
-                )
-
                 msg = EmailMultiAlternatives(
                     subject=subject,
                     body=text_content,
-                    from_email=EMAIL_FROM,
+                    from_email=email_from,
                     to=[receiver.email],
                     connection=connection,
                 )
@@ -1,9 +1,8 @@
 # Python imports
-import io
+import tempfile
 import zipfile
-from typing import List
-import boto3
-from botocore.client import Config
+from typing import IO, List
+from boto3.s3.transfer import TransferConfig
 from uuid import UUID
 
 # Third party imports
@@ -12,29 +11,39 @@ from celery import shared_task
 # Django imports
 from django.conf import settings
 from django.utils import timezone
-from django.db.models import Prefetch
+from django.db.models import Prefetch, QuerySet
 
 # Module imports
 from plane.db.models import ExporterHistory, Issue, IssueRelation
+from plane.settings.storage import get_s3_client
 from plane.utils.exception_logger import log_exception
 from plane.utils.exporters import Exporter, IssueExportSchema
 
+# Exports larger than this are spooled to disk instead of memory
+EXPORT_SPOOL_MAX_SIZE = 16 * 1024 * 1024
 
-def create_zip_file(files: List[tuple[str, str | bytes]]) -> io.BytesIO:
+# Upload exports in parts so only a few parts are held in memory at once
+EXPORT_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+)
+
+
+def create_zip_file(zip_file: IO[bytes], exporter: Exporter, exports: List[tuple[str, QuerySet]]) -> None:
     """
-    Create a ZIP file from the provided files.
+    Stream the exports into a ZIP file, one entry per export.
     """
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for filename, file_content in files:
-            zipf.writestr(filename, file_content)
+    with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zipf:
+        for filename, queryset in exports:
+            with zipf.open(exporter.get_filename(filename), "w", force_zip64=True) as entry:
+                exporter.write(entry, queryset)
 
-    zip_buffer.seek(0)
-    return zip_buffer
+    zip_file.seek(0)
 
 
 # TODO: Change the upload_to_s3 function to use the new storage method with entry in file asset table
-def upload_to_s3(zip_file: io.BytesIO, workspace_id: UUID, token_id: str, slug: str) -> None:
+def upload_to_s3(zip_file: IO[bytes], workspace_id: UUID, token_id: str, slug: str) -> None:
     """
     Upload a ZIP file to S3 and generate a presigned URL.
     """
@@ -42,29 +51,28 @@ def upload_to_s3(zip_file: io.BytesIO, workspace_id: UUID, token_id: str, slug:
     expires_in = 7 * 24 * 60 * 60
 
     if settings.USE_MINIO:
-        upload_s3 = boto3.client(
-            "s3",
-            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+        upload_s3 = get_s3_client(
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=Config(signature_version="s3v4"),
+            region_name=None,
+            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
         )
         upload_s3.upload_fileobj(
             zip_file,
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
             ExtraArgs={"ACL": "public-read", "ContentType": "application/zip"},
+            Config=EXPORT_TRANSFER_CONFIG,
         )
 
         # Generate presigned url for the uploaded file with different base
-        presign_s3 = boto3.client(
-            "s3",
+        presign_s3 = get_s3_client(
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=None,
             endpoint_url=(
                 f"{settings.AWS_S3_URL_PROTOCOL}//{str(settings.AWS_S3_CUSTOM_DOMAIN).replace('/uploads', '')}/"
             ),
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=Config(signature_version="s3v4"),
         )
 
         presigned_url = presign_s3.generate_presigned_url(
@@ -75,20 +83,18 @@ def upload_to_s3(zip_file: io.BytesIO, workspace_id: UUID, token_id: str, slug:
     else:
         # If endpoint url is present, use it
         if settings.AWS_S3_ENDPOINT_URL:
-            s3 = boto3.client(
-                "s3",
-                endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+            s3 = get_s3_client(
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
+                region_name=None,
+                endpoint_url=settings.AWS_S3_ENDPOINT_URL,
             )
         else:
-            s3 = boto3.client(
-                "s3",
-                region_name=settings.AWS_REGION,
+            s3 = get_s3_client(
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
+                region_name=settings.AWS_REGION,
+                endpoint_url=None,
             )
 
         # Upload the file to S3
@@ -97,6 +103,7 @@ def upload_to_s3(zip_file: io.BytesIO, workspace_id: UUID, token_id: str, slug:
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
             ExtraArgs={"ContentType": "application/zip"},
+            Config=EXPORT_TRANSFER_CONFIG,
         )
 
         # Generate presigned url for the uploaded file
@@ -193,22 +200,19 @@ def issue_export_task(
             exporter_instance.save(update_fields=["status", "reason"])
             return
 
-        files = []
         if multiple:
             # Export each project separately with its own queryset
-            for project_id in project_ids:
-                project_issues = workspace_issues.filter(project_id=project_id)
-                export_filename = f"{slug}-{project_id}"
-                filename, content = exporter.export(export_filename, project_issues)
-                files.append((filename, content))
+            exports = [
+                (f"{slug}-{project_id}", workspace_issues.filter(project_id=project_id)) for project_id in project_ids
+            ]
         else:
             # Export all issues in a single file
-            export_filename = f"{slug}-{workspace_id}"
-            filename, content = exporter.export(export_filename, workspace_issues)
-            files.append((filename, content))
+            exports = [(f"{slug}-{workspace_id}", workspace_issues)]
 
-        zip_buffer = create_zip_file(files)
-        upload_to_s3(zip_buffer, workspace_id, token_id, slug)
+        # Stream the issues into a spooled archive so memory stays bounded for large workspaces
+        with tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE) as zip_file:
+            create_zip_file(zip_file, exporter, exports)
+            upload_to_s3(zip_file, workspace_id, token_id, slug)
 
     except Exception as e:
         exporter_instance = ExporterHistory.objects.get(token=token_id)
@@ -6,13 +6,15 @@ import json
 from celery import shared_task
 
 # Django imports
+from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
 
 
 # Module imports
 from plane.app.serializers import IssueActivitySerializer
-from plane.bgtasks.notification_task import notifications
+from plane.bgtasks.analytics_rollup_task import refresh_issue_rollups
+from plane.bgtasks.notification_task import notifications, notifications_batch
 from plane.db.models import (
     CommentReaction,
     Cycle,
@@ -42,6 +44,55 @@ def extract_ids(data: dict | None, primary_key: str, fallback_key: str) -> set[s
     return {str(x) for x in data.get(fallback_key, [])}
 
 
+class ActivityLookups:
+    """
+    Labels, users, states, estimate points and parent issues referenced by an
+    issue activity payload, loaded up front with one query per model
+    """
+
+    def __init__(self, requested_data, current_instance, project_id, fields=None):
+        # Only the fields being changed need their references resolved
+        fields = set(fields if fields is not None else (requested_data or {}))
+        payloads = [data for data in (requested_data, current_instance) if data]
+
+        label_ids = set()
+        user_ids = set()
+        state_ids = set()
+        estimate_point_ids = set()
+        issue_ids = set()
+        for data in payloads:
+            if fields & {"label_ids", "labels"}:
+                label_ids |= extract_ids(data, "label_ids", "labels")
+            if fields & {"assignee_ids", "assignees"}:
+                user_ids |= extract_ids(data, "assignee_ids", "assignees")
+            if fields & {"state_id", "state"}:
+                state_ids.add(data.get("state_id") or data.get("state"))
+            if "estimate_point" in fields:
+                estimate_point_ids.add(data.get("estimate_point"))
+            if fields & {"parent_id", "parent"}:
+                issue_ids.add(data.get("parent_id") or data.get("parent"))
+        if requested_data and "closed_to" in fields:
+            state_ids.add(requested_data.get("closed_to"))
+
+        self.labels = self.load(Label.objects.all(), label_ids)
+        self.users = self.load(User.objects.all(), user_ids)
+        self.states = self.load(State.objects.filter(project_id=project_id), state_ids)
+        self.estimate_points = self.load(EstimatePoint.objects.select_related("estimate"), estimate_point_ids)
+        self.issues = self.load(Issue.objects.select_related("project"), issue_ids)
+
+    @staticmethod
+    def load(queryset, ids):
+        # Skip the query altogether when nothing of the model is referenced
+        ids = {str(pk) for pk in ids if pk is not None and is_valid_uuid(str(pk))}
+        if not ids:
+            return {}
+        return {str(instance.id): instance for instance in queryset.filter(pk__in=ids)}
+
+    @staticmethod
+    def get(instances, pk):
+        return instances.get(str(pk)) if pk is not None else None
+
+
 # Track Changes in name
 def track_name(
     requested_data,
@@ -52,6 +103,7 @@ def track_name(
     actor_id,
     issue_activities,
     epoch,
+    lookups=None,
 ):
     if current_instance.get("name") != requested_data.get("name"):
         issue_activities.append(
@@ -80,6 +132,7 @@ def track_description(
     actor_id,
     issue_activities,
     epoch,
+    lookups=None,
 ):
     if current_instance.get("description_html") != requested_data.get("description_html"):
         last_activity = IssueActivity.objects.filter(issue_id=issue_id).order_by("-created_at").first()
@@ -117,6 +170,7 @@ def track_parent(
     actor_id,
     issue_activities,
     epoch,
+    lookups=None,
 ):
     current_parent_id = current_instance.get("parent_id") or current_instance.get("parent")
     requested_parent_id = requested_data.get("parent_id") or requested_data.get("parent")
@@ -128,8 +182,9 @@ def track_parent(
         return
 
     if current_parent_id != requested_parent_id:
-        old_parent = Issue.objects.filter(pk=current_parent_id).first() if current_parent_id is not None else None
-        new_parent = Issue.objects.filter(pk=requested_parent_id).first() if requested_parent_id is not None else None
+        lookups = lookups or ActivityLookups(requested_data, current_instance, project_id)
+        old_parent = lookups.get(lookups.issues, current_parent_id)
+        new_parent = lookups.get(lookups.issues, requested_parent_id)
 
         issue_activities.append(
             IssueActivity(
@@ -163,6 +218,7 @@ def track_priority(
     actor_id,
     issue_activities,
     epoch,
+    lookups=None,
 ):
     if current_instance.get("priority") != requested_data.get("priority"):
         issue_activities.append(
@@ -191,6 +247,7 @@ def track_state(
     actor_id,
     issue_activities,
     epoch,
+    lookups=None,
 ):
     current_state_id = current_instance.get("state_id") or current_instance.get("state")
     requested_state_id = requested_data.get("state_id") or requested_data.get("state")
@@ -201,8 +258,9 @@ def track_state(
         requested_state_id = None
 
     if current_state_id != requested_state_id:
-        new_state = State.objects.filter(pk=requested_state_id, project_id=project_id).first()
-        old_state = State.objects.filter(pk=current_state_id, project_id=project_id).first()
+        lookups = lookups or ActivityLookups(requested_data, current_instance, project_id)
+        new_state = lookups.get(lookups.states, requested_state_id)
+        old_state = lookups.get(lookups.states, current_state_id)
 
         issue_activities.append(
             IssueActivity(
@@ -232,6 +290,7 @@ def track_target_date(
     actor_id,
     issue_activities,
     epoch,
+    lookups=None,
 ):
     if current_instance.get("target_date") != requested_data.get("target_date"):
         issue_activities.append(
@@ -262,6 +321,7 @@ def track_start_date(
     actor_id,
     issue_activities,
     epoch,
+    lookups=None,
 ):
     if current_instance.get("start_date") != requested_data.get("start_date"):
         issue_activities.append(
@@ -292,6 +352,7 @@ def track_labels(
     actor_id,
     issue_activities,
     epoch,
+    lookups=None,
 ):
     # Labels
     requested_labels = extract_ids(requested_data, "label_ids", "labels")
@@ -299,6 +360,7 @@ def track_labels(
 
     added_labels = requested_labels - current_labels
     dropped_labels = current_labels - requested_labels
+    lookups = lookups or ActivityLookups(requested_data, current_instance, project_id)
 
     # Set of newly added labels
     for added_label in added_labels:
@@ -306,7 +368,9 @@ def track_labels(
         if not is_valid_uuid(added_label):
             continue
 
-        label = Label.objects.get(pk=added_label)
+        label = lookups.get(lookups.labels, added_label)
+        if label is None:
+            continue
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -330,7 +394,9 @@ def track_labels(
         if not is_valid_uuid(dropped_label):
             continue
 
-        label = Label.objects.get(pk=dropped_label)
+        label = lookups.get(lookups.labels, dropped_label)
+        if label is None:
+            continue
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -359,6 +425,7 @@ def track_assignees(
     actor_id,
     issue_activities,
     epoch,
+    lookups=None,
 ):
     # Assignees
     requested_assignees = extract_ids(requested_data, "assignee_ids", "assignees")
@@ -366,6 +433,7 @@ def track_assignees(
 
     added_assignees = requested_assignees - current_assignees
     dropped_assginees = current_assignees - requested_assignees
+    lookups = lookups or ActivityLookups(requested_data, current_instance, project_id)
 
     bulk_subscribers = []
     for added_asignee in added_assignees:
@@ -373,7 +441,9 @@ def track_assignees(
         if not is_valid_uuid(added_asignee):
             continue
 
-        assignee = User.objects.get(pk=added_asignee)
+        assignee = lookups.get(lookups.users, added_asignee)
+        if assignee is None:
+            continue
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -408,7 +478,9 @@ def track_assignees(
         if not is_valid_uuid(dropped_assignee):
             continue
 
-        assignee = User.objects.get(pk=dropped_assignee)
+        assignee = lookups.get(lookups.users, dropped_assignee)
+        if assignee is None:
+            continue
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -435,18 +507,12 @@ def track_estimate_points(
     actor_id,
     issue_activities,
     epoch,
+    lookups=None,
 ):
     if current_instance.get("estimate_point") != requested_data.get("estimate_point"):
-        old_estimate = (
-            EstimatePoint.objects.filter(pk=current_instance.get("estimate_point")).first()
-            if current_instance.get("estimate_point") is not None
-            else None
-        )
-        new_estimate = (
-            EstimatePoint.objects.filter(pk=requested_data.get("estimate_point")).first()
-            if requested_data.get("estimate_point") is not None
-            else None
-        )
+        lookups = lookups or ActivityLookups(requested_data, current_instance, project_id)
+        old_estimate = lookups.get(lookups.estimate_points, current_instance.get("estimate_point"))
+        new_estimate = lookups.get(lookups.estimate_points, requested_data.get("estimate_point"))
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -480,6 +546,7 @@ def track_archive_at(
     actor_id,
     issue_activities,
     epoch,
+    lookups=None,
 ):
     if current_instance.get("archived_at") != requested_data.get("archived_at"):
         if requested_data.get("archived_at") is None:
@@ -529,9 +596,13 @@ def track_closed_to(
     actor_id,
     issue_activities,
     epoch,
+    lookups=None,
 ):
     if requested_data.get("closed_to") is not None:
-        updated_state = State.objects.get(pk=requested_data.get("closed_to"), project_id=project_id)
+        lookups = lookups or ActivityLookups(requested_data, current_instance, project_id)
+        updated_state = lookups.get(lookups.states, requested_data.get("closed_to"))
+        if updated_state is None:
+            return
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -584,6 +655,7 @@ def create_issue_activity(
             actor_id,
             issue_activities,
             epoch,
+            lookups=ActivityLookups(requested_data, None, project_id, fields=["assignee_ids"]),
         )
 
 
@@ -620,6 +692,9 @@ def update_issue_activity(
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = json.loads(current_instance) if current_instance is not None else None
 
+    # Resolve every referenced label, assignee, state, estimate point and parent at once
+    lookups = ActivityLookups(requested_data, current_instance, project_id)
+
     for key in requested_data:
         func = ISSUE_ACTIVITY_MAPPER.get(key)
         if func is not None:
@@ -632,6 +707,7 @@ def update_issue_activity(
                 actor_id=actor_id,
                 issue_activities=issue_activities,
                 epoch=epoch,
+                lookups=lookups,
             )
 
 
@@ -763,15 +839,28 @@ def create_cycle_issue_activity(
 
     # Updated Records:
     updated_records = current_instance.get("updated_cycle_issues", [])
-    created_records = json.loads(current_instance.get("created_cycle_issues", []))
+    created_records = current_instance.get("created_cycle_issues", [])
+    if isinstance(created_records, str):
+        created_records = json.loads(created_records)
+
+    # Resolve the cycles of all the records at once, a cycle transfer moves
+    # every work item between the same two cycles
+    cycle_ids = {str(record.get(key)) for record in updated_records for key in ("old_cycle_id", "new_cycle_id")}
+    cycles = {
+        str(cycle.id): cycle
+        for cycle in Cycle.objects.filter(pk__in=[cycle_id for cycle_id in cycle_ids if is_valid_uuid(cycle_id)])
+    }
+
+    # Touch the moved work items in one statement
+    updated_issue_ids = [
+        str(record.get("issue_id")) for record in updated_records if is_valid_uuid(str(record.get("issue_id")))
+    ]
+    if updated_issue_ids:
+        Issue.objects.filter(pk__in=updated_issue_ids).update(updated_at=timezone.now())
 
     for updated_record in updated_records:
-        old_cycle = Cycle.objects.filter(pk=updated_record.get("old_cycle_id", None)).first()
-        new_cycle = Cycle.objects.filter(pk=updated_record.get("new_cycle_id", None)).first()
-        issue = Issue.objects.filter(pk=updated_record.get("issue_id")).first()
-        if issue:
-            issue.updated_at = timezone.now()
-            issue.save(update_fields=["updated_at"])
+        old_cycle = cycles.get(str(updated_record.get("old_cycle_id")))
+        new_cycle = cycles.get(str(updated_record.get("new_cycle_id")))
 
         issue_activities.append(
             IssueActivity(
@@ -1495,6 +1584,65 @@ def create_intake_activity(
         )
 
 
+ACTIVITY_MAPPER = {
+    "issue.activity.created": create_issue_activity,
+    "issue.activity.updated": update_issue_activity,
+    "issue.activity.deleted": delete_issue_activity,
+    "comment.activity.created": create_comment_activity,
+    "comment.activity.updated": update_comment_activity,
+    "comment.activity.deleted": delete_comment_activity,
+    "cycle.activity.created": create_cycle_issue_activity,
+    "cycle.activity.deleted": delete_cycle_issue_activity,
+    "module.activity.created": create_module_issue_activity,
+    "module.activity.deleted": delete_module_issue_activity,
+    "link.activity.created": create_link_activity,
+    "link.activity.updated": update_link_activity,
+    "link.activity.deleted": delete_link_activity,
+    "attachment.activity.created": create_attachment_activity,
+    "attachment.activity.deleted": delete_attachment_activity,
+    "issue_relation.activity.created": create_issue_relation_activity,
+    "issue_relation.activity.deleted": delete_issue_relation_activity,
+    "issue_reaction.activity.created": create_issue_reaction_activity,
+    "issue_reaction.activity.deleted": delete_issue_reaction_activity,
+    "comment_reaction.activity.created": create_comment_reaction_activity,
+    "comment_reaction.activity.deleted": delete_comment_reaction_activity,
+    "issue_vote.activity.created": create_issue_vote_activity,
+    "issue_vote.activity.deleted": delete_issue_vote_activity,
+    "issue_draft.activity.created": create_draft_issue_activity,
+    "issue_draft.activity.updated": update_draft_issue_activity,
+    "issue_draft.activity.deleted": delete_draft_issue_activity,
+    "intake.activity.created": create_intake_activity,
+}
+
+
+# Activities that add, remove or publish a work item, refreshing its analytics rollups
+ROLLUP_ACTIVITY_TYPES = {
+    "issue.activity.created",
+    "issue.activity.deleted",
+    "issue_draft.activity.created",
+    "issue_draft.activity.updated",
+    "issue_draft.activity.deleted",
+    "intake.activity.created",
+}
+# Updated fields the analytics rollups are grouped or filtered by
+ROLLUP_FIELDS = {"state_id", "state", "priority", "assignee_ids", "assignees", "archived_at", "is_draft"}
+
+
+def affects_rollups(type, requested_data):
+    """Whether an activity can change the analytics rollups of its work item"""
+    if not settings.USE_ANALYTICS_ROLLUPS:
+        return False
+    if type in ROLLUP_ACTIVITY_TYPES:
+        return True
+    if type != "issue.activity.updated":
+        return False
+    try:
+        requested_data = json.loads(requested_data) if isinstance(requested_data, str) else requested_data
+    except ValueError:
+        return True
+    return isinstance(requested_data, dict) and not ROLLUP_FIELDS.isdisjoint(requested_data)
+
+
 # Receive message from room group
 @shared_task
 def issue_activity(
@@ -1533,36 +1681,6 @@ def issue_activity(
                 except Exception:
                     pass
 
-        ACTIVITY_MAPPER = {
-            "issue.activity.created": create_issue_activity,
-            "issue.activity.updated": update_issue_activity,
-            "issue.activity.deleted": delete_issue_activity,
-            "comment.activity.created": create_comment_activity,
-            "comment.activity.updated": update_comment_activity,
-            "comment.activity.deleted": delete_comment_activity,
-            "cycle.activity.created": create_cycle_issue_activity,
-            "cycle.activity.deleted": delete_cycle_issue_activity,
-            "module.activity.created": create_module_issue_activity,
-            "module.activity.deleted": delete_module_issue_activity,
-            "link.activity.created": create_link_activity,
-            "link.activity.updated": update_link_activity,
-            "link.activity.deleted": delete_link_activity,
-            "attachment.activity.created": create_attachment_activity,
-            "attachment.activity.deleted": delete_attachment_activity,
-            "issue_relation.activity.created": create_issue_relation_activity,
-            "issue_relation.activity.deleted": delete_issue_relation_activity,
-            "issue_reaction.activity.created": create_issue_reaction_activity,
-            "issue_reaction.activity.deleted": delete_issue_reaction_activity,
-            "comment_reaction.activity.created": create_comment_reaction_activity,
-            "comment_reaction.activity.deleted": delete_comment_reaction_activity,
-            "issue_vote.activity.created": create_issue_vote_activity,
-            "issue_vote.activity.deleted": delete_issue_vote_activity,
-            "issue_draft.activity.created": create_draft_issue_activity,
-            "issue_draft.activity.updated": update_draft_issue_activity,
-            "issue_draft.activity.deleted": delete_draft_issue_activity,
-            "intake.activity.created": create_intake_activity,
-        }
-
         func = ACTIVITY_MAPPER.get(type)
         if func is not None:
             func(
@@ -1579,6 +1697,10 @@ def issue_activity(
         # Save all the values to database
         issue_activities_created = IssueActivity.objects.bulk_create(issue_activities)
 
+        # Keep the analytics rollups of the issue's creation day up to date
+        if issue_id is not None and affects_rollups(type, requested_data):
+            refresh_issue_rollups.delay(issue_ids=[str(issue_id)])
+
         if notification:
             notifications.delay(
                 type=type,
@@ -1598,3 +1720,98 @@ def issue_activity(
     except Exception as e:
         log_exception(e)
         return
+
+
+@shared_task
+def issue_activity_batch(records, actor_id, epoch, subscriber=True, notification=False, origin=None):
+    """
+    Track the activities of many issue changes in one worker run. Each record
+    carries the `type`, `requested_data`, `current_instance`, `issue_id` and
+    `project_id` an `issue_activity` call would get.
+    """
+    try:
+        records = [record for record in records if is_valid_uuid(str(record.get("project_id")))]
+        if not records:
+            return
+
+        # Resolve the workspace of every project at once
+        workspace_ids = dict(
+            Project.objects.filter(pk__in={str(record["project_id"]) for record in records}).values_list(
+                "id", "workspace_id"
+            )
+        )
+        workspace_ids = {str(project_id): workspace_id for project_id, workspace_id in workspace_ids.items()}
+
+        issue_ids = {str(record["issue_id"]) for record in records if record.get("issue_id") is not None}
+        if issue_ids:
+            if origin:
+                # set the request origin in redis
+                pipeline = redis_instance().pipeline()
+                for issue_id in issue_ids:
+                    pipeline.set(issue_id, origin, ex=600)
+                pipeline.execute()
+            Issue.objects.filter(pk__in=issue_ids).update(updated_at=timezone.now())
+
+        # Build the activities of every record, remembering which record produced them
+        issue_activities = []
+        record_activities = []
+        for record in records:
+            workspace_id = workspace_ids.get(str(record["project_id"]))
+            func = ACTIVITY_MAPPER.get(record.get("type"))
+            if workspace_id is None or func is None:
+                continue
+            activities = []
+            func(
+                requested_data=record.get("requested_data"),
+                current_instance=record.get("current_instance"),
+                issue_id=record.get("issue_id"),
+                project_id=record["project_id"],
+                workspace_id=workspace_id,
+                actor_id=actor_id,
+                issue_activities=activities,
+                epoch=epoch,
+            )
+            record_activities.append((record, len(activities)))
+            issue_activities.extend(activities)
+
+        # Save all the values to database
+        issue_activities_created = IssueActivity.objects.bulk_create(issue_activities)
+
+        # Keep the analytics rollups of the issues' creation days up to date
+        rollup_issue_ids = {
+            str(record["issue_id"])
+            for record in records
+            if record.get("issue_id") is not None and affects_rollups(record.get("type"), record.get("requested_data"))
+        }
+        if rollup_issue_ids:
+            refresh_issue_rollups.delay(issue_ids=list(rollup_issue_ids))
+
+        if notification:
+            # One task sends the notifications of the whole batch
+            notification_records = []
+            position = 0
+            for record, count in record_activities:
+                created = issue_activities_created[position : position + count]
+                position += count
+                notification_records.append(
+                    {
+                        "type": record.get("type"),
+                        "issue_id": record.get("issue_id"),
+                        "actor_id": actor_id,
+                        "project_id": record["project_id"],
+                        "subscriber": subscriber,
+                        "issue_activities_created": json.dumps(
+                            IssueActivitySerializer(created, many=True).data,
+                            cls=DjangoJSONEncoder,
+                        ),
+                        "requested_data": record.get("requested_data"),
+                        "current_instance": record.get("current_instance"),
+                    }
+                )
+            if notification_records:
+                notifications_batch.delay(records=notification_records)
+
+        return
+    except Exception as e:
+        log_exception(e)
+        return
@@ -57,11 +57,14 @@ def archive_old_issues():
                 issues_to_update = []
                 for issue in issues:
                     issue.archived_at = archive_at
+                    # bulk_update skips auto_now, the delta sync finds archived issues by updated_at
+                    issue.updated_at = timezone.now()
                     issues_to_update.append(issue)
 
                 # Bulk Update the issues and log the activity
                 if issues_to_update:
-                    Issue.objects.bulk_update(issues_to_update, ["archived_at"], batch_size=100)
+                    Issue.objects.bulk_update(issues_to_update, ["archived_at", "updated_at"], batch_size=100)
+                    Issue.refresh_counters([issue.parent_id for issue in issues_to_update], fields=["sub_issues_count"])
                     _ = [
                         issue_activity.delay(
                             type="issue.activity.updated",
@@ -20,7 +20,6 @@ from plane.db.models import (
     UserNotificationPreference,
     ProjectMember,
 )
-from django.db.models import Subquery
 
 # Third Party imports
 from celery import shared_task
@@ -77,29 +76,19 @@ def get_removed_mentions(requested_instance, current_instance):
 
 
 # Adds mentions as subscribers
-def extract_mentions_as_subscribers(project_id, issue_id, mentions):
+def extract_mentions_as_subscribers(project, issue_id, mentions, excluded_ids, project_member_ids):
     # mentions is an array of User IDs representing the FILTERED set of mentioned users
+    # excluded_ids are the existing subscribers, assignees and creator of the issue
 
     bulk_mention_subscribers = []
 
     for mention_id in mentions:
         # If the particular mention has not already been subscribed to the issue, he must be sent the mentioned notification # noqa: E501
-        if (
-            not IssueSubscriber.objects.filter(
-                issue_id=issue_id, subscriber_id=mention_id, project_id=project_id
-            ).exists()
-            and not IssueAssignee.objects.filter(
-                project_id=project_id, issue_id=issue_id, assignee_id=mention_id
-            ).exists()
-            and not Issue.objects.filter(project_id=project_id, pk=issue_id, created_by_id=mention_id).exists()
-            and ProjectMember.objects.filter(project_id=project_id, member_id=mention_id, is_active=True).exists()
-        ):
-            project = Project.objects.get(pk=project_id)
-
+        if str(mention_id) not in excluded_ids and str(mention_id) in project_member_ids:
             bulk_mention_subscribers.append(
                 IssueSubscriber(
                     workspace_id=project.workspace_id,
-                    project_id=project_id,
+                    project_id=project.id,
                     issue_id=issue_id,
                     subscriber_id=mention_id,
                 )
@@ -227,10 +216,30 @@ def notifications(
             project_members = ProjectMember.objects.filter(project_id=project_id, is_active=True).values_list(
                 "member_id", flat=True
             )
+            project_member_uuids = set(project_members)
+            project_member_ids = {str(member) for member in project_member_uuids}
+
+            project = Project.objects.select_related("workspace").get(pk=project_id)
+            issue = Issue.objects.select_related("project__workspace", "state").filter(pk=issue_id).first()
+
+            # Load the subscribers and assignees of the issue once
+            subscriber_ids = list(
+                IssueSubscriber.objects.filter(project_id=project_id, issue_id=issue_id).values_list(
+                    "subscriber_id", flat=True
+                )
+            )
+            assignee_ids = list(
+                IssueAssignee.objects.filter(project_id=project_id, issue_id=issue_id).values_list(
+                    "assignee_id", flat=True
+                )
+            )
+            excluded_ids = {str(user_id) for user_id in subscriber_ids + assignee_ids}
+            if issue is not None and issue.created_by_id and str(issue.project_id) == str(project_id):
+                excluded_ids.add(str(issue.created_by_id))
 
             # Get new mentions from the newer instance
             new_mentions = get_new_mentions(requested_instance=requested_data, current_instance=current_instance)
-            new_mentions = list(set(new_mentions) & {str(member) for member in project_members})
+            new_mentions = list(set(new_mentions) & project_member_ids)
             removed_mention = get_removed_mentions(requested_instance=requested_data, current_instance=current_instance)
 
             comment_mentions = []
@@ -239,7 +248,11 @@ def notifications(
             # Get New Subscribers from the mentions of the newer instance
             requested_mentions = extract_mentions(issue_instance=requested_data)
             mention_subscribers = extract_mentions_as_subscribers(
-                project_id=project_id, issue_id=issue_id, mentions=requested_mentions
+                project=project,
+                issue_id=issue_id,
+                mentions=requested_mentions,
+                excluded_ids=excluded_ids,
+                project_member_ids=project_member_ids,
             )
 
             for issue_activity in issue_activities_created:
@@ -257,11 +270,15 @@ def notifications(
                     )
                     comment_mentions = comment_mentions + new_comment_mentions
                     comment_mentions = [
-                        mention for mention in comment_mentions if UUID(mention) in set(project_members)
+                        mention for mention in comment_mentions if UUID(mention) in project_member_uuids
                     ]
 
             comment_mention_subscribers = extract_mentions_as_subscribers(
-                project_id=project_id, issue_id=issue_id, mentions=all_comment_mentions
+                project=project,
+                issue_id=issue_id,
+                mentions=all_comment_mentions,
+                excluded_ids=excluded_ids,
+                project_member_ids=project_member_ids,
             )
             """
             We will not send subscription activity notification to the below mentioned user sets
@@ -273,17 +290,12 @@ def notifications(
             """
 
             # ---------------------------------------------------------------------------------------------------------
-            issue_subscribers = list(
-                IssueSubscriber.objects.filter(
-                    project_id=project_id,
-                    issue_id=issue_id,
-                    subscriber__in=Subquery(project_members),
-                )
-                .exclude(subscriber_id__in=list(new_mentions + comment_mentions + [actor_id]))
-                .values_list("subscriber", flat=True)
-            )
-
-            issue = Issue.objects.filter(pk=issue_id).first()
+            skipped_ids = {str(user_id) for user_id in new_mentions + comment_mentions + [actor_id]}
+            issue_subscribers = [
+                user_id
+                for user_id in dict.fromkeys(subscriber_ids)
+                if user_id in project_member_uuids and str(user_id) not in skipped_ids
+            ]
 
             if subscriber:
                 # add the user to issue subscriber
@@ -294,16 +306,59 @@ def notifications(
                 except Exception:
                     pass
 
-            project = Project.objects.get(pk=project_id)
-
-            issue_assignees = IssueAssignee.objects.filter(
-                issue_id=issue_id,
-                project_id=project_id,
-                assignee__in=Subquery(project_members),
-            ).values_list("assignee", flat=True)
+            issue_assignees = {assignee_id for assignee_id in assignee_ids if assignee_id in project_member_uuids}
 
             issue_subscribers = list(set(issue_subscribers) - {uuid.UUID(actor_id)})
 
+            # Preferences of everyone who can be notified, completed states and comments in bulk
+            preferences = {
+                str(preference.user_id): preference
+                for preference in UserNotificationPreference.objects.filter(
+                    user_id__in=[str(user_id) for user_id in issue_subscribers + new_mentions + comment_mentions]
+                )
+            }
+
+            def get_preference(user_id):
+                # Behave like the `get` this replaces when a user has no preferences
+                if str(user_id) not in preferences:
+                    raise UserNotificationPreference.DoesNotExist
+                return preferences[str(user_id)]
+
+            state_ids = {
+                str(activity.get("new_identifier"))
+                for activity in issue_activities_created
+                if activity.get("field") == "state" and activity.get("new_identifier")
+            }
+            completed_state_ids = (
+                {
+                    str(state_id)
+                    for state_id in State.objects.filter(
+                        project_id=project_id, pk__in=state_ids, group="completed"
+                    ).values_list("id", flat=True)
+                }
+                if state_ids
+                else set()
+            )
+
+            comment_ids = {
+                str(activity.get("issue_comment"))
+                for activity in issue_activities_created
+                if activity.get("issue_comment")
+            }
+            issue_comments = (
+                {
+                    str(comment.id): comment
+                    for comment in IssueComment.objects.filter(
+                        id__in=comment_ids,
+                        issue_id=issue_id,
+                        project_id=project_id,
+                        workspace_id=project.workspace_id,
+                    )
+                }
+                if comment_ids
+                else {}
+            )
+
             for subscriber in issue_subscribers:
                 if issue.created_by_id and issue.created_by_id == subscriber:
                     sender = "in_app:issue_activities:created"
@@ -312,7 +367,7 @@ def notifications(
                 else:
                     sender = "in_app:issue_activities:subscribed"
 
-                preference = UserNotificationPreference.objects.get(user_id=subscriber)
+                preference = get_preference(subscriber)
 
                 for issue_activity in issue_activities_created:
                     # If activity done in blocking then blocked by email should not go
@@ -330,11 +385,7 @@ def notifications(
                     elif (
                         issue_activity.get("field") == "state"
                         and preference.issue_completed
-                        and State.objects.filter(
-                            project_id=project_id,
-                            pk=issue_activity.get("new_identifier"),
-                            group="completed",
-                        ).exists()
+                        and str(issue_activity.get("new_identifier")) in completed_state_ids
                     ):
                         send_email = True
                     elif issue_activity.get("field") == "comment" and preference.comment:
@@ -346,12 +397,7 @@ def notifications(
 
                     # If activity is of issue comment fetch the comment
                     issue_comment = (
-                        IssueComment.objects.filter(
-                            id=issue_activity.get("issue_comment"),
-                            issue_id=issue_id,
-                            project_id=project_id,
-                            workspace_id=project.workspace_id,
-                        ).first()
+                        issue_comments.get(str(issue_activity.get("issue_comment")))
                         if issue_activity.get("issue_comment")
                         else None
                     )
@@ -460,7 +506,7 @@ def notifications(
 
             for mention_id in comment_mentions:
                 if mention_id != actor_id:
-                    preference = UserNotificationPreference.objects.get(user_id=mention_id)
+                    preference = get_preference(mention_id)
                     for issue_activity in issue_activities_created:
                         notification = create_mention_notification(
                             project=project,
@@ -517,7 +563,7 @@ def notifications(
 
             for mention_id in new_mentions:
                 if mention_id != actor_id:
-                    preference = UserNotificationPreference.objects.get(user_id=mention_id)
+                    preference = get_preference(mention_id)
                     if (
                         last_activity is not None
                         and last_activity.field == "description"
@@ -668,3 +714,14 @@ def notifications(
     except Exception as e:
         print(e)
         return
+
+
+@shared_task
+def notifications_batch(records):
+    """
+    Send the notifications of many activities from one worker run, so a bulk
+    change queues a single task. Each record carries the arguments of a
+    `notifications` call.
+    """
+    for record in records:
+        notifications(**record)
@@ -2,13 +2,18 @@ import hashlib
 import hmac
 import json
 import logging
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
 
 import requests
-from typing import Any, Dict, List, Optional, Union
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Third party imports
 from celery import shared_task
+from celery.utils.time import get_exponential_backoff_interval
 
 # Django imports
 from django.conf import settings
@@ -75,9 +80,32 @@ MODEL_MAPPER = {
     "intake_issue": IntakeIssue,
 }
 
+WEBHOOK_ACTIONS = {
+    "POST": "create",
+    "PATCH": "update",
+    "PUT": "update",
+    "DELETE": "delete",
+}
+
+# Webhook flag that has to be enabled for an event to be delivered
+WEBHOOK_EVENT_FLAGS = {
+    "project": "project",
+    "issue": "issue",
+    "module": "module",
+    "module_issue": "module",
+    "cycle": "cycle",
+    "cycle_issue": "cycle",
+    "issue_comment": "issue_comment",
+}
+
+WEBHOOK_TIMEOUT = 30
 
 logger = logging.getLogger("plane.worker")
 
+# Keep-alive sessions of the worker process keyed by webhook host
+_webhook_sessions: Dict[str, requests.Session] = {}
+_webhook_sessions_lock = threading.Lock()
+
 
 def get_issue_prefetches():
     return [
@@ -182,6 +210,114 @@ def get_model_data(event: str, event_id: Union[str, List[str]], many: bool = Fal
         raise ObjectDoesNotExist(f"No {event} found with id: {event_id}")
 
 
+def get_webhook_session(url: str) -> requests.Session:
+    """
+    Return the keep-alive session of the host the webhook url points to.
+
+    Sessions live for the lifetime of the worker process so that deliveries to the
+    same host reuse their connections instead of opening one per request.
+    """
+    parsed_url = urlparse(url)
+    host = f"{parsed_url.scheme}://{parsed_url.netloc}"
+
+    with _webhook_sessions_lock:
+        session = _webhook_sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, settings.WEBHOOK_MAX_WORKERS))
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _webhook_sessions[host] = session
+    return session
+
+
+def build_webhook_request(
+    webhook: Webhook,
+    event: str,
+    action: str,
+    event_data: Optional[Dict[str, Any]],
+    activity: Optional[Dict[str, Any]],
+) -> Tuple[Dict[str, str], Dict[str, Any], str]:
+    """
+    Build the headers, payload and encoded body of a webhook delivery.
+
+    The body is signed as it is sent so the signature always matches the bytes
+    received by the endpoint.
+    """
+    payload = {
+        "event": event,
+        "action": WEBHOOK_ACTIONS.get(action, action),
+        "webhook_id": str(webhook.id),
+        "workspace_id": str(webhook.workspace_id),
+        "data": event_data,
+        "activity": activity,
+    }
+    body = json.dumps(payload)
+
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "Autopilot",
+        "X-Plane-Delivery": str(uuid.uuid4()),
+        "X-Plane-Event": event,
+    }
+
+    # Use HMAC for generating signature
+    if webhook.secret_key:
+        hmac_signature = hmac.new(webhook.secret_key.encode("utf-8"), body.encode("utf-8"), hashlib.sha256)
+        headers["X-Plane-Signature"] = hmac_signature.hexdigest()
+
+    return headers, payload, body
+
+
+def deliver_webhook(webhook: Webhook, headers: Dict[str, str], body: str) -> requests.Response:
+    """Post an encoded webhook body through the pooled session of its host"""
+    session = get_webhook_session(webhook.url)
+    return session.post(webhook.url, headers=headers, data=body, timeout=WEBHOOK_TIMEOUT)
+
+
+def handle_webhook_failure(
+    webhook: Webhook,
+    event: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    error: Exception,
+    retry_count: int,
+    max_retries: int,
+    current_site: str,
+) -> bool:
+    """
+    Log a failed delivery and deactivate the webhook once it is out of retries.
+
+    Returns:
+        bool: True if the delivery should be retried
+    """
+    save_webhook_log(
+        webhook=webhook,
+        request_method=payload["action"],
+        request_headers=headers,
+        request_body=payload,
+        response_status=500,
+        response_headers="",
+        response_body=str(error),
+        retry_count=retry_count,
+        event_type=event,
+    )
+    logger.error(f"Webhook {webhook.id} failed with error: {error}")
+
+    if retry_count < max_retries:
+        return True
+
+    Webhook.objects.filter(pk=webhook.id).update(is_active=False)
+    # send email for the deactivation of the webhook
+    send_webhook_deactivation_email.delay(
+        webhook_id=str(webhook.id),
+        receiver_id=str(webhook.created_by_id),
+        reason=str(error),
+        current_site=current_site,
+    )
+    return False
+
+
 @shared_task
 def send_webhook_deactivation_email(webhook_id: str, receiver_id: str, current_site: str, reason: str) -> None:
     """
@@ -278,43 +414,13 @@ def webhook_send_task(
     try:
         webhook = Webhook.objects.get(id=webhook_id, workspace__slug=slug)
 
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Autopilot",
-            "X-Plane-Delivery": str(uuid.uuid4()),
-            "X-Plane-Event": event,
-        }
-
-        # # Your secret key
         event_data = json.loads(json.dumps(event_data, cls=DjangoJSONEncoder)) if event_data is not None else None
 
         activity = json.loads(json.dumps(activity, cls=DjangoJSONEncoder)) if activity is not None else None
 
-        action = {
-            "POST": "create",
-            "PATCH": "update",
-            "PUT": "update",
-            "DELETE": "delete",
-        }.get(action, action)
-
-        payload = {
-            "event": event,
-            "action": action,
-            "webhook_id": str(webhook.id),
-            "workspace_id": str(webhook.workspace_id),
-            "data": event_data,
-            "activity": activity,
-        }
-
-        # Use HMAC for generating signature
-        if webhook.secret_key:
-            hmac_signature = hmac.new(
-                webhook.secret_key.encode("utf-8"),
-                json.dumps(payload).encode("utf-8"),
-                hashlib.sha256,
-            )
-            signature = hmac_signature.hexdigest()
-            headers["X-Plane-Signature"] = signature
+        headers, payload, body = build_webhook_request(
+            webhook=webhook, event=event, action=action, event_data=event_data, activity=activity
+        )
     except Exception as e:
         log_exception(e)
         logger.error(f"Failed to send webhook: {e}")
@@ -322,12 +428,12 @@ def webhook_send_task(
 
     try:
         # Send the webhook event
-        response = requests.post(webhook.url, headers=headers, json=payload, timeout=30)
+        response = deliver_webhook(webhook=webhook, headers=headers, body=body)
 
         # Log the webhook request
         save_webhook_log(
             webhook=webhook,
-            request_method=action,
+            request_method=payload["action"],
             request_headers=headers,
             request_body=payload,
             response_status=response.status_code,
@@ -338,38 +444,103 @@ def webhook_send_task(
         )
         logger.info(f"Webhook {webhook.id} sent successfully")
     except requests.RequestException as e:
-        # Log the failed webhook request
-        save_webhook_log(
+        # Retry logic
+        if handle_webhook_failure(
             webhook=webhook,
-            request_method=action,
-            request_headers=headers,
-            request_body=payload,
-            response_status=500,
-            response_headers="",
-            response_body=str(e),
+            event=event,
+            headers=headers,
+            payload=payload,
+            error=e,
             retry_count=self.request.retries,
-            event_type=event,
-        )
-        logger.error(f"Webhook {webhook.id} failed with error: {e}")
-        # Retry logic
-        if self.request.retries >= self.max_retries:
-            Webhook.objects.filter(pk=webhook.id).update(is_active=False)
-            if webhook:
-                # send email for the deactivation of the webhook
-                send_webhook_deactivation_email.delay(
-                    webhook_id=webhook.id,
-                    receiver_id=webhook.created_by_id,
-                    reason=str(e),
-                    current_site=current_site,
-                )
-            return
-        raise requests.RequestException()
+            max_retries=self.max_retries,
+            current_site=current_site,
+        ):
+            raise requests.RequestException()
+        return
 
     except Exception as e:
         log_exception(e)
         return
 
 
+def deliver_webhooks(
+    webhooks: List[Webhook],
+    slug: str,
+    event: str,
+    event_data: Optional[Dict[str, Any]],
+    action: str,
+    current_site: str,
+    activity: Optional[Dict[str, Any]],
+) -> None:
+    """
+    Deliver one event to several webhooks concurrently.
+
+    Requests run on a bounded thread pool while logging, retries and deactivation
+    happen on the calling thread. Failed deliveries are handed over to
+    `webhook_send_task` as its first retry so the retry budget stays the same.
+    """
+    deliveries = {}
+    for webhook in webhooks:
+        headers, payload, body = build_webhook_request(
+            webhook=webhook, event=event, action=action, event_data=event_data, activity=activity
+        )
+        deliveries[webhook.id] = (webhook, headers, payload, body)
+
+    max_workers = max(1, min(settings.WEBHOOK_MAX_WORKERS, len(deliveries)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(deliver_webhook, webhook, headers, body): webhook_id
+            for webhook_id, (webhook, headers, _, body) in deliveries.items()
+        }
+        for future in as_completed(futures):
+            webhook, headers, payload, _ = deliveries[futures[future]]
+            try:
+                response = future.result()
+                save_webhook_log(
+                    webhook=webhook,
+                    request_method=payload["action"],
+                    request_headers=headers,
+                    request_body=payload,
+                    response_status=response.status_code,
+                    response_headers=response.headers,
+                    response_body=response.text,
+                    retry_count=0,
+                    event_type=event,
+                )
+                logger.info(f"Webhook {webhook.id} sent successfully")
+            except requests.RequestException as e:
+                if handle_webhook_failure(
+                    webhook=webhook,
+                    event=event,
+                    headers=headers,
+                    payload=payload,
+                    error=e,
+                    retry_count=0,
+                    max_retries=webhook_send_task.max_retries,
+                    current_site=current_site,
+                ):
+                    webhook_send_task.apply_async(
+                        kwargs={
+                            "webhook_id": str(webhook.id),
+                            "slug": slug,
+                            "event": event,
+                            "event_data": event_data,
+                            "action": action,
+                            "current_site": current_site,
+                            "activity": activity,
+                        },
+                        countdown=get_exponential_backoff_interval(
+                            factor=webhook_send_task.retry_backoff,
+                            retries=0,
+                            maximum=getattr(webhook_send_task, "retry_backoff_max", 600),
+                            full_jitter=webhook_send_task.retry_jitter,
+                        ),
+                        retries=1,
+                    )
+            except Exception as e:
+                log_exception(e)
+
+
 @shared_task
 def webhook_activity(
     event: str,
@@ -387,8 +558,8 @@ def webhook_activity(
     """
     Process and send webhook notifications for various activities in the system.
 
-    This task filters relevant webhooks based on the event type and sends notifications
-    to all active webhooks for the workspace.
+    This task filters relevant webhooks based on the event type, serializes the event
+    once and delivers it to all active webhooks of the workspace concurrently.
 
     Args:
         event (str): Type of event (project, issue, module, cycle, issue_comment)
@@ -413,38 +584,33 @@ def webhook_activity(
     try:
         webhooks = Webhook.objects.filter(workspace__slug=slug, is_active=True)
 
-        if event == "project":
-            webhooks = webhooks.filter(project=True)
+        if event in WEBHOOK_EVENT_FLAGS:
+            webhooks = webhooks.filter(**{WEBHOOK_EVENT_FLAGS[event]: True})
 
-        if event == "issue":
-            webhooks = webhooks.filter(issue=True)
-
-        if event == "module" or event == "module_issue":
-            webhooks = webhooks.filter(module=True)
-
-        if event == "cycle" or event == "cycle_issue":
-            webhooks = webhooks.filter(cycle=True)
-
-        if event == "issue_comment":
-            webhooks = webhooks.filter(issue_comment=True)
-
-        for webhook in webhooks:
-            webhook_send_task.delay(
-                webhook_id=webhook.id,
-                slug=slug,
-                event=event,
-                event_data=({"id": event_id} if verb == "deleted" else get_model_data(event=event, event_id=event_id)),
-                action=verb,
-                current_site=current_site,
-                activity={
-                    "field": field,
-                    "new_value": new_value,
-                    "old_value": old_value,
-                    "actor": get_model_data(event="user", event_id=actor_id),
-                    "old_identifier": old_identifier,
-                    "new_identifier": new_identifier,
-                },
-            )
+        webhooks = list(webhooks)
+        if not webhooks:
+            return
+
+        # Serialize the event once for all the webhooks of the workspace
+        event_data = {"id": event_id} if verb == "deleted" else get_model_data(event=event, event_id=event_id)
+        activity = {
+            "field": field,
+            "new_value": new_value,
+            "old_value": old_value,
+            "actor": get_model_data(event="user", event_id=actor_id),
+            "old_identifier": old_identifier,
+            "new_identifier": new_identifier,
+        }
+
+        deliver_webhooks(
+            webhooks=webhooks,
+            slug=slug,
+            event=event,
+            event_data=json.loads(json.dumps(event_data, cls=DjangoJSONEncoder)),
+            action=verb,
+            current_site=current_site,
+            activity=json.loads(json.dumps(activity, cls=DjangoJSONEncoder)),
+        )
         return
     except Exception as e:
         # Return if a does not exist error occurs
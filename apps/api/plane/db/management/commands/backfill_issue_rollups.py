@@ -0,0 +1,26 @@
+# Django imports
+from django.core.management.base import BaseCommand
+
+# Module imports
+from plane.bgtasks.analytics_rollup_task import backfill_issue_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the analytics rollups of work items from the issues table"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--project-id", action="append", dest="project_ids", help="Project to rebuild, repeatable")
+        parser.add_argument(
+            "--background", action="store_true", help="Queue the rebuild on the workers instead of running it here"
+        )
+
+    def handle(self, *args, **options):
+        project_ids = options.get("project_ids")
+
+        if options.get("background"):
+            backfill_issue_rollups.delay(project_ids=project_ids)
+            self.stdout.write(self.style.SUCCESS("Successfully created analytics rollup backfill task"))
+            return
+
+        backfill_issue_rollups(project_ids=project_ids)
+        self.stdout.write(self.style.SUCCESS("Successfully rebuilt analytics rollups"))
@@ -0,0 +1,18 @@
+# Django imports
+from django.core.management.base import BaseCommand
+
+# Module imports
+from plane.db.models import CaseModule
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the materialized ancestry paths of the test case modules"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repository-id", action="append", dest="repository_ids", help="Repository to rebuild, repeatable"
+        )
+
+    def handle(self, *args, **options):
+        updated = CaseModule.rebuild_paths(repository_ids=options.get("repository_ids"))
+        self.stdout.write(self.style.SUCCESS(f"Successfully rebuilt the paths of {updated} modules"))
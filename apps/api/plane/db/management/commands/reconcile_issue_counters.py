@@ -0,0 +1,27 @@
+# Django imports
+from django.core.management.base import BaseCommand
+
+# Module imports
+from plane.db.models import Issue, Project
+
+
+class Command(BaseCommand):
+    help = "Recounts the links, attachments and sub work items stored on the work items"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--project-id", action="append", dest="project_ids", help="Project to recount, repeatable")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Work items recounted per update")
+
+    def handle(self, *args, **options):
+        projects = Project.all_objects.all()
+        if options.get("project_ids"):
+            projects = projects.filter(pk__in=options["project_ids"])
+
+        batch_size = options["batch_size"]
+        for project_id in projects.values_list("id", flat=True).iterator():
+            issue_ids = list(Issue.all_objects.filter(project_id=project_id).values_list("id", flat=True))
+            for start in range(0, len(issue_ids), batch_size):
+                Issue.refresh_counters(issue_ids[start : start + batch_size])
+            self.stdout.write(f"Reconciled {len(issue_ids)} work items of project {project_id}")
+
+        self.stdout.write(self.style.SUCCESS("Successfully reconciled work item counters"))
@@ -0,0 +1,75 @@
+# Generated by Django 4.2.27 on 2026-10-17 04:31
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0184_testplan_assignees'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueAssigneeRollup',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='Deleted At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('date', models.DateField()),
+                ('state_group', models.CharField(max_length=20)),
+                ('issue_count', models.PositiveIntegerField(default=0)),
+                ('assignee', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='issue_assignee_rollups', to=settings.AUTH_USER_MODEL)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Issue Assignee Rollup',
+                'verbose_name_plural': 'Issue Assignee Rollups',
+                'db_table': 'issue_assignee_rollups',
+                'ordering': ('date',),
+            },
+        ),
+        migrations.CreateModel(
+            name='IssueRollup',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='Deleted At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('date', models.DateField()),
+                ('state_group', models.CharField(max_length=20)),
+                ('priority', models.CharField(max_length=30)),
+                ('issue_count', models.PositiveIntegerField(default=0)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Issue Rollup',
+                'verbose_name_plural': 'Issue Rollups',
+                'db_table': 'issue_rollups',
+                'ordering': ('date',),
+                'indexes': [models.Index(fields=['workspace', 'date'], name='issue_rollup_workspace_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='issuerollup',
+            constraint=models.UniqueConstraint(condition=models.Q(('deleted_at__isnull', True)), fields=('project', 'date', 'state_group', 'priority'), name='issue_rollup_unique_project_date_when_deleted_at_null'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='issuerollup',
+            unique_together={('project', 'date', 'state_group', 'priority', 'deleted_at')},
+        ),
+        migrations.AddIndex(
+            model_name='issueassigneerollup',
+            index=models.Index(fields=['project', 'date'], name='issue_assignee_rollup_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.27 on 2026-10-17 04:34
+
+from django.db import migrations, models
+from django.contrib.postgres.operations import AddIndexConcurrently
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('db', '0185_issue_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueSequenceCounter',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='issue_sequence_counter', serialize=False, to='db.project')),
+                ('last_sequence', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Issue Sequence Counter',
+                'verbose_name_plural': 'Issue Sequence Counters',
+                'db_table': 'issue_sequence_counters',
+            },
+        ),
+        AddIndexConcurrently(
+            model_name='issue',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['project', 'state', 'sort_order'], name='issue_project_state_sort_idx'),
+        ),
+        # Start every project's counter after its largest existing sequence
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO issue_sequence_counters (project_id, last_sequence)
+                SELECT project_id, MAX(sequence) FROM issue_sequences GROUP BY project_id
+                ON CONFLICT (project_id) DO NOTHING
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.27 on 2026-10-17 04:40
+
+from django.db import migrations, models
+from django.contrib.postgres.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('db', '0186_issue_sequence_counter'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='issue',
+            index=models.Index(fields=['project', 'updated_at', 'id'], name='issue_project_updated_idx'),
+        ),
+    ]
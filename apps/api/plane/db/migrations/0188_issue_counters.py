@@ -0,0 +1,85 @@
+# Generated by Django 4.2.27 on 2026-10-17 04:43
+
+from django.db import migrations, models
+
+BACKFILL_BATCH_SIZE = 1000
+
+COUNT_SQL = """
+    UPDATE issues SET
+        link_count = (
+            SELECT COUNT(*) FROM issue_links
+            WHERE issue_links.issue_id = issues.id AND issue_links.deleted_at IS NULL
+        ),
+        attachment_count = (
+            SELECT COUNT(*) FROM file_assets
+            WHERE file_assets.issue_id = issues.id
+                AND file_assets.deleted_at IS NULL
+                AND file_assets.entity_type = 'ISSUE_ATTACHMENT'
+        ),
+        sub_issues_count = (
+            SELECT COUNT(*) FROM issues AS child
+            INNER JOIN states ON states.id = child.state_id
+            INNER JOIN projects ON projects.id = child.project_id
+            WHERE child.parent_id = issues.id
+                AND child.deleted_at IS NULL
+                AND child.archived_at IS NULL
+                AND NOT child.is_draft
+                AND NOT states.is_triage
+                AND states."group" <> 'triage'
+                AND projects.archived_at IS NULL
+                AND (
+                    NOT EXISTS (SELECT 1 FROM intake_issues WHERE intake_issues.issue_id = child.id)
+                    OR EXISTS (
+                        SELECT 1 FROM intake_issues
+                        WHERE intake_issues.issue_id = child.id AND intake_issues.status IN (-1, 1, 2)
+                    )
+                )
+        )
+    WHERE issues.id = ANY(%s)
+"""
+
+
+def backfill_issue_counters(apps, schema_editor):
+    last_id = None
+    with schema_editor.connection.cursor() as cursor:
+        while True:
+            if last_id is None:
+                cursor.execute("SELECT id FROM issues ORDER BY id LIMIT %s", [BACKFILL_BATCH_SIZE])
+            else:
+                cursor.execute(
+                    "SELECT id FROM issues WHERE id > %s ORDER BY id LIMIT %s", [last_id, BACKFILL_BATCH_SIZE]
+                )
+            issue_ids = [row[0] for row in cursor.fetchall()]
+            if not issue_ids:
+                return
+            cursor.execute(COUNT_SQL, [issue_ids])
+            last_id = issue_ids[-1]
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('db', '0187_issue_project_updated_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='attachment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='link_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='sub_issues_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        # Count the existing links, attachments and sub work items in batches,
+        # each batch commits on its own instead of locking every issue at once
+        migrations.RunPython(backfill_issue_counters, migrations.RunPython.noop),
+    ]
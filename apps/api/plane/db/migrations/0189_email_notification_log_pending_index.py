@@ -0,0 +1,19 @@
+# Generated by Django 4.2.27 on 2026-10-17 04:50
+
+from django.db import migrations, models
+from django.contrib.postgres.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('db', '0188_issue_counters'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='emailnotificationlog',
+            index=models.Index(condition=models.Q(('processed_at__isnull', True)), fields=['receiver', 'created_at'], name='email_log_pending_idx'),
+        ),
+    ]
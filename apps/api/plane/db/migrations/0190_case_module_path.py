@@ -0,0 +1,40 @@
+# Generated by Django 4.2.27 on 2026-10-17 04:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0189_email_notification_log_pending_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='casemodule',
+            name='path',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        # Build the paths of the existing modules from their parents
+        migrations.RunSQL(
+            sql="""
+                WITH RECURSIVE tree AS (
+                    SELECT id, replace(id::text, '-', '') || '/' AS path
+                    FROM test_modules
+                    WHERE parent_id IS NULL
+                    UNION ALL
+                    SELECT module.id, tree.path || replace(module.id::text, '-', '') || '/'
+                    FROM test_modules AS module
+                    INNER JOIN tree ON module.parent_id = tree.id
+                )
+                UPDATE test_modules SET path = tree.path
+                FROM tree
+                WHERE test_modules.id = tree.id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='casemodule',
+            index=models.Index(fields=['path'], name='test_module_path_idx', opclasses=['text_pattern_ops']),
+        ),
+    ]
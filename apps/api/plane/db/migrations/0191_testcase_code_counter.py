@@ -0,0 +1,25 @@
+# Generated by Django 4.2.27 on 2026-10-17 05:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0190_case_module_path'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TestCaseCodeCounter',
+            fields=[
+                ('scope_id', models.UUIDField(primary_key=True, serialize=False)),
+                ('last_number', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'TestCase Code Counter',
+                'verbose_name_plural': 'TestCase Code Counters',
+                'db_table': 'test_case_code_counters',
+            },
+        ),
+    ]
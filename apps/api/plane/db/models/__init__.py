@@ -1,4 +1,4 @@
-from .analytic import AnalyticView
+from .analytic import AnalyticView, IssueAssigneeRollup, IssueRollup
 from .api import APIActivityLog, APIToken
 from .asset import FileAsset
 from .base import BaseModel
@@ -38,6 +38,7 @@ from .issue import (
     IssueReaction,
     IssueRelation,
     IssueSequence,
+    IssueSequenceCounter,
     IssueSubscriber,
     IssueVote,
     IssueVersion,
@@ -1,7 +1,10 @@
 # Django models
+from django.conf import settings
 from django.db import models
+from django.db.models import Q
 
 from .base import BaseModel
+from .project import ProjectBaseModel
 
 
 class AnalyticView(BaseModel):
@@ -20,3 +23,55 @@ class AnalyticView(BaseModel):
     def __str__(self):
         """Return name of the analytic view"""
         return f"{self.name} <{self.workspace.name}>"
+
+
+class IssueRollup(ProjectBaseModel):
+    """Daily count of a project's work items by state group and priority, keyed by creation date"""
+
+    date = models.DateField()
+    state_group = models.CharField(max_length=20)
+    priority = models.CharField(max_length=30)
+    issue_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ["project", "date", "state_group", "priority", "deleted_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "date", "state_group", "priority"],
+                condition=Q(deleted_at__isnull=True),
+                name="issue_rollup_unique_project_date_when_deleted_at_null",
+            )
+        ]
+        indexes = [models.Index(fields=["workspace", "date"], name="issue_rollup_workspace_idx")]
+        verbose_name = "Issue Rollup"
+        verbose_name_plural = "Issue Rollups"
+        db_table = "issue_rollups"
+        ordering = ("date",)
+
+    def __str__(self):
+        return f"{self.project_id} {self.date} {self.state_group} {self.priority} <{self.issue_count}>"
+
+
+class IssueAssigneeRollup(ProjectBaseModel):
+    """Daily count of a project's work items by assignee and state group, keyed by creation date"""
+
+    date = models.DateField()
+    # Null for the work items without any assignee
+    assignee = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="issue_assignee_rollups",
+        null=True,
+    )
+    state_group = models.CharField(max_length=20)
+    issue_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [models.Index(fields=["project", "date"], name="issue_assignee_rollup_idx")]
+        verbose_name = "Issue Assignee Rollup"
+        verbose_name_plural = "Issue Assignee Rollups"
+        db_table = "issue_assignee_rollups"
+        ordering = ("date",)
+
+    def __str__(self):
+        return f"{self.project_id} {self.date} {self.assignee_id} {self.state_group} <{self.issue_count}>"
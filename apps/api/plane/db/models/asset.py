@@ -5,6 +5,8 @@ from uuid import uuid4
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module import
 from .base import BaseModel
@@ -105,6 +107,20 @@ class FileAsset(BaseModel):
         return None
 
 
+@receiver(post_save, sender=FileAsset)
+@receiver(post_delete, sender=FileAsset)
+def refresh_issue_attachment_count(sender, instance, signal, **kwargs):
+    if instance.entity_type != FileAsset.EntityTypeContext.ISSUE_ATTACHMENT or not instance.issue_id:
+        return
+    # Purged attachments were counted out when they were soft deleted
+    if signal is post_delete and instance.deleted_at:
+        return
+
+    from plane.db.models import Issue
+
+    Issue.refresh_counters([instance.issue_id], fields=["attachment_count"])
+
+
 class File(BaseModel):
     name = models.CharField(max_length=255, blank=True, verbose_name="原始文件名")
     size = models.PositiveBigIntegerField(verbose_name="文件大小 (bytes)")
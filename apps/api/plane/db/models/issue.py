@@ -1,4 +1,5 @@
 # Python import
+from collections import defaultdict
 from uuid import uuid4
 
 # Django imports
@@ -9,6 +10,8 @@ from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models, transaction, connection
 from django.utils import timezone
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django import apps
 
 # Module imports
@@ -16,7 +19,6 @@ from plane.utils.html_processor import strip_tags
 from plane.db.mixins import SoftDeletionManager
 from plane.utils.exception_logger import log_exception
 from .project import ProjectBaseModel
-from plane.utils.uuid import convert_uuid_to_integer
 from .description import Description
 from plane.db.mixins import ChangeTrackerMixin
 from .state import StateGroup
@@ -105,7 +107,7 @@ class IssueManager(SoftDeletionManager):
         )
 
 
-class Issue(ProjectBaseModel):
+class Issue(ChangeTrackerMixin, ProjectBaseModel):
     class IssueTypeEnum(models.TextChoices):
         TASK = '任务'
         BUG = '缺陷'
@@ -186,15 +188,39 @@ class Issue(ProjectBaseModel):
         blank=True,
     )
 
+    # Denormalized counts served to the lists, maintained by `refresh_counters`
+    link_count = models.PositiveIntegerField(default=0, editable=False)
+    attachment_count = models.PositiveIntegerField(default=0, editable=False)
+    sub_issues_count = models.PositiveIntegerField(default=0, editable=False)
+
     issue_objects = IssueManager()
 
+    # Changes to these fields move the work item in or out of its parent's sub work item count
+    TRACKED_FIELDS = ["parent_id", "archived_at", "is_draft", "state_id", "deleted_at"]
+
     class Meta:
         verbose_name = "Issue"
         verbose_name_plural = "Issues"
         db_table = "issues"
         ordering = ("-created_at",)
+        indexes = [
+            # Serves the largest sort order lookup of a state on issue creation
+            models.Index(
+                fields=["project", "state", "sort_order"],
+                condition=Q(deleted_at__isnull=True),
+                name="issue_project_state_sort_idx",
+            ),
+            # Serves the `(updated_at, id)` seek of the delta sync of a project
+            models.Index(fields=["project", "updated_at", "id"], name="issue_project_updated_idx"),
+        ]
 
     def save(self, *args, **kwargs):
+        # Both the previous and the current parent may gain or lose a sub work item
+        parent_ids = {self.parent_id, self.old_values.get("parent_id")} - {None}
+        recount_parents = bool(parent_ids) and (
+            self._state.adding or any(self.has_changed(field) for field in self.TRACKED_FIELDS)
+        )
+
         if self.state is None:
             try:
                 from plane.db.models import State
@@ -222,26 +248,15 @@ class Issue(ProjectBaseModel):
 
         if self._state.adding:
             with transaction.atomic():
-                # Create a lock for this specific project using a transaction-level advisory lock
-                # This ensures only one transaction per project can execute this code at a time
-                # The lock is automatically released when the transaction ends
-                lock_key = convert_uuid_to_integer(self.project.id)
-
-                with connection.cursor() as cursor:
-                    # Get an exclusive transaction-level lock using the project ID as the lock key
-                    cursor.execute("SELECT pg_advisory_xact_lock(%s)", [lock_key])
-
-                # Get the last sequence for the project
-                last_sequence = IssueSequence.objects.filter(project=self.project).aggregate(
-                    largest=models.Max("sequence")
-                )["largest"]
-                self.sequence_id = last_sequence + 1 if last_sequence else 1
+                # Reserve the next sequence id from the project's counter row
+                self.sequence_id = IssueSequenceCounter.reserve(self.project_id)
                 # Strip the html tags using html parser
                 self.description_stripped = (
                     None
                     if (self.description_html == "" or self.description_html is None)
                     else strip_tags(self.description_html)
                 )
+                # Served by the project, state and sort order index
                 largest_sort_order = Issue.objects.filter(project=self.project, state=self.state).aggregate(
                     largest=models.Max("sort_order")
                 )["largest"]
@@ -251,6 +266,8 @@ class Issue(ProjectBaseModel):
                 super(Issue, self).save(*args, **kwargs)
 
                 IssueSequence.objects.create(issue=self, sequence=self.sequence_id, project=self.project)
+                if recount_parents:
+                    Issue.refresh_counters(parent_ids, fields=["sub_issues_count"])
         else:
             # Strip the html tags using html parser
             self.description_stripped = (
@@ -258,7 +275,110 @@ class Issue(ProjectBaseModel):
                 if (self.description_html == "" or self.description_html is None)
                 else strip_tags(self.description_html)
             )
-            super(Issue, self).save(*args, **kwargs)
+            if recount_parents:
+                with transaction.atomic():
+                    super(Issue, self).save(*args, **kwargs)
+                    Issue.refresh_counters(parent_ids, fields=["sub_issues_count"])
+            else:
+                super(Issue, self).save(*args, **kwargs)
+
+    @classmethod
+    def refresh_counters(cls, issue_ids, fields=None):
+        """
+        Recount the links, attachments and sub work items of the given issues.
+
+        The counts are recomputed rather than incremented so they stay exact
+        whichever way a related row was created, moved, archived or deleted.
+        Call it in the transaction of the change so both commit together.
+        """
+        issue_ids = {issue_id for issue_id in issue_ids if issue_id}
+        if not issue_ids:
+            return
+
+        from plane.db.models import FileAsset
+
+        counters = {
+            "link_count": IssueLink.objects.filter(issue_id=models.OuterRef("pk")),
+            "attachment_count": FileAsset.objects.filter(
+                issue_id=models.OuterRef("pk"), entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT
+            ),
+            "sub_issues_count": Issue.issue_objects.filter(parent_id=models.OuterRef("pk")),
+        }
+        cls.all_objects.filter(pk__in=issue_ids).update(
+            **{
+                field: models.Subquery(
+                    queryset.order_by().annotate(count=models.Func(models.F("id"), function="Count")).values("count")
+                )
+                for field, queryset in counters.items()
+                if fields is None or field in fields
+            }
+        )
+
+    @classmethod
+    def bulk_create_with_sequences(cls, issues, batch_size=1000):
+        """
+        Create many issues at once, for imports and seeding.
+
+        Sequence ids are reserved with one counter update per project and sort orders
+        continue after the largest one of each state, as `save` does for single issues.
+        The issues must have their state set.
+        """
+        if not issues:
+            return []
+
+        with transaction.atomic():
+            project_issues = defaultdict(list)
+            for issue in issues:
+                project_issues[issue.project_id].append(issue)
+
+            for project_id, issues_of_project in project_issues.items():
+                first_sequence = IssueSequenceCounter.reserve(project_id, count=len(issues_of_project))
+                for offset, issue in enumerate(issues_of_project):
+                    issue.sequence_id = first_sequence + offset
+
+            # Largest sort order of every state the issues are created in
+            largest_sort_orders = {
+                (row["project_id"], row["state_id"]): row["largest"]
+                for row in Issue.objects.filter(
+                    project_id__in=project_issues.keys(), state_id__in={issue.state_id for issue in issues}
+                )
+                .values("project_id", "state_id")
+                .annotate(largest=models.Max("sort_order"))
+                .order_by()
+            }
+
+            for issue in issues:
+                key = (issue.project_id, issue.state_id)
+                largest_sort_order = largest_sort_orders.get(key)
+                if largest_sort_order is not None:
+                    issue.sort_order = largest_sort_order + 10000
+                largest_sort_orders[key] = issue.sort_order
+
+                # Strip the html tags using html parser
+                if not issue.description_stripped:
+                    issue.description_stripped = (
+                        None
+                        if (issue.description_html == "" or issue.description_html is None)
+                        else strip_tags(issue.description_html)
+                    )
+
+            created_issues = cls.objects.bulk_create(issues, batch_size=batch_size)
+
+            IssueSequence.objects.bulk_create(
+                [
+                    IssueSequence(
+                        issue=issue,
+                        sequence=issue.sequence_id,
+                        project_id=issue.project_id,
+                        workspace_id=issue.workspace_id,
+                    )
+                    for issue in created_issues
+                ],
+                batch_size=batch_size,
+            )
+            cls.refresh_counters([issue.parent_id for issue in created_issues], fields=["sub_issues_count"])
+
+        return created_issues
 
     def __str__(self):
         """Return name of the issue"""
@@ -394,6 +514,15 @@ class IssueLink(ProjectBaseModel):
         return f"{self.issue.name} {self.url}"
 
 
+@receiver(post_save, sender=IssueLink)
+@receiver(post_delete, sender=IssueLink)
+def refresh_issue_link_count(sender, instance, signal, **kwargs):
+    # Purged links were counted out when they were soft deleted
+    if signal is post_delete and instance.deleted_at:
+        return
+    Issue.refresh_counters([instance.issue_id], fields=["link_count"])
+
+
 def get_upload_path(instance, filename):
     return f"{instance.workspace.id}/{uuid4().hex}-{filename}"
 
@@ -610,6 +739,51 @@ class IssueSequence(ProjectBaseModel):
         ordering = ("-created_at",)
 
 
+class IssueSequenceCounter(models.Model):
+    """Last sequence id handed out in a project"""
+
+    project = models.OneToOneField(
+        "db.Project",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="issue_sequence_counter",
+    )
+    last_sequence = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Issue Sequence Counter"
+        verbose_name_plural = "Issue Sequence Counters"
+        db_table = "issue_sequence_counters"
+
+    @classmethod
+    def reserve(cls, project_id, count=1):
+        """
+        Reserve `count` consecutive sequence ids in a project and return the first one.
+
+        The counter row is incremented with a single `UPDATE ... RETURNING`, so concurrent
+        creations only wait on this row instead of scanning the project's sequences.
+        A project without a counter row is seeded from its existing sequences.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {cls._meta.db_table} SET last_sequence = last_sequence + %s "
+                "WHERE project_id = %s RETURNING last_sequence",
+                [count, project_id],
+            )
+            row = cursor.fetchone()
+            if row is None:
+                cursor.execute(
+                    f"INSERT INTO {cls._meta.db_table} (project_id, last_sequence) "
+                    f"SELECT %s, COALESCE(MAX(sequence), 0) + %s FROM {IssueSequence._meta.db_table} "
+                    "WHERE project_id = %s "
+                    f"ON CONFLICT (project_id) DO UPDATE SET last_sequence = {cls._meta.db_table}.last_sequence + %s "
+                    "RETURNING last_sequence",
+                    [project_id, count, project_id, count],
+                )
+                row = cursor.fetchone()
+        return row[0] - count + 1
+
+
 class IssueSubscriber(ProjectBaseModel):
     issue = models.ForeignKey(Issue, on_delete=models.CASCADE, related_name="issue_subscribers")
     subscriber = models.ForeignKey(
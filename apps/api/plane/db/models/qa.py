@@ -1,31 +1,53 @@
+import uuid
 from enum import IntEnum
 
 from django.core.validators import RegexValidator
 from django.db import IntegrityError
+from django.db import connection
 from django.db import transaction
 from django.db import models
-from django.db.models import Q
+from django.db.models import Q, Value
+from django.db.models.functions import Concat, Substr
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.conf import settings
 
 from . import BaseModel, Issue
 
 
-def generate_case_code(*, project_id, project_identifier, repository_id=None):
+def generate_case_codes(*, project_id, project_identifier, repository_id=None, count=1):
+    """从编号计数器一次预留 count 个连续的用例编号"""
+    if count <= 0:
+        return []
     prefix = f"{project_identifier}-"
+    first = TestCaseCodeCounter.reserve(
+        prefix=prefix, project_id=project_id, repository_id=repository_id, count=count
+    )
+    return [f"{prefix}{number}" for number in range(first, first + count)]
+
+
+def generate_case_code(*, project_id, project_identifier, repository_id=None):
+    return generate_case_codes(
+        project_id=project_id, project_identifier=project_identifier, repository_id=repository_id
+    )[0]
+
 
-    queryset = TestCase.objects.filter(deleted_at__isnull=True)
-    if project_id:
-        queryset = queryset.filter(repository__project_id=project_id)
-    elif repository_id:
-        queryset = queryset.filter(repository_id=repository_id)
+def case_code_number(code, prefix):
+    """编号的数字后缀，不是 "前缀-数字" 形式的编号返回 None"""
+    suffix = code[len(prefix):] if code and code.startswith(prefix) else ""
+    if suffix.isascii() and suffix.isdigit() and len(suffix) <= 18:
+        return int(suffix)
+    return None
 
-    max_number = 0
-    for code in queryset.filter(code__startswith=prefix).values_list("code", flat=True):
-        suffix = code[len(prefix):]
-        if suffix.isdigit():
-            max_number = max(max_number, int(suffix))
 
-    return f"{project_identifier}-{max_number + 1}"
+def record_case_codes(*, project_id, project_identifier, repository_id=None, codes):
+    """手工填写或导入的编号写入后推进计数器，之后预留的编号不会与之重复"""
+    prefix = f"{project_identifier}-"
+    numbers = [number for number in (case_code_number(code, prefix) for code in codes) if number is not None]
+    if numbers:
+        TestCaseCodeCounter.raise_to(
+            prefix=prefix, project_id=project_id, repository_id=repository_id, number=max(numbers)
+        )
 
 
 class TestCaseRepository(BaseModel):
@@ -77,17 +99,87 @@ class CaseModule(BaseModel):
     repository = models.ForeignKey(TestCaseRepository, on_delete=models.CASCADE, verbose_name="TestCaseRepository",
                                    related_name="modules")
 
+    # 祖先链物化路径：根到当前模块的 id（hex）依次以 "/" 结尾拼接
+    path = models.TextField(blank=True, default="", editable=False)
+
     @property
     def get_all_children(self) -> list:
         """获取当前模块及其所有子模块的ID（包括多层嵌套的子模块）"""
+        return list(CaseModule.objects.filter(path__startswith=self.path).order_by().values_list("id", flat=True))
 
-        def get_children_ids(module):
-            ids = [module.id]
-            for child in module.children.all():
-                ids.extend(get_children_ids(child))
-            return ids
+    @staticmethod
+    def path_ids(path) -> list:
+        """物化路径中从根到当前模块的ID"""
+        return [uuid.UUID(part) for part in path.split("/") if part]
 
-        return get_children_ids(self)
+    @classmethod
+    def descendant_ids(cls, module_ids) -> list:
+        """给定模块及其所有子孙模块的ID"""
+        paths = list(cls.objects.filter(id__in=module_ids).values_list("path", flat=True))
+        if not paths:
+            return []
+        subtree = Q()
+        for path in paths:
+            subtree |= Q(path__startswith=path)
+        return list(cls.objects.filter(subtree).order_by().values_list("id", flat=True))
+
+    @classmethod
+    def ancestor_ids(cls, module_ids) -> set:
+        """给定模块及其所有祖先模块的ID"""
+        ids = set()
+        for path in cls.objects.filter(id__in=module_ids).values_list("path", flat=True):
+            ids.update(cls.path_ids(path))
+        return ids
+
+    @classmethod
+    def rebuild_paths(cls, repository_ids=None):
+        """按 parent 关系重建物化路径，返回更新的模块数"""
+        repository_filter = "AND repository_id = ANY(%(repository_ids)s)" if repository_ids else ""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH RECURSIVE tree AS (
+                    SELECT id, replace(id::text, '-', '') || '/' AS path
+                    FROM {cls._meta.db_table}
+                    WHERE parent_id IS NULL {repository_filter}
+                    UNION ALL
+                    SELECT module.id, tree.path || replace(module.id::text, '-', '') || '/'
+                    FROM {cls._meta.db_table} AS module
+                    INNER JOIN tree ON module.parent_id = tree.id
+                )
+                UPDATE {cls._meta.db_table} SET path = tree.path
+                FROM tree
+                WHERE {cls._meta.db_table}.id = tree.id AND {cls._meta.db_table}.path <> tree.path
+                """,
+                {"repository_ids": [str(repository_id) for repository_id in repository_ids or []]},
+            )
+            return cursor.rowcount
+
+    def build_path(self) -> str:
+        parent_path = ""
+        if self.parent_id:
+            parent_path = CaseModule.all_objects.filter(pk=self.parent_id).values_list("path", flat=True).first() or ""
+            if self.id.hex in parent_path.split("/"):
+                raise ValueError("A module cannot be moved under itself or its children")
+        return f"{parent_path}{self.id.hex}/"
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "parent" not in update_fields:
+            return super().save(*args, **kwargs)
+
+        old_path = self.path
+        self.path = self.build_path()
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "path"}
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            # 移动模块时一并改写整棵子树的路径
+            if old_path and old_path != self.path:
+                CaseModule.all_objects.filter(path__startswith=old_path).exclude(pk=self.pk).update(
+                    path=Concat(Value(self.path), Substr("path", len(old_path) + 1))
+                )
 
     class Meta:
         constraints = [
@@ -98,10 +190,22 @@ class CaseModule(BaseModel):
                 name="unique_case_module_repository_name_when_not_deleted",
             ),
         ]
+        indexes = [
+            models.Index(fields=["path"], name="test_module_path_idx", opclasses=["text_pattern_ops"]),
+        ]
         db_table = "test_modules"
         ordering = ('sort_order', "-created_at",)
 
 
+@receiver(post_save, sender=CaseModule)
+@receiver(post_delete, sender=CaseModule)
+def invalidate_case_module_tree(sender, instance, **kwargs):
+    # 模块树按用例库缓存，任一模块变化即换代
+    from plane.utils.qa_tree import invalidate_module_tree
+
+    invalidate_module_tree(instance.repository_id)
+
+
 class TestCase(BaseModel):
     class State(models.IntegerChoices):
         PENDING_REVIEW = 0, '待评审'
@@ -167,33 +271,52 @@ class TestCase(BaseModel):
 
     def save(self, *args, **kwargs):
         if self.code:
-            return super().save(*args, **kwargs)
-
-        project_id = None
-        project_identifier = None
-        if self.repository_id:
-            repository = self.repository
-            if repository and repository.project_id:
-                project_id = repository.project_id
-                project_identifier = repository.project.identifier
+            super().save(*args, **kwargs)
+            update_fields = kwargs.get("update_fields")
+            if (update_fields is None or "code" in update_fields) and self.code.rpartition("-")[2].isdigit():
+                self.record_codes(self.repository if self.repository_id else None, [self.code])
+            return
 
-        if not project_identifier:
-            project_identifier = "NA"
+        code_scope = self.code_scope(self.repository if self.repository_id else None)
 
         max_attempts = 5
         for attempt in range(max_attempts):
+            # 编号在保存点之外预留，撞上手工编号时重试会取到下一个编号
+            self.code = generate_case_code(**code_scope)
             try:
                 with transaction.atomic():
-                    self.code = generate_case_code(
-                        project_id=project_id,
-                        project_identifier=project_identifier,
-                        repository_id=self.repository_id,
-                    )
                     return super().save(*args, **kwargs)
             except IntegrityError:
                 if attempt == max_attempts - 1:
                     raise
                 self.code = ""
+                # 计数器落后于已有编号时，按现有的最大编号重新对齐
+                TestCaseCodeCounter.reseed(
+                    prefix=f"{code_scope['project_identifier']}-",
+                    project_id=code_scope["project_id"],
+                    repository_id=code_scope["repository_id"],
+                )
+
+    @staticmethod
+    def code_scope(repository):
+        """用例编号的分配范围：有项目时按项目，否则按用例库"""
+        if repository and repository.project_id:
+            return dict(
+                project_id=repository.project_id,
+                project_identifier=repository.project.identifier,
+                repository_id=repository.id,
+            )
+        return dict(project_id=None, project_identifier="NA", repository_id=repository.id if repository else None)
+
+    @classmethod
+    def allocate_codes(cls, repository, count):
+        """为同一用例库的一批用例一次预留编号"""
+        return generate_case_codes(count=count, **cls.code_scope(repository))
+
+    @classmethod
+    def record_codes(cls, repository, codes):
+        """推进用例库所在范围的编号计数器，使其不小于这些编号"""
+        record_case_codes(codes=codes, **cls.code_scope(repository))
 
     class Meta:
         constraints = [
@@ -207,6 +330,108 @@ class TestCase(BaseModel):
         ordering = ("-created_at",)
 
 
+
+class TestCaseCodeCounter(models.Model):
+    """已分配的最大用例编号，项目内用例按项目计数，无项目的用例库按用例库计数"""
+
+    scope_id = models.UUIDField(primary_key=True)
+    last_number = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "TestCase Code Counter"
+        verbose_name_plural = "TestCase Code Counters"
+        db_table = "test_case_code_counters"
+
+    @classmethod
+    def _max_code_query(cls, *, prefix, project_id=None, repository_id=None):
+        """范围内现有用例编号最大数字后缀的查询语句及参数"""
+        case_table = TestCase._meta.db_table
+        if project_id:
+            scope_join = (
+                f"INNER JOIN {TestCaseRepository._meta.db_table} AS repository "
+                f"ON repository.id = {case_table}.repository_id"
+            )
+            scope_filter = "repository.project_id = %s"
+        else:
+            scope_join = ""
+            scope_filter = f"{case_table}.repository_id = %s"
+        sql = (
+            f"SELECT COALESCE(MAX(substring({case_table}.code FROM %s)::bigint), 0) "
+            f"FROM {case_table} {scope_join} "
+            f"WHERE {scope_filter} AND {case_table}.deleted_at IS NULL "
+            f"AND left({case_table}.code, %s) = %s "
+            f"AND substring({case_table}.code FROM %s) ~ '^[0-9]{{1,18}}$'"
+        )
+        params = [len(prefix) + 1, project_id or repository_id, len(prefix), prefix, len(prefix) + 1]
+        return sql, params
+
+    @classmethod
+    def reserve(cls, *, prefix, project_id=None, repository_id=None, count=1):
+        """
+        预留 count 个连续编号并返回第一个。
+
+        计数行用一条 UPDATE ... RETURNING 自增；没有计数行时按现有用例编号的
+        最大数字后缀初始化。
+        """
+        scope_id = project_id or repository_id
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {cls._meta.db_table} SET last_number = last_number + %s "
+                "WHERE scope_id = %s RETURNING last_number",
+                [count, scope_id],
+            )
+            row = cursor.fetchone()
+            if row is None:
+                max_sql, max_params = cls._max_code_query(
+                    prefix=prefix, project_id=project_id, repository_id=repository_id
+                )
+                cursor.execute(
+                    f"INSERT INTO {cls._meta.db_table} (scope_id, last_number) "
+                    f"SELECT %s, ({max_sql}) + %s "
+                    f"ON CONFLICT (scope_id) DO UPDATE SET last_number = {cls._meta.db_table}.last_number + %s "
+                    "RETURNING last_number",
+                    [scope_id, *max_params, count, count],
+                )
+                row = cursor.fetchone()
+        return row[0] - count + 1
+
+    @classmethod
+    def raise_to(cls, *, prefix, project_id=None, repository_id=None, number):
+        """
+        计数器不小于 number；还没有计数行时按现有用例编号和 number 中较大者初始化，
+        批量导入可以在写入手工编号之前先登记它们。
+        """
+        scope_id = project_id or repository_id
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {cls._meta.db_table} SET last_number = GREATEST(last_number, %s) WHERE scope_id = %s",
+                [number, scope_id],
+            )
+            if cursor.rowcount:
+                return
+            max_sql, max_params = cls._max_code_query(
+                prefix=prefix, project_id=project_id, repository_id=repository_id
+            )
+            cursor.execute(
+                f"INSERT INTO {cls._meta.db_table} (scope_id, last_number) "
+                f"SELECT %s, GREATEST(({max_sql}), %s) "
+                f"ON CONFLICT (scope_id) DO UPDATE SET last_number = "
+                f"GREATEST({cls._meta.db_table}.last_number, EXCLUDED.last_number)",
+                [scope_id, *max_params, number],
+            )
+
+    @classmethod
+    def reseed(cls, *, prefix, project_id=None, repository_id=None):
+        """按现有用例编号的最大数字后缀推进计数器"""
+        max_sql, max_params = cls._max_code_query(prefix=prefix, project_id=project_id, repository_id=repository_id)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {cls._meta.db_table} SET last_number = GREATEST(last_number, ({max_sql})) "
+                "WHERE scope_id = %s",
+                [*max_params, project_id or repository_id],
+            )
+
+
 class TestCaseVersion(BaseModel):
     case = models.ForeignKey(TestCase, on_delete=models.CASCADE, related_name="versions")
     version = models.FloatField(default=1)
@@ -1,4 +1,4 @@
-from .instance import InstanceEndpoint, SignUpScreenVisitedEndpoint
+from .instance import InstanceCacheStatsEndpoint, InstanceEndpoint, SignUpScreenVisitedEndpoint
 
 
 from .configuration import (
@@ -16,7 +16,7 @@ from plane.license.api.permissions import InstanceAdminPermission
 from plane.license.api.serializers import InstanceSerializer
 from plane.license.models import Instance
 from plane.license.utils.instance_value import get_configuration_value
-from plane.utils.cache import cache_response, invalidate_cache
+from plane.utils.cache import cache_response, get_cache_stats, invalidate_cache
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_control
 
@@ -208,3 +208,10 @@ class SignUpScreenVisitedEndpoint(BaseAPIView):
         instance.is_signup_screen_visited = True
         instance.save()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class InstanceCacheStatsEndpoint(BaseAPIView):
+    permission_classes = [InstanceAdminPermission]
+
+    def get(self, request):
+        return Response(get_cache_stats(), status=status.HTTP_200_OK)
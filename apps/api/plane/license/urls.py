@@ -3,6 +3,7 @@ from django.urls import path
 from plane.api.views.ldap import LdapConfigEndpoint, LdapTestConnectionEndpoint
 from plane.license.api.views import (
     EmailCredentialCheckEndpoint,
+    InstanceCacheStatsEndpoint,
     InstanceAdminEndpoint,
     InstanceAdminSignInEndpoint,
     InstanceAdminSignUpEndpoint,
@@ -78,4 +79,5 @@ urlpatterns = [
         name="instance-workspace-availability",
     ),
     path("workspaces/", InstanceWorkSpaceEndpoint.as_view(), name="instance-workspace"),
+    path("cache-stats/", InstanceCacheStatsEndpoint.as_view(), name="instance-cache-stats"),
 ]
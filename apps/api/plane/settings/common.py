@@ -294,6 +294,12 @@ CELERY_IMPORTS = (
     # issue version tasks
     "plane.bgtasks.issue_version_sync",
     "plane.bgtasks.issue_description_version_sync",
+    # analytics rollup tasks
+    "plane.bgtasks.analytics_rollup_task",
+    # cycle tasks
+    "plane.bgtasks.cycle_transfer_task",
+    # qa tasks
+    "plane.bgtasks.case_import_task",
 )
 
 FILE_SIZE_LIMIT = int(os.environ.get("FILE_SIZE_LIMIT", 52428800))
@@ -311,6 +317,13 @@ ANALYTICS_BASE_API = os.environ.get("ANALYTICS_BASE_API", False)
 POSTHOG_API_KEY = os.environ.get("POSTHOG_API_KEY", False)
 POSTHOG_HOST = os.environ.get("POSTHOG_HOST", False)
 
+# Analytics
+# Serve analytics from the rollup tables, enable once `backfill_issue_rollups` has run
+USE_ANALYTICS_ROLLUPS = os.environ.get("USE_ANALYTICS_ROLLUPS", "0") == "1"
+
+# Webhook delivery
+WEBHOOK_MAX_WORKERS = int(os.environ.get("WEBHOOK_MAX_WORKERS", 8))
+
 # Skip environment variable configuration
 SKIP_ENV_VAR = os.environ.get("SKIP_ENV_VAR", "1") == "1"
 
@@ -368,6 +381,18 @@ LIVE_URL = urljoin(LIVE_BASE_URL, LIVE_BASE_PATH) if LIVE_BASE_URL else None
 WEB_URL = os.environ.get("WEB_URL")
 
 HARD_DELETE_AFTER_DAYS = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 60))
+# Rows purged per delete statement and seconds a nightly purge may run before it yields
+HARD_DELETE_BATCH_SIZE = int(os.environ.get("HARD_DELETE_BATCH_SIZE", 1000))
+HARD_DELETE_TIME_BUDGET = int(os.environ.get("HARD_DELETE_TIME_BUDGET", 3600))
+
+# Cycles with more incomplete work items than this are transferred in the background
+CYCLE_TRANSFER_ASYNC_THRESHOLD = int(os.environ.get("CYCLE_TRANSFER_ASYNC_THRESHOLD", 500))
+
+# Test case imports with more rows than this run in the background
+CASE_IMPORT_ASYNC_THRESHOLD = int(os.environ.get("CASE_IMPORT_ASYNC_THRESHOLD", 500))
+
+# Email notification logs grouped per pass of the email digest job
+EMAIL_DIGEST_BATCH_SIZE = int(os.environ.get("EMAIL_DIGEST_BATCH_SIZE", 1000))
 
 # Instance Changelog URL
 INSTANCE_CHANGELOG_URL = os.environ.get("INSTANCE_CHANGELOG_URL", "")
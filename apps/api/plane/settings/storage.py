@@ -1,6 +1,9 @@
 # Python imports
 import os
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from typing import Optional
 
 # Third party imports
@@ -12,6 +15,51 @@ from urllib.parse import quote
 from plane.utils.exception_logger import log_exception
 from storages.backends.s3boto3 import S3Boto3Storage
 
+# Upper bound of the shared clients, the MinIO endpoint follows the request host
+S3_CLIENT_POOL_SIZE = 32
+# Upper bound of the presigned URLs kept by a process
+PRESIGNED_URL_CACHE_SIZE = 4096
+
+# boto3 clients are thread safe but slow to build, they are shared by every
+# storage instance of the process with the same endpoint and credentials
+_s3_clients = OrderedDict()
+_s3_clients_lock = threading.Lock()
+
+# Presigned GET URLs by endpoint, object key and disposition, with their expiry
+_presigned_urls = OrderedDict()
+_presigned_urls_lock = threading.Lock()
+
+
+def get_s3_client(aws_access_key_id, aws_secret_access_key, region_name, endpoint_url):
+    """Return the shared S3 client for the endpoint and credentials"""
+    key = (aws_access_key_id, aws_secret_access_key, region_name, endpoint_url)
+    with _s3_clients_lock:
+        client = _s3_clients.get(key)
+        if client is None:
+            # The default boto3 session is not thread safe, build under the lock
+            client = boto3.client(
+                "s3",
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                config=boto3.session.Config(signature_version="s3v4"),
+            )
+            _s3_clients[key] = client
+            while len(_s3_clients) > S3_CLIENT_POOL_SIZE:
+                _s3_clients.popitem(last=False)
+        else:
+            _s3_clients.move_to_end(key)
+        return client
+
+
+def clear_s3_clients():
+    """Drop the shared S3 clients and the presigned URLs signed with them"""
+    with _s3_clients_lock:
+        _s3_clients.clear()
+    with _presigned_urls_lock:
+        _presigned_urls.clear()
+
 
 class S3Storage(S3Boto3Storage):
     def url(self, name, parameters=None, expire=None, http_method=None):
@@ -19,7 +67,7 @@ class S3Storage(S3Boto3Storage):
 
     """S3 storage class to generate presigned URLs for S3 objects"""
 
-    def __init__(self, request=None):
+    def __init__(self, request=None, is_server=False):
         # Get the AWS credentials and bucket name from the environment
         self.aws_access_key_id = os.environ.get("AWS_ACCESS_KEY_ID")
         # Use the AWS_SECRET_ACCESS_KEY environment variable for the secret key
@@ -32,32 +80,26 @@ class S3Storage(S3Boto3Storage):
         self.aws_s3_endpoint_url = os.environ.get("AWS_S3_ENDPOINT_URL") or os.environ.get("MINIO_ENDPOINT_URL")
         # Use the SIGNED_URL_EXPIRATION environment variable for the expiration time (default: 3600 seconds)
         self.signed_url_expiration = int(os.environ.get("SIGNED_URL_EXPIRATION", "3600"))
+        # Use the SIGNED_URL_CACHE_TTL environment variable for the presigned URL reuse time (default: 300 seconds)
+        self.signed_url_cache_ttl = int(os.environ.get("SIGNED_URL_CACHE_TTL", "300"))
 
-        if os.environ.get("USE_MINIO") == "1":
+        self.endpoint_url = self.aws_s3_endpoint_url
+        if os.environ.get("USE_MINIO") == "1" and request and not is_server:
             # Determine protocol based on environment variable
             if os.environ.get("MINIO_ENDPOINT_SSL") == "1":
                 endpoint_protocol = "https"
             else:
-                endpoint_protocol = request.scheme if request else "http"
-            # Create an S3 client for MinIO
-            self.s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key,
-                region_name=self.aws_region,
-                endpoint_url=(f"{endpoint_protocol}://{request.get_host()}" if request else self.aws_s3_endpoint_url),
-                config=boto3.session.Config(signature_version="s3v4"),
-            )
-        else:
-            # Create an S3 client
-            self.s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key,
-                region_name=self.aws_region,
-                endpoint_url=self.aws_s3_endpoint_url,
-                config=boto3.session.Config(signature_version="s3v4"),
-            )
+                endpoint_protocol = request.scheme
+            # Sign MinIO URLs for the host the browser reached
+            self.endpoint_url = f"{endpoint_protocol}://{request.get_host()}"
+
+        # Reuse the S3 client of the process for this endpoint
+        self.s3_client = get_s3_client(
+            aws_access_key_id=self.aws_access_key_id,
+            aws_secret_access_key=self.aws_secret_access_key,
+            region_name=self.aws_region,
+            endpoint_url=self.endpoint_url,
+        )
 
     def generate_presigned_post(self, object_name, file_type, file_size, expiration=None):
         """Generate a presigned URL to upload an S3 object"""
@@ -117,6 +159,26 @@ class S3Storage(S3Boto3Storage):
         """Generate a presigned URL to share an S3 object"""
         if expiration is None:
             expiration = self.signed_url_expiration
+
+        # A cached URL is served while it still has at least half of its lifetime left
+        cache_ttl = min(self.signed_url_cache_ttl, expiration // 2)
+        cache_key = (
+            self.aws_access_key_id,
+            self.aws_region,
+            self.endpoint_url,
+            self.aws_storage_bucket_name,
+            str(object_name),
+            expiration,
+            http_method,
+            disposition,
+            filename,
+        )
+        if cache_ttl > 0:
+            with _presigned_urls_lock:
+                cached = _presigned_urls.get(cache_key)
+                if cached and cached[1] > time.monotonic():
+                    return cached[0]
+
         content_disposition = self._get_content_disposition(disposition, filename)
         try:
             response = self.s3_client.generate_presigned_url(
@@ -133,6 +195,13 @@ class S3Storage(S3Boto3Storage):
             log_exception(e)
             return None
 
+        if cache_ttl > 0:
+            with _presigned_urls_lock:
+                _presigned_urls[cache_key] = (response, time.monotonic() + cache_ttl)
+                _presigned_urls.move_to_end(cache_key)
+                while len(_presigned_urls) > PRESIGNED_URL_CACHE_SIZE:
+                    _presigned_urls.popitem(last=False)
+
         # The response contains the presigned URL
         return response
 
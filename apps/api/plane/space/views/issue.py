@@ -18,7 +18,6 @@ from django.db.models import (
     JSONField,
     Value,
     OuterRef,
-    Func,
     CharField,
     Subquery,
 )
@@ -52,14 +51,12 @@ from plane.app.serializers import (
 from plane.db.models import (
     Issue,
     IssueComment,
-    IssueLink,
     IssueReaction,
     ProjectMember,
     CommentReaction,
     DeployBoard,
     IssueVote,
     ProjectPublicMember,
-    FileAsset,
     CycleIssue,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
@@ -96,27 +93,6 @@ class ProjectIssuesPublicEndpoint(BaseAPIView):
                     CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
                 )
             )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
         ).distinct()
 
         issue_queryset = issue_queryset.filter(**filters)
@@ -0,0 +1,60 @@
+import uuid
+from unittest.mock import Mock, patch
+
+import pytest
+from rest_framework import status
+
+from plane.db.models import FileAsset, Project, ProjectMember
+from plane.settings.storage import clear_s3_clients
+
+
+@pytest.mark.contract
+class TestWorkspaceAssetSignedURLs:
+    """Test the batch signed URL resolution of workspace assets"""
+
+    def get_url(self, workspace_slug):
+        return f"/api/assets/v2/workspaces/{workspace_slug}/signed-urls/"
+
+    def create_asset(self, workspace, project=None, is_uploaded=True):
+        return FileAsset.objects.create(
+            asset=f"{uuid.uuid4().hex}-attachment.png",
+            attributes={"name": "attachment.png"},
+            workspace=workspace,
+            project=project,
+            entity_type=FileAsset.EntityTypeContext.PAGE_DESCRIPTION,
+            is_uploaded=is_uploaded,
+        )
+
+    @pytest.mark.django_db
+    @patch("plane.settings.storage.boto3")
+    def test_signs_only_the_visible_assets_in_one_response(self, mock_boto3, session_client, workspace, create_user):
+        """Test that assets of other projects and pending uploads are left out"""
+        clear_s3_clients()
+        mock_s3_client = Mock()
+        mock_s3_client.generate_presigned_url.return_value = "https://test-url.com"
+        mock_boto3.client.return_value = mock_s3_client
+
+        member_project = Project.objects.create(name="Member Project", identifier="MP", workspace=workspace)
+        ProjectMember.objects.create(project=member_project, member=create_user)
+        other_project = Project.objects.create(name="Other Project", identifier="OP", workspace=workspace)
+
+        workspace_asset = self.create_asset(workspace)
+        project_asset = self.create_asset(workspace, member_project)
+        hidden_assets = [self.create_asset(workspace, other_project), self.create_asset(workspace, is_uploaded=False)]
+
+        response = session_client.post(
+            self.get_url(workspace.slug),
+            {"asset_ids": [str(asset.id) for asset in [workspace_asset, project_asset, *hidden_assets]]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data) == {str(workspace_asset.id), str(project_asset.id)}
+        assert mock_s3_client.generate_presigned_url.call_count == 2
+
+    @pytest.mark.django_db
+    def test_rejects_missing_asset_ids(self, session_client, workspace):
+        """Test that a request without asset ids is rejected"""
+        response = session_client.post(self.get_url(workspace.slug), {}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
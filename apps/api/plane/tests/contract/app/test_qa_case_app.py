@@ -0,0 +1,55 @@
+import pytest
+from rest_framework import status
+
+from plane.db.models import CaseLabel, CaseModule, Project, TestCase, TestCaseRepository, TestCaseVersion, TestPlan
+
+
+@pytest.mark.contract
+class TestCaseListQueries:
+    """Test that the case lists cost a fixed number of queries whatever the page size"""
+
+    @pytest.fixture
+    def project(self, workspace):
+        return Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+
+    @pytest.fixture
+    def cases(self, workspace, project):
+        repository = TestCaseRepository.objects.create(name="Repository", project=project, workspace=workspace)
+        root = CaseModule.objects.create(name="Root", repository=repository)
+        module = CaseModule.objects.create(name="Child", repository=repository, parent=root)
+        label = CaseLabel.objects.create(name="Smoke", repository=repository)
+        cases = []
+        for index in range(30):
+            case = TestCase.objects.create(name=f"Case {index}", repository=repository, module=module)
+            case.labels.add(label)
+            TestCaseVersion.objects.create(
+                case=case, version=1, repository_id=str(repository.id), name=case.name, code=case.code
+            )
+            cases.append(case)
+        return cases
+
+    @pytest.mark.django_db
+    def test_project_cases(self, session_client, workspace, project, cases, django_assert_max_num_queries):
+        """Test that listing the project cases does not query per case"""
+        with django_assert_max_num_queries(20):
+            response = session_client.get(
+                f"/api/workspaces/{workspace.slug}/test/case/project-cases/",
+                {"project_id": str(project.id), "page_size": 30},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"][0]["module_path"] == "Root/Child"
+
+    @pytest.mark.django_db
+    def test_plan_unassociated_cases(self, session_client, workspace, project, cases, django_assert_max_num_queries):
+        """Test that listing the cases outside a plan does not query per case"""
+        plan = TestPlan.objects.create(name="Plan", project=project)
+
+        with django_assert_max_num_queries(20):
+            response = session_client.get(
+                f"/api/workspaces/{workspace.slug}/test/case/plan-unassociated-cases/",
+                {"plan_id": str(plan.id), "page_size": 30},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == len(cases)
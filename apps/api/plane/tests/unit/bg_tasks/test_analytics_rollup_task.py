@@ -0,0 +1,75 @@
+import pytest
+from django.db.models import Count, Q
+
+from plane.bgtasks.analytics_rollup_task import refresh_issue_rollups, refresh_project_rollups
+from plane.db.models import Issue, IssueAssignee, IssueAssigneeRollup, IssueRollup, Project, ProjectMember, State
+from plane.utils.analytics_rollup import get_rollup_state_group_counts
+
+
+@pytest.mark.unit
+class TestAnalyticsRollups:
+    """Test that the analytics rollups match the counts computed from the issues"""
+
+    @pytest.fixture
+    def project(self, create_user, workspace):
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        ProjectMember.objects.create(project=project, member=create_user)
+        return project
+
+    @pytest.fixture
+    def states(self, workspace, project):
+        return {
+            group: State.objects.create(name=group.title(), group=group, workspace=workspace, project=project)
+            for group in ("backlog", "started", "completed")
+        }
+
+    @pytest.fixture
+    def issues(self, create_user, workspace, project, states):
+        issues = [
+            Issue.objects.create(
+                name=f"Issue {index}",
+                workspace=workspace,
+                project=project,
+                state=list(states.values())[index % 3],
+                priority=["high", "low"][index % 2],
+            )
+            for index in range(9)
+        ]
+        for issue in issues[:4]:
+            IssueAssignee.objects.create(issue=issue, assignee=create_user, project=project, workspace=workspace)
+        return issues
+
+    @pytest.mark.django_db
+    def test_rollups_match_issue_counts(self, create_user, project, issues):
+        """Test that a full rebuild produces the same counts as the issues table"""
+        refresh_project_rollups(project.id)
+
+        expected = Issue.issue_objects.filter(project=project).aggregate(
+            total_work_items=Count("id"),
+            started_work_items=Count("id", filter=Q(state__group="started")),
+            completed_work_items=Count("id", filter=Q(state__group="completed")),
+            backlog_work_items=Count("id", filter=Q(state__group="backlog")),
+        )
+        counts = get_rollup_state_group_counts(IssueRollup.objects.filter(project=project))
+        for key, value in expected.items():
+            assert counts[key] == value
+
+        assignee_counts = {
+            rollup.assignee_id: rollup.issue_count
+            for rollup in IssueAssigneeRollup.objects.filter(project=project, state_group="started")
+        }
+        assert sum(assignee_counts.values()) == 3
+
+    @pytest.mark.django_db
+    def test_state_change_refreshes_creation_day(self, project, states, issues):
+        """Test that refreshing an issue moves it to its new state group"""
+        refresh_project_rollups(project.id)
+
+        issue = issues[0]
+        Issue.objects.filter(pk=issue.pk).update(state=states["completed"])
+        refresh_issue_rollups(issue_ids=[str(issue.id)])
+
+        counts = get_rollup_state_group_counts(IssueRollup.objects.filter(project=project))
+        assert counts["completed_work_items"] == 4
+        assert counts["backlog_work_items"] == 2
+        assert counts["total_work_items"] == 9
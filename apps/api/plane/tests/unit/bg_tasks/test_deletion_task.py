@@ -0,0 +1,127 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from plane.bgtasks.deletion_task import (
+    get_purge_order,
+    purge_model,
+    restore_related_objects,
+    soft_delete_related_objects,
+)
+from plane.db.models import Issue, IssueActivity, IssueComment, Project, ProjectMember, State, Workspace
+
+
+@pytest.mark.unit
+class TestSoftDeleteCascade:
+    """Test the set based soft delete and restore of related objects"""
+
+    @pytest.fixture
+    def project(self, create_user, workspace):
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        ProjectMember.objects.create(project=project, member=create_user)
+        return project
+
+    @pytest.fixture
+    def state(self, workspace, project):
+        return State.objects.create(name="Todo", group="unstarted", workspace=workspace, project=project)
+
+    def create_issues(self, workspace, project, state, count):
+        issues = [
+            Issue.objects.create(name=f"Issue {index}", workspace=workspace, project=project, state=state)
+            for index in range(count)
+        ]
+        for issue in issues:
+            IssueComment.objects.create(
+                comment_html="<p>Comment</p>", issue=issue, project=project, workspace=workspace
+            )
+        return issues
+
+    def soft_delete_project(self, project):
+        project.deleted_at = timezone.now()
+        project.save(update_fields=["deleted_at"])
+        with CaptureQueriesContext(connection) as context:
+            soft_delete_related_objects("db", "project", project.id)
+        return len(context)
+
+    @pytest.mark.django_db
+    def test_cascade_soft_deletes_descendants(self, workspace, project, state):
+        """Test that work items and their comments share the deletion time of the project"""
+        issues = self.create_issues(workspace, project, state, 3)
+
+        self.soft_delete_project(project)
+
+        project.refresh_from_db()
+        assert not Issue.objects.filter(pk__in=[issue.id for issue in issues]).exists()
+        assert not IssueComment.objects.filter(project=project).exists()
+        assert set(Issue.all_objects.filter(project=project).values_list("deleted_at", flat=True)) == {
+            project.deleted_at
+        }
+
+    @pytest.mark.django_db
+    def test_query_count_does_not_grow_with_rows(self, create_user, workspace, state, project):
+        """Test that cascading over 30 work items costs as many queries as over 2"""
+        other_project = Project.objects.create(name="Other Project", identifier="OP", workspace=workspace)
+        ProjectMember.objects.create(project=other_project, member=create_user)
+        other_state = State.objects.create(name="Todo", group="unstarted", workspace=workspace, project=other_project)
+
+        self.create_issues(workspace, project, state, 2)
+        self.create_issues(workspace, other_project, other_state, 30)
+
+        few_queries = self.soft_delete_project(project)
+        many_queries = self.soft_delete_project(other_project)
+
+        assert many_queries == few_queries
+
+    @pytest.mark.django_db
+    def test_restore_skips_rows_deleted_earlier(self, workspace, project, state):
+        """Test that restoring only brings back the rows deleted along with the instance"""
+        issues = self.create_issues(workspace, project, state, 3)
+        Issue.objects.filter(pk=issues[0].id).update(deleted_at=timezone.now() - timezone.timedelta(days=1))
+
+        self.soft_delete_project(project)
+        restore_related_objects("db", "project", project.id)
+
+        project.refresh_from_db()
+        assert project.deleted_at is None
+        assert set(Issue.objects.filter(project=project).values_list("id", flat=True)) == {
+            issue.id for issue in issues[1:]
+        }
+        assert IssueComment.objects.filter(project=project).count() == 3
+
+
+@pytest.mark.unit
+class TestHardDelete:
+    """Test the chunked purge of expired soft deleted rows"""
+
+    def test_children_are_purged_before_parents(self):
+        """Test that the purge order puts every model before the models it cascades from"""
+        purge_order = get_purge_order()
+
+        assert purge_order.index(IssueComment) < purge_order.index(Issue)
+        assert purge_order.index(Issue) < purge_order.index(Project)
+        assert purge_order.index(Project) < purge_order.index(Workspace)
+
+    @pytest.mark.django_db
+    def test_purge_model_deletes_expired_rows_in_batches(self, create_user, workspace):
+        """Test that only the rows deleted before the cutoff are purged"""
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        ProjectMember.objects.create(project=project, member=create_user)
+        issue = Issue.objects.create(name="Test Issue", workspace=workspace, project=project)
+        activities = IssueActivity.objects.bulk_create(
+            [
+                IssueActivity(issue=issue, project=project, workspace=workspace, verb="updated", actor=create_user)
+                for _ in range(7)
+            ]
+        )
+        cutoff = timezone.now()
+        expired_ids = [activity.id for activity in activities[:5]]
+        IssueActivity.all_objects.filter(pk__in=expired_ids).update(deleted_at=cutoff - timezone.timedelta(days=1))
+        IssueActivity.all_objects.filter(pk=activities[5].id).update(deleted_at=cutoff + timezone.timedelta(days=1))
+
+        deleted, completed = purge_model(IssueActivity, cutoff, batch_size=2, deadline=float("inf"))
+
+        assert deleted == 5
+        assert completed
+        assert not IssueActivity.all_objects.filter(pk__in=expired_ids).exists()
+        assert IssueActivity.all_objects.filter(issue=issue).count() == 2
@@ -0,0 +1,80 @@
+import smtplib
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from plane.bgtasks.email_notification_task import send_receiver_email_notifications, stack_email_notification
+from plane.db.models import EmailNotificationLog, User
+
+
+@pytest.mark.unit
+class TestStackEmailNotification:
+    """Test the receiver partitioned email digest job"""
+
+    @pytest.mark.django_db
+    @patch("plane.bgtasks.email_notification_task.send_receiver_email_notifications.delay")
+    def test_one_send_task_per_receiver(self, send_receiver, create_user):
+        """Test that the logs are grouped per receiver and issue and all marked processed"""
+        other_user = User.objects.create(email="other@plane.so", username="other_user")
+        issue_ids = [uuid.uuid4(), uuid.uuid4()]
+        logs = EmailNotificationLog.objects.bulk_create(
+            [
+                EmailNotificationLog(
+                    receiver=receiver,
+                    triggered_by=other_user if receiver == create_user else create_user,
+                    entity_identifier=issue_id,
+                    entity_name="issue",
+                    data={"index": index},
+                )
+                for receiver in (create_user, other_user)
+                for index, issue_id in enumerate(issue_ids + issue_ids[:1])
+            ]
+        )
+
+        stack_email_notification(batch_size=2)
+
+        payloads = {call.kwargs["receiver_id"]: call.kwargs["payload"] for call in send_receiver.call_args_list}
+        assert send_receiver.call_count == 2
+        assert set(payloads[str(create_user.id)]) == {str(issue_id) for issue_id in issue_ids}
+        first_issue = payloads[str(create_user.id)][str(issue_ids[0])]
+        assert first_issue["notification_data"] == {str(other_user.id): [{"index": 0}, {"index": 2}]}
+        assert len(first_issue["email_notification_ids"]) == 2
+        assert not EmailNotificationLog.objects.filter(
+            pk__in=[log.id for log in logs], processed_at__isnull=True
+        ).exists()
+
+
+@pytest.mark.unit
+class TestSendReceiverEmailNotifications:
+    """Test the digest emails sent to one receiver"""
+
+    @pytest.mark.django_db
+    @patch("plane.bgtasks.email_notification_task.log_exception")
+    @patch("plane.bgtasks.email_notification_task.get_email_connection")
+    def test_failed_connection_leaves_logs_unsent(self, get_email_connection, log_exception, create_user):
+        """Test that an SMTP login failure is logged and the logs stay unsent"""
+        connection = MagicMock()
+        connection.__enter__.side_effect = smtplib.SMTPAuthenticationError(535, b"Authentication failed")
+        get_email_connection.return_value = (connection, "no-reply@plane.so")
+        log = EmailNotificationLog.objects.create(
+            receiver=create_user,
+            triggered_by=create_user,
+            entity_identifier=uuid.uuid4(),
+            entity_name="issue",
+            data={},
+        )
+
+        send_receiver_email_notifications(
+            receiver_id=str(create_user.id),
+            payload={
+                str(log.entity_identifier): {
+                    "notification_data": {str(create_user.id): [{}]},
+                    "email_notification_ids": [str(log.id)],
+                }
+            },
+        )
+
+        log_exception.assert_called_once()
+        log.refresh_from_db()
+        assert log.sent_at is None
@@ -0,0 +1,114 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from plane.bgtasks.issue_activities_task import affects_rollups, issue_activity_batch, update_issue_activity
+from plane.db.models import Issue, Label, Project, ProjectMember, State
+
+
+@pytest.mark.unit
+class TestIssueActivityLookups:
+    """Test that issue activity tracking resolves references in bulk"""
+
+    @pytest.fixture
+    def project(self, create_user, workspace):
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        ProjectMember.objects.create(project=project, member=create_user)
+        return project
+
+    @pytest.fixture
+    def labels(self, workspace, project):
+        return [
+            Label.objects.create(name=f"label-{index}", workspace=workspace, project=project) for index in range(20)
+        ]
+
+    @pytest.fixture
+    def states(self, workspace, project):
+        return [
+            State.objects.create(name=name, group="started", workspace=workspace, project=project)
+            for name in ("Todo", "Doing")
+        ]
+
+    @pytest.fixture
+    def issue(self, workspace, project, states):
+        return Issue.objects.create(name="Test Issue", workspace=workspace, project=project, state=states[0])
+
+    @pytest.mark.django_db
+    def test_bulk_relabel_uses_one_query_per_model(
+        self, django_assert_num_queries, create_user, workspace, project, labels, states, issue
+    ):
+        """Test that relabelling and moving an issue costs one query per referenced model"""
+        issue_activities = []
+        requested_data = {
+            "label_ids": [str(label.id) for label in labels[10:]],
+            "state_id": str(states[1].id),
+        }
+        current_instance = {
+            "label_ids": [str(label.id) for label in labels[:10]],
+            "state_id": str(states[0].id),
+        }
+
+        # One query for the labels and one for the states
+        with django_assert_num_queries(2):
+            update_issue_activity(
+                requested_data=json.dumps(requested_data),
+                current_instance=json.dumps(current_instance),
+                issue_id=str(issue.id),
+                project_id=str(project.id),
+                workspace_id=str(workspace.id),
+                actor_id=str(create_user.id),
+                issue_activities=issue_activities,
+                epoch=int(timezone.now().timestamp()),
+            )
+
+        assert len([activity for activity in issue_activities if activity.field == "labels"]) == 20
+        assert {activity.new_value for activity in issue_activities if activity.comment == "added label "} == {
+            label.name for label in labels[10:]
+        }
+        state_activity = next(activity for activity in issue_activities if activity.field == "state")
+        assert state_activity.old_value == "Todo"
+        assert state_activity.new_value == "Doing"
+
+    @pytest.mark.django_db
+    @patch("plane.bgtasks.issue_activities_task.notifications_batch.delay")
+    def test_batch_queues_one_notification_task(self, notifications_batch, create_user, project, states):
+        """Test that a bulk change sends its notifications from a single task"""
+        issues = [
+            Issue.objects.create(name=f"Issue {index}", workspace=project.workspace, project=project, state=states[0])
+            for index in range(3)
+        ]
+        records = [
+            {
+                "type": "issue.activity.updated",
+                "requested_data": json.dumps({"priority": "high"}),
+                "current_instance": json.dumps({"priority": "none"}),
+                "issue_id": str(issue.id),
+                "project_id": str(project.id),
+            }
+            for issue in issues
+        ]
+
+        issue_activity_batch(records, str(create_user.id), int(timezone.now().timestamp()), notification=True)
+
+        notifications_batch.assert_called_once()
+        assert len(notifications_batch.call_args.kwargs["records"]) == 3
+
+
+@pytest.mark.unit
+class TestAffectsRollups:
+    """Test which activities refresh the analytics rollups"""
+
+    def test_rollups_disabled(self, settings):
+        """Test that nothing is refreshed while the rollups are off"""
+        settings.USE_ANALYTICS_ROLLUPS = False
+        assert not affects_rollups("issue.activity.created", None)
+
+    def test_only_counted_fields_refresh(self, settings):
+        """Test that updates refresh only when a field the rollups count by changed"""
+        settings.USE_ANALYTICS_ROLLUPS = True
+        assert affects_rollups("issue.activity.created", None)
+        assert affects_rollups("issue.activity.updated", json.dumps({"priority": "high"}))
+        assert not affects_rollups("issue.activity.updated", json.dumps({"name": "Renamed"}))
+        assert not affects_rollups("comment.activity.created", json.dumps({"comment_html": "<p>Hi</p>"}))
@@ -0,0 +1,75 @@
+import json
+from uuid import uuid4
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from plane.bgtasks.notification_task import notifications
+from plane.db.models import (
+    Issue,
+    IssueSubscriber,
+    Notification,
+    Project,
+    ProjectMember,
+    State,
+    User,
+)
+
+
+@pytest.mark.unit
+class TestNotificationQueries:
+    """Test that the notifications task resolves subscribers in bulk"""
+
+    @pytest.fixture
+    def project(self, create_user, workspace):
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        ProjectMember.objects.create(project=project, member=create_user)
+        return project
+
+    @pytest.fixture
+    def state(self, workspace, project):
+        return State.objects.create(name="Todo", group="unstarted", workspace=workspace, project=project)
+
+    def notify_subscribers(self, workspace, project, state, actor, subscriber_count):
+        issue = Issue.objects.create(name="Test Issue", workspace=workspace, project=project, state=state)
+        for _ in range(subscriber_count):
+            unique_id = uuid4().hex[:8]
+            user = User.objects.create(email=f"subscriber-{unique_id}@plane.so", username=f"subscriber_{unique_id}")
+            ProjectMember.objects.create(project=project, member=user)
+            IssueSubscriber.objects.create(project=project, workspace=workspace, issue=issue, subscriber=user)
+
+        activity = {
+            "id": str(uuid4()),
+            "verb": "updated",
+            "field": "priority",
+            "actor_id": str(actor.id),
+            "old_value": "low",
+            "new_value": "high",
+            "comment": "updated the priority to",
+            "issue_comment": None,
+            "issue_detail": {"id": str(issue.id)},
+        }
+        with CaptureQueriesContext(connection) as context:
+            notifications(
+                type="issue.activity.updated",
+                issue_id=str(issue.id),
+                project_id=str(project.id),
+                actor_id=str(actor.id),
+                subscriber=False,
+                issue_activities_created=json.dumps([activity]),
+                requested_data=json.dumps({"priority": "high"}),
+                current_instance=json.dumps({"priority": "low"}),
+            )
+        return len(context), Notification.objects.filter(entity_identifier=issue.id).count()
+
+    @pytest.mark.django_db
+    def test_query_count_does_not_grow_with_subscribers(self, create_user, workspace, project, state):
+        """Test that notifying 50 subscribers costs as many queries as notifying 2"""
+        few_queries, few_notifications = self.notify_subscribers(workspace, project, state, create_user, 2)
+        many_queries, many_notifications = self.notify_subscribers(workspace, project, state, create_user, 50)
+
+        assert few_notifications == 2
+        assert many_notifications == 50
+        # Only the batched inserts of the notifications may grow
+        assert many_queries <= few_queries + 1
@@ -0,0 +1,37 @@
+import hashlib
+import hmac
+import json
+from uuid import uuid4
+
+import pytest
+
+# The views have to be loaded before the webhook task, as the API serializers import them
+import plane.app.views  # noqa: F401
+from plane.bgtasks.webhook_task import build_webhook_request, get_webhook_session
+from plane.db.models import Webhook
+
+
+@pytest.mark.unit
+class TestWebhookDelivery:
+    """Test the helpers used to deliver webhook events"""
+
+    def test_session_is_reused_per_host(self):
+        """Test that deliveries to the same host share one keep-alive session"""
+        session = get_webhook_session("https://hooks.example.com/plane/one")
+
+        assert get_webhook_session("https://hooks.example.com/plane/two") is session
+        assert get_webhook_session("https://other.example.com/plane/one") is not session
+
+    def test_signature_matches_body(self):
+        """Test that the signature is computed over the exact body that is sent"""
+        webhook = Webhook(id=uuid4(), workspace_id=uuid4(), url="https://hooks.example.com", secret_key="secret")
+
+        headers, payload, body = build_webhook_request(
+            webhook=webhook, event="issue", action="PATCH", event_data={"id": "1"}, activity=None
+        )
+
+        expected = hmac.new(b"secret", body.encode("utf-8"), hashlib.sha256).hexdigest()
+        assert headers["X-Plane-Signature"] == expected
+        assert json.loads(body) == payload
+        assert payload["action"] == "update"
+        assert payload["webhook_id"] == str(webhook.id)
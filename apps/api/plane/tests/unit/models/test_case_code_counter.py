@@ -0,0 +1,63 @@
+import pytest
+
+from plane.db.models import Project, TestCase, TestCaseCodeCounter, TestCaseRepository
+
+
+@pytest.mark.unit
+class TestCaseCodeCounterAllocation:
+    """Test the allocation of test case codes from the per project counter"""
+
+    @pytest.fixture
+    def project(self, workspace):
+        return Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+
+    @pytest.fixture
+    def repository(self, workspace, project):
+        return TestCaseRepository.objects.create(name="Repository", project=project, workspace=workspace)
+
+    @pytest.mark.django_db
+    def test_counter_is_seeded_from_existing_codes(self, repository, project):
+        """Test that the first allocation continues after the largest existing code"""
+        TestCase.objects.create(name="Imported", code="TP-41", repository=repository)
+        TestCase.objects.create(name="Manual", code="TP-custom", repository=repository)
+
+        case = TestCase.objects.create(name="New", repository=repository)
+
+        assert case.code == "TP-42"
+        assert TestCaseCodeCounter.objects.get(scope_id=project.id).last_number == 42
+
+    @pytest.mark.django_db
+    def test_batch_allocation_reserves_a_range(self, workspace, repository):
+        """Test that a batch gets consecutive codes shared with the repositories of the project"""
+        other_repository = TestCaseRepository.objects.create(
+            name="Other Repository", project=repository.project, workspace=workspace
+        )
+
+        codes = TestCase.allocate_codes(repository, 3)
+        case = TestCase.objects.create(name="New", repository=other_repository)
+
+        assert codes == ["TP-1", "TP-2", "TP-3"]
+        assert case.code == "TP-4"
+
+    @pytest.mark.django_db
+    def test_explicit_code_advances_the_counter(self, repository, project):
+        """Test that a code written by hand is never reserved again"""
+        TestCase.objects.create(name="First", repository=repository)
+        TestCase.objects.create(name="Manual", code="TP-10", repository=repository)
+
+        case = TestCase.objects.create(name="New", repository=repository)
+
+        assert case.code == "TP-11"
+
+    @pytest.mark.django_db
+    def test_collision_reseeds_the_counter(self, repository, project):
+        """Test that a counter behind the existing codes catches up on the first collision"""
+        TestCase.objects.create(name="First", repository=repository)
+        TestCase.objects.bulk_create(
+            [TestCase(name=f"Imported {number}", code=f"TP-{number}", repository=repository) for number in (2, 3)]
+        )
+
+        case = TestCase.objects.create(name="New", repository=repository)
+
+        assert case.code == "TP-4"
+        assert TestCaseCodeCounter.objects.get(scope_id=project.id).last_number == 4
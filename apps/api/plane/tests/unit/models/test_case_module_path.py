@@ -0,0 +1,46 @@
+import pytest
+
+from plane.db.models import CaseModule, TestCaseRepository
+
+
+@pytest.mark.unit
+class TestCaseModulePath:
+    """Test the materialized ancestry paths of test case modules"""
+
+    @pytest.fixture
+    def repository(self, workspace):
+        return TestCaseRepository.objects.create(name="Test Repository", workspace=workspace)
+
+    def create_module(self, repository, name, parent=None):
+        return CaseModule.objects.create(name=name, repository=repository, parent=parent)
+
+    @pytest.mark.django_db
+    def test_descendants_and_ancestors_follow_moves(self, repository):
+        """Test that moving a module rewrites the paths of its whole subtree"""
+        root = self.create_module(repository, "Root")
+        other_root = self.create_module(repository, "Other Root")
+        child = self.create_module(repository, "Child", parent=root)
+        grandchild = self.create_module(repository, "Grandchild", parent=child)
+
+        assert set(root.get_all_children) == {root.id, child.id, grandchild.id}
+        assert CaseModule.ancestor_ids([grandchild.id]) == {root.id, child.id, grandchild.id}
+
+        child.parent = other_root
+        child.save()
+
+        grandchild.refresh_from_db()
+        assert CaseModule.path_ids(grandchild.path) == [other_root.id, child.id, grandchild.id]
+        assert set(root.get_all_children) == {root.id}
+        assert set(CaseModule.descendant_ids([other_root.id])) == {other_root.id, child.id, grandchild.id}
+
+    @pytest.mark.django_db
+    def test_rebuild_paths_repairs_stale_paths(self, repository):
+        """Test that a rebuild recomputes the paths from the parents"""
+        root = self.create_module(repository, "Root")
+        child = self.create_module(repository, "Child", parent=root)
+        CaseModule.all_objects.filter(pk=child.id).update(path="")
+
+        assert CaseModule.rebuild_paths(repository_ids=[repository.id]) == 1
+
+        child.refresh_from_db()
+        assert child.path == f"{root.id.hex}/{child.id.hex}/"
@@ -0,0 +1,88 @@
+import pytest
+from django.utils import timezone
+
+from plane.bgtasks.deletion_task import restore_related_objects
+from plane.db.models import FileAsset, Issue, IssueLink, Project, State
+
+
+@pytest.mark.unit
+class TestIssueCounters:
+    """Test the denormalized link, attachment and sub work item counts of issues"""
+
+    @pytest.fixture
+    def project(self, workspace):
+        return Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+
+    @pytest.fixture
+    def state(self, workspace, project):
+        return State.objects.create(name="Todo", group="unstarted", workspace=workspace, project=project)
+
+    def create_issue(self, workspace, project, state, **kwargs):
+        return Issue.objects.create(name="Test Issue", workspace=workspace, project=project, state=state, **kwargs)
+
+    @pytest.mark.django_db
+    def test_link_and_attachment_counts_follow_changes(self, workspace, project, state):
+        """Test that creating and deleting links and attachments updates the counts"""
+        issue = self.create_issue(workspace, project, state)
+
+        link = IssueLink.objects.create(url="https://plane.so", issue=issue, project=project, workspace=workspace)
+        IssueLink.objects.create(url="https://docs.plane.so", issue=issue, project=project, workspace=workspace)
+        FileAsset.objects.create(
+            asset="attachment.png",
+            issue=issue,
+            project=project,
+            workspace=workspace,
+            entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
+        )
+        issue.refresh_from_db()
+        assert (issue.link_count, issue.attachment_count) == (2, 1)
+
+        link.delete()
+        issue.refresh_from_db()
+        assert issue.link_count == 1
+
+    @pytest.mark.django_db
+    def test_sub_issues_count_follows_reparenting(self, workspace, project, state):
+        """Test that moving, archiving and deleting a sub work item updates its parents"""
+        first_parent = self.create_issue(workspace, project, state)
+        second_parent = self.create_issue(workspace, project, state)
+        sub_issue = self.create_issue(workspace, project, state, parent=first_parent)
+        self.create_issue(workspace, project, state, parent=first_parent)
+
+        first_parent.refresh_from_db()
+        assert first_parent.sub_issues_count == 2
+
+        sub_issue.parent = second_parent
+        sub_issue.save()
+        first_parent.refresh_from_db()
+        second_parent.refresh_from_db()
+        assert (first_parent.sub_issues_count, second_parent.sub_issues_count) == (1, 1)
+
+        sub_issue.delete()
+        second_parent.refresh_from_db()
+        assert second_parent.sub_issues_count == 0
+
+    @pytest.mark.django_db
+    def test_refresh_counters_reconciles_drift(self, workspace, project, state):
+        """Test that a recount repairs counts changed behind the signals"""
+        parent = self.create_issue(workspace, project, state)
+        self.create_issue(workspace, project, state, parent=parent)
+        Issue.all_objects.filter(pk=parent.id).update(sub_issues_count=7, link_count=3)
+
+        Issue.refresh_counters([parent.id])
+
+        parent.refresh_from_db()
+        assert (parent.sub_issues_count, parent.link_count, parent.attachment_count) == (1, 0, 0)
+
+    @pytest.mark.django_db
+    def test_restore_recounts_the_parent(self, workspace, project, state):
+        """Test that restoring a sub work item outside of save still updates its parent"""
+        parent = self.create_issue(workspace, project, state)
+        sub_issue = self.create_issue(workspace, project, state, parent=parent)
+        Issue.all_objects.filter(pk=sub_issue.id).update(deleted_at=timezone.now())
+        Issue.refresh_counters([parent.id])
+
+        restore_related_objects("db", "issue", sub_issue.id)
+
+        parent.refresh_from_db()
+        assert parent.sub_issues_count == 1
@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.db import connection
+
+from plane.db.models import Issue, IssueSequence, IssueSequenceCounter, Project, State
+
+
+@pytest.mark.unit
+class TestIssueSequence:
+    """Test the allocation of issue sequence ids"""
+
+    @pytest.fixture
+    def project(self, workspace):
+        return Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+
+    @pytest.fixture
+    def state(self, workspace, project):
+        return State.objects.create(name="Todo", group="unstarted", workspace=workspace, project=project)
+
+    @pytest.mark.django_db(transaction=True)
+    def test_concurrent_creation_has_no_duplicate_sequences(self, workspace, project, state):
+        """Test that issues created concurrently in one project get distinct sequence ids"""
+
+        def create_issues(worker):
+            try:
+                return [
+                    Issue.objects.create(
+                        name=f"Issue {worker}-{index}", workspace=workspace, project=project, state=state
+                    ).sequence_id
+                    for index in range(10)
+                ]
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sequence_ids = [sequence_id for ids in executor.map(create_issues, range(8)) for sequence_id in ids]
+
+        assert sorted(sequence_ids) == list(range(1, 81))
+        assert IssueSequenceCounter.objects.get(project=project).last_sequence == 80
+
+    @pytest.mark.django_db
+    def test_bulk_create_reserves_sequences(self, workspace, project, state):
+        """Test that bulk created issues continue the project's sequence"""
+        Issue.objects.create(name="First", workspace=workspace, project=project, state=state)
+
+        issues = Issue.bulk_create_with_sequences(
+            [Issue(name=f"Issue {index}", workspace=workspace, project=project, state=state) for index in range(5)]
+        )
+
+        assert [issue.sequence_id for issue in issues] == [2, 3, 4, 5, 6]
+        assert IssueSequence.objects.filter(project=project).count() == 6
+        assert len({issue.sort_order for issue in issues}) == 5
+        assert Issue.objects.create(name="Last", workspace=workspace, project=project, state=state).sequence_id == 7
+
+    @pytest.mark.django_db
+    def test_counter_is_seeded_from_existing_sequences(self, workspace, project, state):
+        """Test that a project without a counter continues after its largest sequence"""
+        issue = Issue.objects.create(name="First", workspace=workspace, project=project, state=state)
+        IssueSequenceCounter.objects.filter(project=project).delete()
+        IssueSequence.objects.filter(issue=issue).update(sequence=41)
+
+        assert IssueSequenceCounter.reserve(project.id, count=3) == 42
+        assert IssueSequenceCounter.objects.get(project=project).last_sequence == 44
@@ -1,7 +1,15 @@
 import os
 from unittest.mock import Mock, patch
 import pytest
-from plane.settings.storage import S3Storage
+from plane.settings.storage import S3Storage, clear_s3_clients
+
+
+@pytest.fixture(autouse=True)
+def fresh_s3_clients():
+    """Start every test without shared clients or cached presigned URLs"""
+    clear_s3_clients()
+    yield
+    clear_s3_clients()
 
 
 @pytest.mark.unit
@@ -200,3 +208,56 @@ class TestS3StorageSignedURLExpiration:
         mock_s3_client.generate_presigned_url.assert_called_once()
         call_kwargs = mock_s3_client.generate_presigned_url.call_args[1]
         assert call_kwargs["ExpiresIn"] == 120
+
+
+@pytest.mark.unit
+class TestS3StorageClientPool:
+    """Test the shared S3 clients and the presigned URL cache of S3Storage"""
+
+    @patch.dict(os.environ, {"AWS_ACCESS_KEY_ID": "test-key", "AWS_S3_BUCKET_NAME": "test-bucket"}, clear=True)
+    @patch("plane.settings.storage.boto3")
+    def test_client_is_shared_per_configuration(self, mock_boto3):
+        """Test that storages with the same endpoint and credentials share one client"""
+        mock_boto3.client.side_effect = lambda *args, **kwargs: Mock()
+
+        first, second = S3Storage(), S3Storage()
+        with patch.dict(os.environ, {"AWS_S3_ENDPOINT_URL": "http://other-endpoint"}):
+            other = S3Storage()
+
+        assert first.s3_client is second.s3_client
+        assert other.s3_client is not first.s3_client
+        assert mock_boto3.client.call_count == 2
+
+    @patch.dict(os.environ, {"AWS_ACCESS_KEY_ID": "test-key", "AWS_S3_BUCKET_NAME": "test-bucket"}, clear=True)
+    @patch("plane.settings.storage.boto3")
+    def test_presigned_url_is_cached_per_key_and_disposition(self, mock_boto3):
+        """Test that signing the same object twice reuses the first URL"""
+        mock_s3_client = Mock()
+        mock_s3_client.generate_presigned_url.side_effect = lambda *args, **kwargs: kwargs["Params"]["Key"]
+        mock_boto3.client.return_value = mock_s3_client
+
+        storage = S3Storage()
+        storage.generate_presigned_url("first-object", filename="image.png")
+        S3Storage().generate_presigned_url("first-object", filename="image.png")
+        storage.generate_presigned_url("first-object", disposition="attachment", filename="image.png")
+        storage.generate_presigned_url("second-object", filename="image.png")
+
+        assert mock_s3_client.generate_presigned_url.call_count == 3
+
+    @patch.dict(
+        os.environ,
+        {"AWS_ACCESS_KEY_ID": "test-key", "AWS_S3_BUCKET_NAME": "test-bucket", "SIGNED_URL_CACHE_TTL": "0"},
+        clear=True,
+    )
+    @patch("plane.settings.storage.boto3")
+    def test_presigned_url_cache_can_be_disabled(self, mock_boto3):
+        """Test that a zero cache TTL signs every request"""
+        mock_s3_client = Mock()
+        mock_s3_client.generate_presigned_url.return_value = "https://test-url.com"
+        mock_boto3.client.return_value = mock_s3_client
+
+        storage = S3Storage()
+        storage.generate_presigned_url("test-object", filename="image.png")
+        storage.generate_presigned_url("test-object", filename="image.png")
+
+        assert mock_s3_client.generate_presigned_url.call_count == 2
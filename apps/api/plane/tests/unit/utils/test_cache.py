@@ -0,0 +1,81 @@
+from unittest.mock import Mock
+
+import pytest
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from plane.utils.cache import (
+    cache_response,
+    get_cache_namespace,
+    get_cache_stats,
+    invalidate_cache_directly,
+)
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def make_request(path, user_id="user-1"):
+    request = Mock()
+    request.get_full_path.return_value = path
+    request.user.is_anonymous = False
+    request.user.id = user_id
+    return request
+
+
+class LabelsView:
+    calls = 0
+
+    @cache_response(60)
+    def get(self, request):
+        LabelsView.calls += 1
+        return Response({"calls": LabelsView.calls})
+
+
+@pytest.mark.unit
+class TestVersionedCache:
+    """Test the generation based cache invalidation"""
+
+    @pytest.fixture(autouse=True)
+    def locmem_cache(self, settings):
+        settings.CACHES = LOCMEM_CACHES
+        settings.DEBUG = False
+        cache.clear()
+
+    def test_namespace_ignores_query_string_and_api_prefix(self):
+        """Test that path variants share one namespace"""
+        assert get_cache_namespace("/api/workspaces/slug/labels/?x=1") == "workspaces/slug/labels"
+        assert get_cache_namespace("workspaces/slug/labels/") == "workspaces/slug/labels"
+
+    def test_invalidation_bumps_generation_for_all_variants(self):
+        """Test that invalidating a path drops every cached variant without scanning keys"""
+        view = LabelsView()
+        LabelsView.calls = 0
+
+        view.get(make_request("/api/workspaces/slug/labels/"))
+        view.get(make_request("/api/workspaces/slug/labels/?project=1"))
+        view.get(make_request("/api/workspaces/slug/labels/"))
+        assert LabelsView.calls == 2
+
+        invalidate_cache_directly(
+            path="/api/workspaces/slug/labels/", user=False, request=make_request("/"), multiple=True
+        )
+        view.get(make_request("/api/workspaces/slug/labels/"))
+        view.get(make_request("/api/workspaces/slug/labels/?project=1"))
+        assert LabelsView.calls == 4
+
+        stats = get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 4
+        assert stats["invalidations"] == 1
+
+    def test_user_invalidation_keeps_other_users_entries(self):
+        """Test that a user scoped invalidation only drops that user's entries"""
+        view = LabelsView()
+        LabelsView.calls = 0
+
+        view.get(make_request("/api/workspaces/slug/labels/", "user-1"))
+        view.get(make_request("/api/workspaces/slug/labels/", "user-2"))
+        invalidate_cache_directly(path="/api/workspaces/slug/labels/", request=make_request("/", "user-1"))
+        view.get(make_request("/api/workspaces/slug/labels/", "user-1"))
+        view.get(make_request("/api/workspaces/slug/labels/", "user-2"))
+        assert LabelsView.calls == 3
@@ -0,0 +1,92 @@
+import pytest
+
+from plane.db.models import CaseModule, Project, TestCase, TestCaseRepository, TestCaseVersion
+from plane.utils.case_import import import_cases
+
+
+@pytest.mark.unit
+class TestImportCases:
+    """Test the bulk import of parsed test case rows"""
+
+    @pytest.fixture
+    def repository(self, workspace):
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        return TestCaseRepository.objects.create(name="Repository", project=project, workspace=workspace)
+
+    @pytest.mark.django_db
+    def test_rows_are_upserted_by_code(self, repository, create_user):
+        """Test that known codes update their case and new rows get a code, a module and a version"""
+        existing = TestCase.objects.create(name="Old name", code="TP-7", repository=repository)
+        TestCaseVersion.create_from_case(existing)
+
+        result = import_cases(
+            repository.id,
+            [
+                {"code": "TP-7", "name": "Login", "priority": "HIGH", "module": "Account"},
+                {"name": "Logout", "module": "Account"},
+                {"name": "Broken", "priority": "URGENT"},
+            ],
+            create_user.id,
+        )
+
+        assert result["total_count"] == 3
+        assert result["success_count"] == 2
+        assert [fail["name"] for fail in result["fail"]] == ["Broken"]
+
+        module = CaseModule.objects.get(repository=repository, name="Account")
+        assert module.path == f"{module.id.hex}/"
+
+        existing.refresh_from_db()
+        assert existing.name == "Login"
+        assert existing.priority == TestCase.Priority.HIGH
+        assert existing.module_id == module.id
+
+        created = TestCase.objects.get(repository=repository, name="Logout")
+        assert created.code == "TP-8"
+        assert created.module_id == module.id
+        assert created.created_by_id == create_user.id
+
+        assert list(existing.versions.order_by("version").values_list("version", flat=True)) == [1.0, 1.1]
+        assert list(created.versions.values_list("version", "name")) == [(1.0, "Logout")]
+
+    @pytest.mark.django_db
+    def test_existing_module_is_reused(self, repository, create_user):
+        """Test that a module already in the repository is not created again"""
+        module = CaseModule.objects.create(repository=repository, name="Account")
+
+        import_cases(repository.id, [{"name": "Login", "module": "Account"}], create_user.id)
+
+        assert CaseModule.objects.filter(repository=repository, name="Account").count() == 1
+        assert TestCase.objects.get(repository=repository, name="Login").module_id == module.id
+
+    @pytest.mark.django_db
+    def test_reserved_code_never_overwrites_a_case(self, repository, create_user):
+        """Test that blank code rows are created next to the explicit codes of the same import"""
+        result = import_cases(
+            repository.id,
+            [{"name": "Blank"}, {"code": "TP-1", "name": "Explicit"}, {"name": "Another blank"}],
+            create_user.id,
+        )
+
+        assert result["success_count"] == 3
+        assert set(TestCase.objects.filter(repository=repository).values_list("code", "name")) == {
+            ("TP-1", "Explicit"),
+            ("TP-2", "Blank"),
+            ("TP-3", "Another blank"),
+        }
+
+    @pytest.mark.django_db
+    def test_failing_row_does_not_fail_its_chunk(self, repository, create_user):
+        """Test that a row the database rejects is reported on its own"""
+        result = import_cases(
+            repository.id,
+            [{"name": "Login"}, {"name": "x" * 300}, {"name": "Logout"}],
+            create_user.id,
+        )
+
+        assert result["success_count"] == 2
+        assert [fail["name"] for fail in result["fail"]] == ["x" * 300]
+        assert set(TestCase.objects.filter(repository=repository).values_list("name", flat=True)) == {
+            "Login",
+            "Logout",
+        }
@@ -0,0 +1,54 @@
+from unittest.mock import patch
+
+import pytest
+
+from plane.db.models import Cycle, CycleIssue, Issue, Project, State
+from plane.utils.cycle_transfer_issues import transfer_cycle_issues
+
+
+@pytest.mark.unit
+class TestTransferCycleIssues:
+    """Test the single statement transfer of incomplete cycle work items"""
+
+    @pytest.mark.django_db
+    @patch("plane.utils.cycle_transfer_issues.burndown_plot", return_value={})
+    @patch("plane.utils.cycle_transfer_issues.issue_activity.delay")
+    def test_moves_only_incomplete_issues(self, issue_activity, burndown_plot, workspace, create_user):
+        """Test that completed and already transferred work items stay where they are"""
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        todo = State.objects.create(name="Todo", group="unstarted", project=project, workspace=workspace)
+        done = State.objects.create(name="Done", group="completed", project=project, workspace=workspace)
+        old_cycle, new_cycle = [
+            Cycle.objects.create(name=name, project=project, workspace=workspace, owned_by=create_user)
+            for name in ("Old Cycle", "New Cycle")
+        ]
+        pending, completed, duplicate = [
+            Issue.objects.create(name=name, state=state, project=project, workspace=workspace)
+            for name, state in (("Pending", todo), ("Completed", done), ("Duplicate", todo))
+        ]
+        CycleIssue.objects.bulk_create(
+            [
+                CycleIssue(cycle=old_cycle, issue=issue, project=project, workspace=workspace)
+                for issue in (pending, completed, duplicate)
+            ]
+            + [CycleIssue(cycle=new_cycle, issue=duplicate, project=project, workspace=workspace)]
+        )
+
+        result = transfer_cycle_issues(
+            slug=workspace.slug,
+            project_id=project.id,
+            cycle_id=old_cycle.id,
+            new_cycle_id=new_cycle.id,
+            user_id=create_user.id,
+            origin="http://localhost",
+        )
+
+        assert result == {"success": True, "transferred_issues": 1}
+        assert set(CycleIssue.objects.filter(cycle=old_cycle).values_list("issue_id", flat=True)) == {
+            completed.id,
+            duplicate.id,
+        }
+        old_cycle.refresh_from_db()
+        assert old_cycle.progress_snapshot["total_issues"] == 3
+        assert old_cycle.progress_snapshot["completed_issues"] == 1
+        assert issue_activity.call_count == 1
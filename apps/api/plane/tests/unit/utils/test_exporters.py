@@ -0,0 +1,52 @@
+import io
+import json
+
+import pytest
+from openpyxl import load_workbook
+
+from plane.utils.exporters import CSVFormatter, ExportSchema, JSONFormatter, ListField, StringField, XLSXFormatter
+
+
+class SampleExportSchema(ExportSchema):
+    name = StringField(label="Name")
+    labels = ListField(label="Labels")
+
+
+def sample_records(count):
+    for index in range(count):
+        yield {"name": f"Issue {index}", "labels": ["bug", f"label-{index}"]}
+
+
+@pytest.mark.unit
+class TestStreamingFormatters:
+    """Test that the formatters write records incrementally"""
+
+    def test_csv_streams_rows(self):
+        """Test that CSV rows are written from a generator with the header first"""
+        buffer = io.BytesIO()
+        CSVFormatter().write(buffer, sample_records(3), SampleExportSchema)
+
+        lines = buffer.getvalue().decode("utf-8").splitlines()
+        assert lines[0] == '"Name","Labels"'
+        assert lines[3] == '"Issue 2","bug, label-2"'
+
+    def test_csv_without_records_is_empty(self):
+        """Test that an empty CSV export has no header"""
+        assert CSVFormatter().format("issues", [], SampleExportSchema) == ("issues.csv", "")
+
+    def test_json_matches_json_dumps(self):
+        """Test that the streamed JSON array is identical to dumping the whole list"""
+        filename, content = JSONFormatter().format("issues", list(sample_records(3)), SampleExportSchema)
+
+        assert filename == "issues.json"
+        assert content == json.dumps([{"Name": r["name"], "Labels": r["labels"]} for r in sample_records(3)])
+        assert JSONFormatter().format("issues", [], SampleExportSchema)[1] == "[]"
+
+    def test_xlsx_write_only_workbook(self):
+        """Test that the write-only XLSX workbook contains every row"""
+        buffer = io.BytesIO()
+        XLSXFormatter().write(buffer, sample_records(50), SampleExportSchema)
+
+        sheet = load_workbook(buffer).active
+        assert sheet.max_row == 51
+        assert sheet["A51"].value == "Issue 49"
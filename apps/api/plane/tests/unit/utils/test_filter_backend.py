@@ -0,0 +1,96 @@
+from unittest.mock import patch
+
+import pytest
+from django.db.models import Q
+
+from plane.db.models import Issue, IssueAssignee, IssueLabel, Label, Project, ProjectMember
+from plane.utils.filters import ComplexFilterBackend, IssueFilterSet
+from plane.utils.filters.filter_backend import _compiled_filters
+
+
+class IssueFilterView:
+    filterset_class = IssueFilterSet
+
+
+@pytest.fixture(autouse=True)
+def clear_compiled_filters():
+    _compiled_filters.clear()
+    yield
+    _compiled_filters.clear()
+
+
+def apply_filter(queryset, filter_data):
+    return ComplexFilterBackend().filter_queryset(None, queryset, IssueFilterView(), filter_data=filter_data)
+
+
+@pytest.mark.unit
+class TestComplexFilterBackend:
+    """Test the semi-join relation filters and the compiled filter cache"""
+
+    def test_relation_filters_use_exists(self):
+        """Test that relation filters compile to EXISTS instead of joins"""
+        label_id = "5f3ac6d4-7d4b-4d7e-9c5e-0b8b6d9f1a11"
+        queryset = apply_filter(Issue.objects.all(), {"or": [{"label_id__in": [label_id]}, {"assignee_id": label_id}]})
+
+        sql = str(queryset.query)
+
+        assert sql.count("EXISTS") == 2
+        assert 'JOIN "issue_labels"' not in sql
+        assert "DISTINCT" not in sql
+
+    def test_compiled_filter_is_reused_across_key_order(self):
+        """Test that the same filter with a different key order is built once"""
+        first = {"and": [{"priority": "high", "state_group": "started"}]}
+        second = {"and": [{"state_group": "started", "priority": "high"}]}
+
+        with patch.object(ComplexFilterBackend, "_evaluate_node", wraps=ComplexFilterBackend()._evaluate_node) as node:
+            first_sql = str(apply_filter(Issue.objects.all(), first).query)
+            second_sql = str(apply_filter(Issue.objects.all(), second).query)
+
+        assert node.call_count == 2
+        assert first_sql == second_sql
+        assert len(_compiled_filters) == 1
+
+    @pytest.mark.django_db
+    def test_exists_filters_match_join_filters(self, create_user, workspace, django_assert_num_queries):
+        """Test that the semi-join filters return the rows of the join and DISTINCT filters without the fan-out"""
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        ProjectMember.objects.create(project=project, member=create_user)
+        labels = [
+            Label.objects.create(name=f"Label {index}", project=project, workspace=workspace) for index in range(4)
+        ]
+        issues = [
+            Issue.objects.create(name=f"Issue {index}", workspace=workspace, project=project) for index in range(40)
+        ]
+        issue_labels = IssueLabel.objects.bulk_create(
+            [
+                IssueLabel(issue=issue, label=label, project=project, workspace=workspace)
+                for index, issue in enumerate(issues)
+                for label in labels[: index % 4 + 1]
+            ]
+        )
+        IssueAssignee.objects.bulk_create(
+            [IssueAssignee(issue=issue, assignee=create_user, project=project, workspace=workspace) for issue in issues]
+        )
+        label_ids = [str(label.id) for label in labels]
+        queryset = Issue.issue_objects.filter(project=project)
+
+        joined = queryset.filter(
+            Q(label_issue__label_id__in=label_ids, label_issue__deleted_at__isnull=True),
+            Q(issue_assignee__assignee_id=create_user.id, issue_assignee__deleted_at__isnull=True),
+        )
+        joined_ids = list(joined.distinct().values_list("id", flat=True))
+
+        exists = apply_filter(queryset, {"label_id__in": label_ids, "assignee_id": str(create_user.id)})
+        with django_assert_num_queries(1):
+            exists_ids = list(exists.values_list("id", flat=True))
+
+        # The join yields a row per label that DISTINCT has to fold back, the semi-join yields each issue once
+        assert joined.count() == len(issue_labels)
+        sql = str(exists.query)
+        assert "DISTINCT" not in sql
+        assert 'JOIN "issue_labels"' not in sql
+        assert 'JOIN "issue_assignees"' not in sql
+
+        assert len(exists_ids) == len(set(exists_ids)) == len(issues)
+        assert set(exists_ids) == set(joined_ids)
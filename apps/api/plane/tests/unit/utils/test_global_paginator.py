@@ -0,0 +1,87 @@
+import uuid
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.db.models import Q
+from django.utils import timezone
+
+from plane.db.models import Issue, Project, ProjectMember
+from plane.utils.global_paginator import DeltaSyncCursor, delta_sync
+
+
+@pytest.mark.unit
+class TestDeltaSyncCursor:
+    """Test the delta sync cursor token format"""
+
+    def test_cursor_round_trip(self):
+        """Test that the window and position keep their microseconds"""
+        until = timezone.now()
+        cursor = DeltaSyncCursor(until - timedelta(days=1), until, (until - timedelta(microseconds=7), uuid.uuid4()))
+
+        parsed = DeltaSyncCursor.from_string(str(cursor))
+
+        assert parsed.since == cursor.since
+        assert parsed.until == cursor.until
+        assert parsed.position == (cursor.position[0], str(cursor.position[1]))
+
+    def test_invalid_cursor_raises_value_error(self):
+        """Test that a malformed token is rejected"""
+        with pytest.raises(ValueError):
+            DeltaSyncCursor.from_string("not-a-cursor")
+
+
+@pytest.mark.unit
+class TestDeltaSync:
+    """Test the keyset delta sync of the project work items"""
+
+    @pytest.fixture
+    def project(self, create_user, workspace):
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        ProjectMember.objects.create(project=project, member=create_user)
+        return project
+
+    def sync(self, project, cursor=None, sync_token=None):
+        return delta_sync(
+            queryset=Issue.issue_objects.filter(project=project),
+            tombstone_queryset=Issue.all_objects.filter(project=project).filter(
+                Q(archived_at__isnull=False) | Q(deleted_at__isnull=False)
+            ),
+            cursor=cursor,
+            sync_token=sync_token,
+            on_result=lambda results: list(results.values("id", "name")),
+            page_size=2,
+        )
+
+    @pytest.mark.django_db
+    @patch("plane.utils.global_paginator.DELTA_SYNC_LAG", timedelta(0))
+    def test_sync_sends_every_row_once_and_tombstones(self, workspace, project):
+        """Test that rows updated mid sync wait for the next sync and deletions become tombstones"""
+        past = timezone.now() - timedelta(minutes=5)
+        issues = [
+            Issue.objects.create(name=f"Issue {index}", workspace=workspace, project=project) for index in range(5)
+        ]
+        Issue.all_objects.filter(project=project).update(updated_at=past)
+
+        first_page = self.sync(project)
+        synced_ids = [row["id"] for row in first_page["results"]]
+        # Updated while the sync runs, after the high-water mark of the sync
+        pending = next(issue for issue in issues if issue.id not in synced_ids)
+        Issue.objects.filter(pk=pending.id).update(updated_at=timezone.now())
+
+        cursor = first_page["next_cursor"]
+        while cursor:
+            page = self.sync(project, cursor=cursor)
+            synced_ids += [row["id"] for row in page["results"]]
+            cursor = page["next_cursor"]
+
+        assert len(synced_ids) == len(set(synced_ids)) == 4
+        assert pending.id not in synced_ids
+
+        deleted = next(issue for issue in issues if issue.id != pending.id)
+        Issue.all_objects.filter(pk=deleted.id).update(deleted_at=timezone.now(), updated_at=timezone.now())
+
+        next_sync = self.sync(project, sync_token=first_page["sync_token"])
+
+        assert [row["id"] for row in next_sync["results"]] == [pending.id]
+        assert next_sync["deleted"] == [deleted.id]
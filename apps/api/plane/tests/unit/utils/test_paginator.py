@@ -0,0 +1,208 @@
+import datetime
+import uuid
+
+import pytest
+from django.db.models import Q
+
+from plane.db.models import Issue, IssueAssignee, IssueLabel, Label, Project, User
+from plane.utils.grouper import issue_queryset_grouper
+from plane.utils.paginator import (
+    Cursor,
+    GroupedOffsetPaginator,
+    KeysetCursor,
+    SubGroupedOffsetPaginator,
+)
+
+ISSUE_COUNT = 1000
+LABEL_COUNT = 20
+LABELS_PER_ISSUE = 5
+SUB_GROUP_ISSUE_COUNT = 20
+SUB_GROUP_FIELD_COUNT = 5
+SUB_GROUP_FIELDS_PER_ISSUE = 2
+
+
+@pytest.mark.unit
+class TestKeysetCursor:
+    """Test the keyset cursor string format"""
+
+    def test_first_page_cursor_is_compatible_with_offset_cursor(self):
+        """Test that a cursor without a position keeps the offset format"""
+        cursor = KeysetCursor.from_string("100:0:0")
+        assert cursor.position is None
+        assert cursor.total is None
+        assert str(cursor) == str(Cursor(100, 0, False))
+
+    def test_cursor_round_trip(self):
+        """Test that the position and total survive the string format"""
+        cursor = KeysetCursor(
+            50,
+            3,
+            True,
+            position=["2024-01-01T00:00:00Z", "2024-01-01T00:00:00Z", "9f5b7a0e-1f3c-4c8e-9a5c-2f1f4f9e5b21"],
+            total=1234,
+        )
+        parsed = KeysetCursor.from_string(str(cursor))
+        assert parsed.value == 50
+        assert parsed.offset == 3
+        assert parsed.is_prev is True
+        assert parsed.position == cursor.position
+        assert parsed.total == 1234
+
+    def test_position_keeps_microseconds(self):
+        """Test that datetimes in the position are not truncated to milliseconds"""
+        updated_at = datetime.datetime(2024, 1, 1, 0, 0, 0, 123456, tzinfo=datetime.timezone.utc)
+        cursor = KeysetCursor(50, 1, False, position=[updated_at, "9f5b7a0e-1f3c-4c8e-9a5c-2f1f4f9e5b21"])
+
+        parsed = KeysetCursor.from_string(str(cursor))
+
+        assert parsed.position == [updated_at, "9f5b7a0e-1f3c-4c8e-9a5c-2f1f4f9e5b21"]
+
+    def test_invalid_cursor_raises_value_error(self):
+        """Test that malformed cursors are rejected"""
+        with pytest.raises(ValueError):
+            KeysetCursor.from_string("50:1:0:not-a-token")
+        with pytest.raises(ValueError):
+            KeysetCursor.from_string("50:1")
+
+
+@pytest.mark.unit
+class TestGroupedOffsetPaginator:
+    """Test the per group totals of the grouped paginator"""
+
+    @pytest.mark.django_db
+    def test_group_totals_count_each_issue_once(self, workspace):
+        """Test that an issue with several labels counts once in each of its label groups"""
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        labels = [
+            Label.objects.create(name=name, project=project, workspace=workspace) for name in ("Bug", "UI", "API")
+        ]
+        tagged, single = [
+            Issue.objects.create(name=name, project=project, workspace=workspace) for name in ("Tagged", "Single")
+        ]
+        IssueLabel.objects.bulk_create(
+            [IssueLabel(issue=tagged, label=label, project=project, workspace=workspace) for label in labels]
+            + [IssueLabel(issue=single, label=labels[0], project=project, workspace=workspace)]
+        )
+
+        paginator = GroupedOffsetPaginator(
+            queryset=issue_queryset_grouper(
+                Issue.issue_objects.filter(project=project), group_by="labels__id", sub_group_by=None
+            ).values("id", "labels__id", "created_at"),
+            group_by_field_name="labels__id",
+            group_by_fields=[label.id for label in labels],
+            count_filter=Q(Q(issue_intake__isnull=True), archived_at__isnull=True, is_draft=False),
+            order_by="-created_at",
+        )
+        result = paginator.get_result(limit=50)
+        processed = paginator.process_results(results=list(result.results))
+
+        assert {group: stats["total"] for group, stats in paginator.group_stats.items()} == {
+            str(labels[0].id): 2,
+            str(labels[1].id): 1,
+            str(labels[2].id): 1,
+        }
+        assert {group: len(data["results"]) for group, data in processed.items()} == {
+            str(labels[0].id): 2,
+            str(labels[1].id): 1,
+            str(labels[2].id): 1,
+        }
+        assert all(data["total_results"] == len(data["results"]) for data in processed.values())
+
+
+@pytest.mark.unit
+class TestMultiGrouper:
+    """Test grouping a page over m2m fields"""
+
+    @pytest.fixture
+    def labels(self):
+        return [str(uuid.uuid4()) for _ in range(LABEL_COUNT)]
+
+    def test_group_by_labels(self, labels):
+        """Test that every issue lands once in each of its label groups"""
+        rows = [
+            {"id": f"issue-{issue}", "labels__id": labels[(issue + offset) % LABEL_COUNT]}
+            for issue in range(ISSUE_COUNT)
+            for offset in range(LABELS_PER_ISSUE)
+        ]
+        # The totals computed with the page are reused, grouping runs no query on the queryset
+        paginator = GroupedOffsetPaginator(
+            queryset=None, group_by_field_name="labels__id", group_by_fields=labels, count_filter=None
+        )
+        paginator.group_stats = {label: {"total": 0, "rows": 0} for label in labels}
+
+        processed = paginator.process_results(results=rows)
+
+        assert sum(len(group["results"]) for group in processed.values()) == ISSUE_COUNT * LABELS_PER_ISSUE
+        assert all(
+            len(group["results"]) == ISSUE_COUNT * LABELS_PER_ISSUE // LABEL_COUNT for group in processed.values()
+        )
+        assert all(len(row["label_ids"]) == LABELS_PER_ISSUE for row in rows)
+
+    @pytest.mark.django_db
+    def test_sub_group_by_assignees(self, workspace, django_assert_max_num_queries):
+        """Test grouping by labels and sub grouping by assignees with the totals read in two queries"""
+        project = Project.objects.create(name="Test Project", identifier="TP", workspace=workspace)
+        labels = [
+            Label.objects.create(name=f"Label {index}", project=project, workspace=workspace)
+            for index in range(SUB_GROUP_FIELD_COUNT)
+        ]
+        assignees = [
+            User.objects.create(email=f"assignee-{index}@plane.so", username=f"assignee-{index}")
+            for index in range(SUB_GROUP_FIELD_COUNT)
+        ]
+        issues = [
+            Issue.objects.create(name=f"Issue {index}", project=project, workspace=workspace)
+            for index in range(SUB_GROUP_ISSUE_COUNT)
+        ]
+        IssueLabel.objects.bulk_create(
+            [
+                IssueLabel(
+                    issue=issue,
+                    label=labels[(index + offset) % SUB_GROUP_FIELD_COUNT],
+                    project=project,
+                    workspace=workspace,
+                )
+                for index, issue in enumerate(issues)
+                for offset in range(SUB_GROUP_FIELDS_PER_ISSUE)
+            ]
+        )
+        IssueAssignee.objects.bulk_create(
+            [
+                IssueAssignee(
+                    issue=issue,
+                    assignee=assignees[(index + offset) % SUB_GROUP_FIELD_COUNT],
+                    project=project,
+                    workspace=workspace,
+                )
+                for index, issue in enumerate(issues)
+                for offset in range(SUB_GROUP_FIELDS_PER_ISSUE)
+            ]
+        )
+
+        paginator = SubGroupedOffsetPaginator(
+            queryset=issue_queryset_grouper(
+                Issue.issue_objects.filter(project=project), group_by="labels__id", sub_group_by="assignees__id"
+            ).values("id", "labels__id", "assignees__id", "created_at"),
+            group_by_field_name="labels__id",
+            sub_group_by_field_name="assignees__id",
+            group_by_fields=[label.id for label in labels],
+            sub_group_by_fields=[assignee.id for assignee in assignees],
+            count_filter=Q(Q(issue_intake__isnull=True), archived_at__isnull=True, is_draft=False),
+            order_by="-created_at",
+        )
+        rows = list(paginator.get_result(limit=1000).results)
+
+        with django_assert_max_num_queries(2):
+            processed = paginator.process_results(results=rows)
+
+        placed = sum(
+            len(sub_group["results"]) for group in processed.values() for sub_group in group["results"].values()
+        )
+        assert placed == len(rows) == SUB_GROUP_ISSUE_COUNT * SUB_GROUP_FIELDS_PER_ISSUE * SUB_GROUP_FIELDS_PER_ISSUE
+        assert all(len(row["label_ids"]) == SUB_GROUP_FIELDS_PER_ISSUE for row in rows)
+        assert all(len(row["assignee_ids"]) == SUB_GROUP_FIELDS_PER_ISSUE for row in rows)
+        assert all(
+            group["total_results"]
+            == len({row["id"] for sub_group in group["results"].values() for row in sub_group["results"]})
+            for group in processed.values()
+        )
@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+import pytest
+
+from plane.utils.qa_tree import build_case_tree, build_module_tree
+
+MODULES = [
+    {"id": "root-b", "name": "beta", "parent_id": None},
+    {"id": "root-a", "name": "Alpha", "parent_id": None},
+    {"id": "child", "name": "Child", "parent_id": "root-a"},
+    {"id": "grandchild", "name": "Grandchild", "parent_id": "child"},
+]
+
+
+@pytest.mark.unit
+class TestQATree:
+    """Test the shared QA module tree builder"""
+
+    def test_subtree_counts_are_totalled(self):
+        """Test that every module counts the cases of its whole subtree"""
+        tree = build_module_tree("repo", MODULES, module_counts={"grandchild": 2, "child": 1, "root-b": 4})
+
+        assert [node["id"] for node in tree] == ["root-a", "root-b"]
+        assert [node["count"] for node in tree] == [3, 4]
+        assert tree[0]["children"][0]["children"][0]["count"] == 2
+
+    def test_module_ids_keep_their_ancestors(self):
+        """Test that a limited tree keeps the path from the roots to the modules"""
+        tree = build_module_tree("repo", MODULES, module_ids={"grandchild"})
+
+        assert [node["id"] for node in tree] == ["root-a"]
+        assert tree[0]["children"][0]["children"][0]["id"] == "grandchild"
+        assert "count" not in tree[0]
+
+    @patch("plane.utils.qa_tree.get_repository_modules", return_value={"repo": MODULES})
+    def test_case_tree_counts_repository_cases(self, get_repository_modules):
+        """Test that repository totals include the cases outside any module"""
+        root = build_case_tree([("repo", "Repository")], case_counts={("repo", None): 5, ("repo", "child"): 1})
+
+        repository = root["children"][0]
+        assert root["count"] == repository["count"] == repository["children"][0]["count"] == 6
+        assert repository["children"][0]["children"][0]["count"] == 1
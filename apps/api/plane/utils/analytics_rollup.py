@@ -0,0 +1,55 @@
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Tuple
+
+# Django imports
+from django.db.models import Q, QuerySet, Sum
+from django.db.models.functions import Coalesce, TruncMonth
+
+# Response keys of the work item counts per state group
+STATE_GROUP_COUNT_KEYS = {
+    "started": "started_work_items",
+    "backlog": "backlog_work_items",
+    "unstarted": "un_started_work_items",
+    "completed": "completed_work_items",
+    "cancelled": "cancelled_work_items",
+}
+
+
+def rollup_count(state_group: Optional[str] = None) -> Coalesce:
+    """Sum of the rolled up work items, optionally of one state group"""
+    if state_group is None:
+        return Coalesce(Sum("issue_count"), 0)
+    return Coalesce(Sum("issue_count", filter=Q(state_group=state_group)), 0)
+
+
+def filter_rollups_by_date(
+    rollups: QuerySet, date_range: Optional[Tuple[date | datetime, date | datetime]]
+) -> QuerySet:
+    """Filter rollups to the creation dates of an analytics or chart date range"""
+    if not date_range:
+        return rollups
+
+    start_date, end_date = date_range
+    if isinstance(start_date, datetime):
+        start_date = start_date.date()
+    if isinstance(end_date, datetime):
+        end_date = end_date.date()
+    return rollups.filter(date__gte=start_date, date__lte=end_date)
+
+
+def get_rollup_state_group_counts(rollups: QuerySet) -> Dict[str, int]:
+    """Total work items and the work items of every state group in one query"""
+    return rollups.aggregate(
+        total_work_items=rollup_count(),
+        **{key: rollup_count(state_group) for state_group, key in STATE_GROUP_COUNT_KEYS.items()},
+    )
+
+
+def get_rollup_monthly_stats(rollups: QuerySet) -> QuerySet[Dict[str, Any]]:
+    """Created and completed work items per month of creation"""
+    return (
+        rollups.annotate(month=TruncMonth("date"))
+        .values("month")
+        .annotate(created_count=rollup_count(), completed_count=rollup_count("completed"))
+        .order_by("month")
+    )
@@ -1,4 +1,5 @@
 # Python imports
+import time
 from functools import wraps
 
 # Django imports
@@ -8,16 +9,84 @@ from django.core.cache import cache
 # Third party imports
 from rest_framework.response import Response
 
+# Prefix of the generation counters folded into every cached response key
+CACHE_VERSION_PREFIX = "cache_version"
+# Generation counters expire well after the longest lived cached entry, an
+# expired counter restarts from the current time and only orphans old entries
+CACHE_VERSION_TIMEOUT = 24 * 60 * 60
+# Prefix of the hit / miss / invalidation counters
+CACHE_STATS_PREFIX = "cache_stats"
+CACHE_STATS = ("hits", "misses", "invalidations")
 
-def generate_cache_key(custom_path, auth_header=None):
+
+def generate_cache_key(custom_path, auth_header=None, version=None):
     """Generate a cache key with the given params"""
     if auth_header:
         key_data = f"{custom_path}:{auth_header}"
     else:
         key_data = custom_path
+    if version:
+        key_data = f"{key_data}:v{version}"
     return key_data
 
 
+def get_cache_namespace(path):
+    """Return the namespace the versions of a cached path are kept under"""
+    # `/api/workspaces/slug/labels/?x=1` and `workspaces/slug/labels/` share the namespace
+    namespace = path.split("?")[0].strip("/")
+    return namespace[len("api/") :] if namespace.startswith("api/") else namespace
+
+
+def _increment(key, initial, timeout=None):
+    # Increment the counter, creating it with the initial value when missing
+    try:
+        value = cache.incr(key)
+    except ValueError:
+        if cache.add(key, initial, timeout=timeout):
+            return initial
+        value = cache.incr(key)
+    if timeout is not None:
+        cache.touch(key, timeout)
+    return value
+
+
+def _version_keys(namespace, auth_header=None):
+    keys = [f"{CACHE_VERSION_PREFIX}:{namespace}"]
+    if auth_header:
+        keys.append(f"{CACHE_VERSION_PREFIX}:{namespace}:{auth_header}")
+    return keys
+
+
+def get_cache_version(namespace, auth_header=None):
+    """Return the current namespace (and user) generation of a cached path"""
+    keys = _version_keys(namespace, auth_header)
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Start from the current time so a lost counter never brings back stale entries
+            initial = int(time.time() * 1000)
+            cache.add(key, initial, timeout=CACHE_VERSION_TIMEOUT)
+            versions[key] = cache.get(key, initial)
+    return ".".join(str(versions[key]) for key in keys)
+
+
+def bump_cache_version(namespace, auth_header=None):
+    """Start a new namespace (or user) generation, orphaning the cached entries"""
+    _increment(_version_keys(namespace, auth_header)[-1], int(time.time() * 1000), timeout=CACHE_VERSION_TIMEOUT)
+    record_cache_stat("invalidations")
+
+
+def record_cache_stat(stat):
+    """Increment one of the cache counters"""
+    _increment(f"{CACHE_STATS_PREFIX}:{stat}", 1)
+
+
+def get_cache_stats():
+    """Return the hit, miss and invalidation counters for monitoring"""
+    counters = cache.get_many([f"{CACHE_STATS_PREFIX}:{stat}" for stat in CACHE_STATS])
+    return {stat: counters.get(f"{CACHE_STATS_PREFIX}:{stat}", 0) for stat in CACHE_STATS}
+
+
 def cache_response(timeout=60 * 60, path=None, user=True):
     """decorator to create cache per user"""
 
@@ -27,11 +96,14 @@ def cache_response(timeout=60 * 60, path=None, user=True):
             # Function to generate cache key
             auth_header = None if request.user.is_anonymous else str(request.user.id) if user else None
             custom_path = path if path is not None else request.get_full_path()
-            key = generate_cache_key(custom_path, auth_header)
+            version = get_cache_version(get_cache_namespace(custom_path), auth_header)
+            key = generate_cache_key(custom_path, auth_header, version)
             cached_result = cache.get(key)
 
             if cached_result is not None:
+                record_cache_stat("hits")
                 return Response(cached_result["data"], status=cached_result["status"])
+            record_cache_stat("misses")
             response = view_func(instance, request, *args, **kwargs)
             if response.status_code == 200 and not settings.DEBUG:
                 cache.set(
@@ -48,6 +120,12 @@ def cache_response(timeout=60 * 60, path=None, user=True):
 
 
 def invalidate_cache_directly(path=None, url_params=False, user=True, request=None, multiple=False):
+    """
+    Invalidate the cached responses of a path by bumping its generation, user
+    scoped when `user` is set. Entries of older generations are never read again
+    and expire with their timeout, so every query string variant is covered and
+    `multiple` no longer needs a keyspace scan.
+    """
     if url_params and path:
         path_with_values = path
         # Assuming `kwargs` could be passed directly if needed, otherwise, skip this part
@@ -57,12 +135,8 @@ def invalidate_cache_directly(path=None, url_params=False, user=True, request=No
     else:
         custom_path = path if path is not None else request.get_full_path()
     auth_header = None if request and request.user.is_anonymous else str(request.user.id) if user else None
-    key = generate_cache_key(custom_path, auth_header)
 
-    if multiple:
-        cache.delete_many(keys=cache.keys(f"*{key}*"))
-    else:
-        cache.delete(key)
+    bump_cache_version(get_cache_namespace(custom_path), auth_header)
 
 
 def invalidate_cache(path=None, url_params=False, user=True, multiple=False):
@@ -0,0 +1,305 @@
+# Python imports
+import json
+import tempfile
+import uuid
+from collections import defaultdict
+from pathlib import Path
+
+# Third party imports
+from botocore.exceptions import ClientError
+
+# Django imports
+from django.db import IntegrityError, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import CaseModule, TestCase, TestCaseRepository, TestCaseVersion
+from plane.settings.redis import redis_instance
+from plane.settings.storage import S3Storage
+from plane.utils.exception_logger import log_exception
+from plane.utils.import_export import iter_case_rows
+from plane.utils.qa_tree import invalidate_module_tree
+
+# Rows written per transaction, a failing chunk only fails its own rows
+IMPORT_CHUNK_SIZE = 500
+
+# Status and progress of a case import, kept for a day
+IMPORT_STATUS_KEY = "case_import_status:{import_id}"
+IMPORT_STATUS_TTL = 24 * 60 * 60
+
+# Uploads of a background import, removed once the task finishes
+IMPORT_FILE_KEY = "case-imports/{import_id}/{index}{suffix}"
+
+# Columns copied onto the case when the cell is not empty
+CASE_IMPORT_FIELDS = ("remark", "precondition", "steps")
+
+
+def get_import_status(import_id):
+    status = redis_instance().get(IMPORT_STATUS_KEY.format(import_id=import_id))
+    return json.loads(status) if status else None
+
+
+def set_import_status(import_id, status, **details):
+    redis_instance().set(
+        IMPORT_STATUS_KEY.format(import_id=import_id),
+        json.dumps({"status": status, **details}),
+        ex=IMPORT_STATUS_TTL,
+    )
+
+
+def clean_import_row(data):
+    """
+    Validate one imported row and return its code, module name and the
+    fields written to the case. Raises ValueError for an invalid row.
+    """
+    name = data.get("name")
+    if name in (None, ""):
+        raise ValueError("name is required")
+
+    fields = {"name": str(name)}
+    for field in CASE_IMPORT_FIELDS:
+        value = data.get(field)
+        if value not in (None, ""):
+            fields[field] = value
+
+    priority_key = data.get("priority")
+    if priority_key not in (None, ""):
+        if priority_key not in TestCase.Priority.names:
+            raise ValueError(f"unknown priority {priority_key}")
+        fields["priority"] = TestCase.Priority[priority_key].value
+
+    module_name = data.get("module")
+    module_name = str(module_name).strip() if module_name not in (None, "") else None
+    if module_name and len(module_name) > CaseModule._meta.get_field("name").max_length:
+        raise ValueError(f"module name {module_name} is too long")
+
+    code = data.get("code")
+    code = str(code).strip() if code not in (None, "") else None
+    return code, module_name, fields
+
+
+def resolve_modules(repository_id, names, user_id):
+    """Return the modules of the repository by name, creating the missing ones as roots"""
+    if not names:
+        return {}
+    modules = {}
+    for module in CaseModule.objects.filter(repository_id=repository_id, name__in=names).order_by("created_at"):
+        modules.setdefault(module.name, module)
+
+    missing = [name for name in names if name not in modules]
+    if missing:
+        created = []
+        for name in missing:
+            module_id = uuid.uuid4()
+            created.append(
+                CaseModule(
+                    id=module_id,
+                    name=name,
+                    repository_id=repository_id,
+                    path=f"{module_id.hex}/",
+                    created_by_id=user_id,
+                    updated_by_id=user_id,
+                )
+            )
+        # A module created by a concurrent request is picked up by the refetch
+        CaseModule.objects.bulk_create(created, ignore_conflicts=True)
+        for module in CaseModule.objects.filter(repository_id=repository_id, name__in=missing).order_by("created_at"):
+            modules.setdefault(module.name, module)
+        # bulk_create skips the signal that drops the cached module tree
+        invalidate_module_tree(repository_id)
+    return modules
+
+
+def create_case_versions(cases):
+    """Snapshot the cases in bulk, the same rows TestCaseVersion.create_from_case writes"""
+    case_ids = [case.id for case in cases]
+    latest = dict(
+        TestCaseVersion.objects.filter(case_id__in=case_ids)
+        .values("case_id")
+        .annotate(max_version=Max("version"))
+        .values_list("case_id", "max_version")
+    )
+
+    label_ids = defaultdict(list)
+    for case_id, label_id in TestCase.labels.through.objects.filter(
+        testcase_id__in=case_ids, caselabel__deleted_at__isnull=True
+    ).values_list("testcase_id", "caselabel_id"):
+        label_ids[case_id].append(str(label_id))
+    issue_ids = defaultdict(list)
+    for case_id, issue_id in TestCase.issues.through.objects.filter(
+        testcase_id__in=case_ids, issue__deleted_at__isnull=True
+    ).values_list("testcase_id", "issue_id"):
+        issue_ids[case_id].append(str(issue_id))
+
+    versions = []
+    for case in cases:
+        max_version = latest.get(case.id)
+        versions.append(
+            TestCaseVersion(
+                case=case,
+                version=1.0 if max_version is None else round(max_version + 0.1, 1),
+                repository_id=str(case.repository_id),
+                module_id=str(case.module_id) if case.module_id else None,
+                assignee_id=str(case.assignee_id) if case.assignee_id else None,
+                code=case.code or "",
+                name=case.name,
+                precondition=case.precondition,
+                steps=case.steps,
+                remark=case.remark,
+                type=case.type,
+                test_type=case.test_type,
+                priority=case.priority,
+                state=getattr(case, "state", TestCase.State.PENDING_REVIEW),
+                label_ids=label_ids[case.id],
+                issue_ids=issue_ids[case.id],
+                mode=case.mode,
+                text_description=case.text_description,
+                text_result=case.text_result,
+                updated_at=case.updated_at,
+                created_by_id=case.updated_by_id or case.created_by_id,
+            )
+        )
+    TestCaseVersion.objects.bulk_create(versions)
+
+
+def import_case_chunk(repository_id, rows, user_id):
+    """
+    Write one chunk of cleaned rows, `rows` are (code, module name, fields,
+    reserved) tuples. Rows with an explicit code are upserted by it, rows
+    given a reserved code are always created.
+    """
+    modules = resolve_modules(repository_id, list(dict.fromkeys(name for _, name, _, _ in rows if name)), user_id)
+
+    # Rows sharing a code update the same case, the last row wins
+    changes = defaultdict(dict)
+    created = []
+    for code, module_name, fields, reserved in rows:
+        if module_name:
+            fields = {**fields, "module": modules[module_name]}
+        if reserved:
+            case = TestCase(code=code, repository_id=repository_id, created_by_id=user_id, updated_by_id=user_id)
+            for field, value in fields.items():
+                setattr(case, field, value)
+            created.append(case)
+        else:
+            changes[code].update(fields)
+
+    now = timezone.now()
+    existing = {case.code: case for case in TestCase.objects.filter(repository_id=repository_id, code__in=changes)}
+    updated = []
+    update_fields = {"updated_at", "updated_by"}
+    for code, fields in changes.items():
+        case = existing.get(code)
+        if case is None:
+            case = TestCase(code=code, repository_id=repository_id, created_by_id=user_id, updated_by_id=user_id)
+            created.append(case)
+        else:
+            case.updated_at = now
+            case.updated_by_id = user_id
+            update_fields.update(fields)
+            updated.append(case)
+        for field, value in fields.items():
+            setattr(case, field, value)
+
+    if updated:
+        TestCase.objects.bulk_update(updated, sorted(update_fields))
+    if created:
+        TestCase.objects.bulk_create(created)
+    create_case_versions(updated + created)
+
+
+def import_case_rows(repository, rows, user_id):
+    """
+    Write a chunk of cleaned rows in one transaction and return its failures.
+    A failing chunk is written again a row at a time to report every failure.
+    """
+    # 手工编号先登记到计数器，这一批预留的编号不会与之重复
+    TestCase.record_codes(repository, [code for code, _, _ in rows if code])
+    new_codes = iter(TestCase.allocate_codes(repository, sum(1 for code, _, _ in rows if not code)))
+    rows = [(code or next(new_codes), module_name, fields, not code) for code, module_name, fields in rows]
+
+    try:
+        with transaction.atomic():
+            import_case_chunk(repository.id, rows, user_id)
+        return []
+    except Exception:
+        fail_list = []
+        for row in rows:
+            try:
+                with transaction.atomic():
+                    import_case_chunk(repository.id, [row], user_id)
+            except IntegrityError:
+                fail_list.append(dict(name=row[2]["name"], error="case code already exists"))
+            except Exception as e:
+                fail_list.append(dict(name=row[2]["name"], error=str(e).replace("\n", "")))
+        return fail_list
+
+
+def import_cases(repository_id, rows, user_id, import_id=None, total_count=None):
+    """
+    Import the parsed rows into a repository and return the summary of the
+    import endpoint. The rows are consumed as they are read and written a
+    chunk at a time, the progress is published under `import_id` against
+    the estimated `total_count`.
+    """
+    repository = TestCaseRepository.objects.select_related("project").get(pk=repository_id)
+    processed_count = 0
+    fail_list = []
+    chunk = []
+
+    def write_chunk():
+        fail_list.extend(import_case_rows(repository, chunk, user_id))
+        chunk.clear()
+        if import_id:
+            set_import_status(
+                import_id,
+                "running",
+                total_count=max(total_count or 0, processed_count),
+                processed_count=processed_count,
+            )
+
+    for data in rows:
+        processed_count += 1
+        try:
+            chunk.append(clean_import_row(data))
+        except ValueError as e:
+            fail_list.append(dict(name=data.get("name"), error=str(e)))
+        if len(chunk) == IMPORT_CHUNK_SIZE:
+            write_chunk()
+    if chunk:
+        write_chunk()
+
+    return {"total_count": processed_count, "success_count": processed_count - len(fail_list), "fail": fail_list}
+
+
+def store_import_files(import_id, files):
+    """Save the uploaded files for the import task and return their (object key, file name) pairs"""
+    storage = S3Storage(is_server=True)
+    stored = []
+    for index, file in enumerate(files):
+        key = IMPORT_FILE_KEY.format(import_id=import_id, index=index, suffix=Path(file.name).suffix)
+        if not storage.upload_file(file, key):
+            delete_import_files(stored)
+            raise OSError(f"Could not store {file.name}")
+        stored.append((key, file.name))
+    return stored
+
+
+def iter_stored_case_rows(files):
+    """Stream the rows of the stored import files one file at a time"""
+    storage = S3Storage(is_server=True)
+    for key, name in files:
+        with tempfile.TemporaryFile() as file:
+            storage.s3_client.download_fileobj(storage.aws_storage_bucket_name, key, file)
+            file.seek(0)
+            yield from iter_case_rows(file, name)
+
+
+def delete_import_files(files):
+    storage = S3Storage(is_server=True)
+    for key, _ in files:
+        try:
+            storage.s3_client.delete_object(Bucket=storage.aws_storage_bucket_name, Key=key)
+        except ClientError as e:
+            log_exception(e)
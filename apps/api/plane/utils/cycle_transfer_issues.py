@@ -2,18 +2,11 @@
 import json
 
 # Django imports
-from django.db.models import (
-    Case,
-    Count,
-    F,
-    Q,
-    Sum,
-    FloatField,
-    Value,
-    When,
-)
-from django.db import models
-from django.db.models.functions import Cast, Concat
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.fields import ArrayField
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef, Subquery, UUIDField, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 # Module imports
@@ -21,20 +14,276 @@ from plane.db.models import (
     Cycle,
     CycleIssue,
     Issue,
+    IssueAssignee,
+    IssueLabel,
+    Label,
     Project,
+    State,
+    User,
 )
+from plane.settings.redis import redis_instance
 from plane.utils.analytics_plot import burndown_plot
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.utils.host import base_host
 
+# Only the work items in these state groups move to the new cycle
+TRANSFERABLE_STATE_GROUPS = ["backlog", "unstarted", "started"]
+
+# Status of the last transfer of a cycle, kept for a day
+TRANSFER_STATUS_KEY = "cycle_transfer_status:{cycle_id}"
+TRANSFER_STATUS_TTL = 24 * 60 * 60
+# Held while a transfer of the cycle is queued or running
+TRANSFER_LOCK_KEY = "cycle_transfer_lock:{cycle_id}"
+TRANSFER_LOCK_TTL = 60 * 60
+
+
+def acquire_transfer_lock(cycle_id):
+    return redis_instance().set(TRANSFER_LOCK_KEY.format(cycle_id=cycle_id), "true", nx=True, ex=TRANSFER_LOCK_TTL)
+
+
+def release_transfer_lock(cycle_id):
+    redis_instance().delete(TRANSFER_LOCK_KEY.format(cycle_id=cycle_id))
+
+
+def get_transfer_status(cycle_id):
+    status = redis_instance().get(TRANSFER_STATUS_KEY.format(cycle_id=cycle_id))
+    return json.loads(status) if status else None
+
+
+def set_transfer_status(cycle_id, status, **details):
+    redis_instance().set(
+        TRANSFER_STATUS_KEY.format(cycle_id=cycle_id),
+        json.dumps({"status": status, **details}),
+        ex=TRANSFER_STATUS_TTL,
+    )
+
+
+def get_transferable_cycle_issues(project_id, cycle_id):
+    """Cycle issues of the incomplete work items of a cycle"""
+    return CycleIssue.objects.filter(
+        cycle_id=cycle_id,
+        project_id=project_id,
+        issue__archived_at__isnull=True,
+        issue__is_draft=False,
+        issue__state__group__in=TRANSFERABLE_STATE_GROUPS,
+    )
+
+
+def move_cycle_issues(project_id, cycle_id, new_cycle_id, user_id):
+    """
+    Move the incomplete work items of a cycle to the new cycle in a single
+    UPDATE ... FROM statement and return the ids of the moved work items.
+
+    Work items already in the new cycle are left where they are, moving them
+    would break the one live row per cycle and work item constraint.
+    """
+    query = f"""
+        UPDATE {CycleIssue._meta.db_table} AS cycle_issue
+        SET cycle_id = %(new_cycle_id)s, updated_at = %(now)s, updated_by_id = %(user_id)s
+        FROM {Issue._meta.db_table} AS issue, {State._meta.db_table} AS state
+        WHERE cycle_issue.issue_id = issue.id
+            AND issue.state_id = state.id
+            AND cycle_issue.cycle_id = %(cycle_id)s
+            AND cycle_issue.project_id = %(project_id)s
+            AND cycle_issue.deleted_at IS NULL
+            AND issue.archived_at IS NULL
+            AND issue.is_draft = false
+            AND state."group" = ANY(%(state_groups)s)
+            AND NOT EXISTS (
+                SELECT 1 FROM {CycleIssue._meta.db_table} AS target
+                WHERE target.issue_id = cycle_issue.issue_id
+                    AND target.cycle_id = %(new_cycle_id)s
+                    AND target.deleted_at IS NULL
+            )
+        RETURNING cycle_issue.issue_id
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            query,
+            {
+                "new_cycle_id": new_cycle_id,
+                "cycle_id": cycle_id,
+                "project_id": project_id,
+                "user_id": user_id,
+                "now": timezone.now(),
+                "state_groups": TRANSFERABLE_STATE_GROUPS,
+            },
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _estimate_value(value):
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _add_to_distribution(distribution, key, completed, estimate):
+    bucket = distribution.setdefault(
+        key,
+        {
+            "total_issues": 0,
+            "completed_issues": 0,
+            "pending_issues": 0,
+            "total_estimates": None,
+            "completed_estimates": None,
+            "pending_estimates": None,
+        },
+    )
+    bucket["total_issues"] += 1
+    bucket["completed_issues" if completed else "pending_issues"] += 1
+    if estimate is not None:
+        bucket["total_estimates"] = (bucket["total_estimates"] or 0) + estimate
+        progress_key = "completed_estimates" if completed else "pending_estimates"
+        bucket[progress_key] = (bucket[progress_key] or 0) + estimate
+
+
+def _sorted_by_name(rows, name_key):
+    # Sort like the database does, with the missing names last
+    return sorted(rows, key=lambda row: (row[name_key] is None, row[name_key] or ""))
+
+
+def get_cycle_progress_snapshot(slug, project_id, cycle, estimate_type):
+    """
+    Build the progress snapshot of a cycle from a single scan of its work
+    items. The state counts and the assignee and label distributions of
+    issues and estimates are aggregated together in one pass.
+    """
+    array_default = Value([], output_field=ArrayField(UUIDField()))
+    issue_rows = (
+        Issue.issue_objects.filter(workspace__slug=slug, project_id=project_id)
+        .filter(Exists(CycleIssue.objects.filter(cycle_id=cycle.id, issue_id=OuterRef("pk"))))
+        .annotate(
+            assignee_ids=Coalesce(
+                Subquery(
+                    IssueAssignee.objects.filter(issue_id=OuterRef("pk"))
+                    .values("issue_id")
+                    .annotate(arr=ArrayAgg("assignee_id", distinct=True))
+                    .values("arr")
+                ),
+                array_default,
+            ),
+            label_ids=Coalesce(
+                Subquery(
+                    IssueLabel.objects.filter(issue_id=OuterRef("pk"))
+                    .values("issue_id")
+                    .annotate(arr=ArrayAgg("label_id", distinct=True))
+                    .values("arr")
+                ),
+                array_default,
+            ),
+        )
+        .values("state__group", "completed_at", "estimate_point__value", "assignee_ids", "label_ids")
+    )
+
+    state_counts = {group: 0 for group in ["completed", "cancelled", "started", "unstarted", "backlog"]}
+    assignees = {}
+    labels = {}
+    total_issues = 0
+    for row in issue_rows:
+        total_issues += 1
+        if row["state__group"] in state_counts:
+            state_counts[row["state__group"]] += 1
+        completed = row["completed_at"] is not None
+        estimate = _estimate_value(row["estimate_point__value"])
+        for assignee_id in row["assignee_ids"] or [None]:
+            _add_to_distribution(assignees, assignee_id, completed, estimate)
+        for label_id in row["label_ids"] or [None]:
+            _add_to_distribution(labels, label_id, completed, estimate)
+
+    users = {
+        user["id"]: user
+        for user in User.objects.filter(pk__in=[key for key in assignees if key]).values(
+            "id", "display_name", "avatar", "avatar_asset"
+        )
+    }
+    label_details = {
+        label["id"]: label
+        for label in Label.all_objects.filter(pk__in=[key for key in labels if key]).values("id", "name", "color")
+    }
+
+    assignee_rows = []
+    for assignee_id, bucket in assignees.items():
+        user = users.get(assignee_id, {})
+        avatar_url = (
+            f"/api/assets/v2/static/{user['avatar_asset']}/" if user.get("avatar_asset") else user.get("avatar")
+        )
+        assignee_rows.append(
+            {
+                "display_name": user.get("display_name"),
+                "assignee_id": str(assignee_id) if assignee_id else None,
+                "avatar_url": avatar_url,
+                **bucket,
+            }
+        )
+    assignee_rows = _sorted_by_name(assignee_rows, "display_name")
+
+    label_rows = []
+    for label_id, bucket in labels.items():
+        label = label_details.get(label_id, {})
+        label_rows.append(
+            {
+                "label_name": label.get("name"),
+                "color": label.get("color"),
+                "label_id": str(label_id) if label_id else None,
+                **bucket,
+            }
+        )
+    label_rows = _sorted_by_name(label_rows, "label_name")
+
+    issue_keys = ["total_issues", "completed_issues", "pending_issues"]
+    estimate_keys = ["total_estimates", "completed_estimates", "pending_estimates"]
+
+    def pick(rows, drop_keys):
+        return [{key: value for key, value in row.items() if key not in drop_keys} for row in rows]
+
+    # The burndown plot reads the issue total from the cycle
+    cycle.total_issues = total_issues
+    return {
+        "total_issues": total_issues,
+        "completed_issues": state_counts["completed"],
+        "cancelled_issues": state_counts["cancelled"],
+        "started_issues": state_counts["started"],
+        "unstarted_issues": state_counts["unstarted"],
+        "backlog_issues": state_counts["backlog"],
+        "distribution": {
+            "labels": pick(label_rows, estimate_keys),
+            "assignees": pick(assignee_rows, estimate_keys),
+            "completion_chart": burndown_plot(
+                queryset=cycle,
+                slug=slug,
+                project_id=project_id,
+                plot_type="issues",
+                cycle_id=cycle.id,
+            ),
+        },
+        "estimate_distribution": (
+            {}
+            if not estimate_type
+            else {
+                "labels": pick(label_rows, issue_keys),
+                "assignees": pick(assignee_rows, issue_keys),
+                "completion_chart": burndown_plot(
+                    queryset=cycle,
+                    slug=slug,
+                    project_id=project_id,
+                    plot_type="points",
+                    cycle_id=cycle.id,
+                ),
+            }
+        ),
+    }
+
 
 def transfer_cycle_issues(
     slug,
     project_id,
     cycle_id,
     new_cycle_id,
-    request,
-    user_id,
+    request=None,
+    user_id=None,
+    origin=None,
 ):
     """
     Transfer incomplete issues from one cycle to another and create progress snapshot.
@@ -44,8 +293,9 @@ def transfer_cycle_issues(
         project_id: Project ID
         cycle_id: Source cycle ID
         new_cycle_id: Destination cycle ID
-        request: HTTP request object
+        request: HTTP request object, used for the activity origin
         user_id: User ID performing the transfer
+        origin: Activity origin, when the transfer runs outside the request
 
     Returns:
         dict: Response data with success or error message
@@ -60,82 +310,8 @@ def transfer_cycle_issues(
             "error": "The cycle where the issues are transferred is already completed",
         }
 
-    # Get the old cycle with issue counts
-    old_cycle = (
-        Cycle.objects.filter(workspace__slug=slug, project_id=project_id, pk=cycle_id)
-        .annotate(
-            total_issues=Count(
-                "issue_cycle",
-                filter=Q(
-                    issue_cycle__issue__archived_at__isnull=True,
-                    issue_cycle__issue__is_draft=False,
-                    issue_cycle__deleted_at__isnull=True,
-                    issue_cycle__issue__deleted_at__isnull=True,
-                ),
-            )
-        )
-        .annotate(
-            completed_issues=Count(
-                "issue_cycle__issue__state__group",
-                filter=Q(
-                    issue_cycle__issue__state__group="completed",
-                    issue_cycle__issue__archived_at__isnull=True,
-                    issue_cycle__issue__is_draft=False,
-                    issue_cycle__issue__deleted_at__isnull=True,
-                    issue_cycle__deleted_at__isnull=True,
-                ),
-            )
-        )
-        .annotate(
-            cancelled_issues=Count(
-                "issue_cycle__issue__state__group",
-                filter=Q(
-                    issue_cycle__issue__state__group="cancelled",
-                    issue_cycle__issue__archived_at__isnull=True,
-                    issue_cycle__issue__is_draft=False,
-                    issue_cycle__issue__deleted_at__isnull=True,
-                    issue_cycle__deleted_at__isnull=True,
-                ),
-            )
-        )
-        .annotate(
-            started_issues=Count(
-                "issue_cycle__issue__state__group",
-                filter=Q(
-                    issue_cycle__issue__state__group="started",
-                    issue_cycle__issue__archived_at__isnull=True,
-                    issue_cycle__issue__is_draft=False,
-                    issue_cycle__issue__deleted_at__isnull=True,
-                    issue_cycle__deleted_at__isnull=True,
-                ),
-            )
-        )
-        .annotate(
-            unstarted_issues=Count(
-                "issue_cycle__issue__state__group",
-                filter=Q(
-                    issue_cycle__issue__state__group="unstarted",
-                    issue_cycle__issue__archived_at__isnull=True,
-                    issue_cycle__issue__is_draft=False,
-                    issue_cycle__issue__deleted_at__isnull=True,
-                    issue_cycle__deleted_at__isnull=True,
-                ),
-            )
-        )
-        .annotate(
-            backlog_issues=Count(
-                "issue_cycle__issue__state__group",
-                filter=Q(
-                    issue_cycle__issue__state__group="backlog",
-                    issue_cycle__issue__archived_at__isnull=True,
-                    issue_cycle__issue__is_draft=False,
-                    issue_cycle__issue__deleted_at__isnull=True,
-                    issue_cycle__deleted_at__isnull=True,
-                ),
-            )
-        )
-    )
-    old_cycle = old_cycle.first()
+    # Get the old cycle
+    old_cycle = Cycle.objects.filter(workspace__slug=slug, project_id=project_id, pk=cycle_id).first()
 
     if old_cycle is None:
         return {
@@ -151,324 +327,42 @@ def transfer_cycle_issues(
         estimate__type="points",
     ).exists()
 
-    # Initialize estimate distribution variables
-    assignee_estimate_distribution = []
-    label_estimate_distribution = []
-    estimate_completion_chart = {}
-
-    if estimate_type:
-        assignee_estimate_data = (
-            Issue.issue_objects.filter(
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-            )
-            .annotate(display_name=F("assignees__display_name"))
-            .annotate(assignee_id=F("assignees__id"))
-            .annotate(
-                avatar_url=Case(
-                    # If `avatar_asset` exists, use it to generate the asset URL
-                    When(
-                        assignees__avatar_asset__isnull=False,
-                        then=Concat(
-                            Value("/api/assets/v2/static/"),
-                            "assignees__avatar_asset",
-                            Value("/"),
-                        ),
-                    ),
-                    # If `avatar_asset` is None, fall back to using `avatar` field directly
-                    When(
-                        assignees__avatar_asset__isnull=True,
-                        then="assignees__avatar",
-                    ),
-                    default=Value(None),
-                    output_field=models.CharField(),
-                )
-            )
-            .values("display_name", "assignee_id", "avatar_url")
-            .annotate(total_estimates=Sum(Cast("estimate_point__value", FloatField())))
-            .annotate(
-                completed_estimates=Sum(
-                    Cast("estimate_point__value", FloatField()),
-                    filter=Q(
-                        completed_at__isnull=False,
-                        archived_at__isnull=True,
-                        is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                pending_estimates=Sum(
-                    Cast("estimate_point__value", FloatField()),
-                    filter=Q(
-                        completed_at__isnull=True,
-                        archived_at__isnull=True,
-                        is_draft=False,
-                    ),
-                )
-            )
-            .order_by("display_name")
-        )
-        # Assignee estimate distribution serialization
-        assignee_estimate_distribution = [
-            {
-                "display_name": item["display_name"],
-                "assignee_id": (str(item["assignee_id"]) if item["assignee_id"] else None),
-                "avatar_url": item.get("avatar_url"),
-                "total_estimates": item["total_estimates"],
-                "completed_estimates": item["completed_estimates"],
-                "pending_estimates": item["pending_estimates"],
-            }
-            for item in assignee_estimate_data
-        ]
-
-        label_distribution_data = (
-            Issue.issue_objects.filter(
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-            )
-            .annotate(label_name=F("labels__name"))
-            .annotate(color=F("labels__color"))
-            .annotate(label_id=F("labels__id"))
-            .values("label_name", "color", "label_id")
-            .annotate(total_estimates=Sum(Cast("estimate_point__value", FloatField())))
-            .annotate(
-                completed_estimates=Sum(
-                    Cast("estimate_point__value", FloatField()),
-                    filter=Q(
-                        completed_at__isnull=False,
-                        archived_at__isnull=True,
-                        is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                pending_estimates=Sum(
-                    Cast("estimate_point__value", FloatField()),
-                    filter=Q(
-                        completed_at__isnull=True,
-                        archived_at__isnull=True,
-                        is_draft=False,
-                    ),
-                )
-            )
-            .order_by("label_name")
-        )
-
-        estimate_completion_chart = burndown_plot(
-            queryset=old_cycle,
-            slug=slug,
-            project_id=project_id,
-            plot_type="points",
-            cycle_id=cycle_id,
-        )
-        # Label estimate distribution serialization
-        label_estimate_distribution = [
-            {
-                "label_name": item["label_name"],
-                "color": item["color"],
-                "label_id": (str(item["label_id"]) if item["label_id"] else None),
-                "total_estimates": item["total_estimates"],
-                "completed_estimates": item["completed_estimates"],
-                "pending_estimates": item["pending_estimates"],
-            }
-            for item in label_distribution_data
-        ]
-
-    # Get the assignee distribution
-    assignee_distribution = (
-        Issue.issue_objects.filter(
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            workspace__slug=slug,
-            project_id=project_id,
-        )
-        .annotate(display_name=F("assignees__display_name"))
-        .annotate(assignee_id=F("assignees__id"))
-        .annotate(
-            avatar_url=Case(
-                # If `avatar_asset` exists, use it to generate the asset URL
-                When(
-                    assignees__avatar_asset__isnull=False,
-                    then=Concat(
-                        Value("/api/assets/v2/static/"),
-                        "assignees__avatar_asset",
-                        Value("/"),
-                    ),
-                ),
-                # If `avatar_asset` is None, fall back to using `avatar` field directly
-                When(assignees__avatar_asset__isnull=True, then="assignees__avatar"),
-                default=Value(None),
-                output_field=models.CharField(),
-            )
-        )
-        .values("display_name", "assignee_id", "avatar_url")
-        .annotate(total_issues=Count("id", filter=Q(archived_at__isnull=True, is_draft=False)))
-        .annotate(
-            completed_issues=Count(
-                "id",
-                filter=Q(
-                    completed_at__isnull=False,
-                    archived_at__isnull=True,
-                    is_draft=False,
-                ),
-            )
-        )
-        .annotate(
-            pending_issues=Count(
-                "id",
-                filter=Q(
-                    completed_at__isnull=True,
-                    archived_at__isnull=True,
-                    is_draft=False,
-                ),
-            )
-        )
-        .order_by("display_name")
-    )
-    # Assignee distribution serialized
-    assignee_distribution_data = [
-        {
-            "display_name": item["display_name"],
-            "assignee_id": (str(item["assignee_id"]) if item["assignee_id"] else None),
-            "avatar_url": item.get("avatar_url"),
-            "total_issues": item["total_issues"],
-            "completed_issues": item["completed_issues"],
-            "pending_issues": item["pending_issues"],
-        }
-        for item in assignee_distribution
-    ]
-
-    # Get the label distribution
-    label_distribution = (
-        Issue.issue_objects.filter(
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            workspace__slug=slug,
-            project_id=project_id,
-        )
-        .annotate(label_name=F("labels__name"))
-        .annotate(color=F("labels__color"))
-        .annotate(label_id=F("labels__id"))
-        .values("label_name", "color", "label_id")
-        .annotate(total_issues=Count("id", filter=Q(archived_at__isnull=True, is_draft=False)))
-        .annotate(
-            completed_issues=Count(
-                "id",
-                filter=Q(
-                    completed_at__isnull=False,
-                    archived_at__isnull=True,
-                    is_draft=False,
-                ),
-            )
-        )
-        .annotate(
-            pending_issues=Count(
-                "id",
-                filter=Q(
-                    completed_at__isnull=True,
-                    archived_at__isnull=True,
-                    is_draft=False,
-                ),
-            )
-        )
-        .order_by("label_name")
-    )
-
-    # Label distribution serialization
-    label_distribution_data = [
-        {
-            "label_name": item["label_name"],
-            "color": item["color"],
-            "label_id": (str(item["label_id"]) if item["label_id"] else None),
-            "total_issues": item["total_issues"],
-            "completed_issues": item["completed_issues"],
-            "pending_issues": item["pending_issues"],
-        }
-        for item in label_distribution
-    ]
-
-    # Generate completion chart
-    completion_chart = burndown_plot(
-        queryset=old_cycle,
-        slug=slug,
-        project_id=project_id,
-        plot_type="issues",
-        cycle_id=cycle_id,
+    # Save the progress snapshot of the old cycle
+    old_cycle.progress_snapshot = get_cycle_progress_snapshot(
+        slug=slug, project_id=project_id, cycle=old_cycle, estimate_type=estimate_type
     )
+    old_cycle.save(update_fields=["progress_snapshot"])
 
-    # Get the current cycle and save progress snapshot
-    current_cycle = Cycle.objects.filter(workspace__slug=slug, project_id=project_id, pk=cycle_id).first()
-
-    current_cycle.progress_snapshot = {
-        "total_issues": old_cycle.total_issues,
-        "completed_issues": old_cycle.completed_issues,
-        "cancelled_issues": old_cycle.cancelled_issues,
-        "started_issues": old_cycle.started_issues,
-        "unstarted_issues": old_cycle.unstarted_issues,
-        "backlog_issues": old_cycle.backlog_issues,
-        "distribution": {
-            "labels": label_distribution_data,
-            "assignees": assignee_distribution_data,
-            "completion_chart": completion_chart,
-        },
-        "estimate_distribution": (
-            {}
-            if not estimate_type
-            else {
-                "labels": label_estimate_distribution,
-                "assignees": assignee_estimate_distribution,
-                "completion_chart": estimate_completion_chart,
-            }
-        ),
-    }
-    current_cycle.save(update_fields=["progress_snapshot"])
-
-    # Get issues to transfer (only incomplete issues)
-    cycle_issues = CycleIssue.objects.filter(
-        cycle_id=cycle_id,
-        project_id=project_id,
-        workspace__slug=slug,
-        issue__archived_at__isnull=True,
-        issue__is_draft=False,
-        issue__state__group__in=["backlog", "unstarted", "started"],
-    )
-
-    updated_cycles = []
-    update_cycle_issue_activity = []
-    for cycle_issue in cycle_issues:
-        cycle_issue.cycle_id = new_cycle_id
-        updated_cycles.append(cycle_issue)
-        update_cycle_issue_activity.append(
-            {
-                "old_cycle_id": str(cycle_id),
-                "new_cycle_id": str(new_cycle_id),
-                "issue_id": str(cycle_issue.issue_id),
-            }
+    # Move the incomplete issues in one statement
+    with transaction.atomic():
+        issue_ids = move_cycle_issues(
+            project_id=project_id, cycle_id=cycle_id, new_cycle_id=new_cycle_id, user_id=user_id
         )
 
-    # Bulk update cycle issues
-    cycle_issues = CycleIssue.objects.bulk_update(updated_cycles, ["cycle_id"], batch_size=100)
-
     # Capture Issue Activity
-    issue_activity.delay(
-        type="cycle.activity.created",
-        requested_data=json.dumps({"cycles_list": []}),
-        actor_id=str(user_id),
-        issue_id=None,
-        project_id=str(project_id),
-        current_instance=json.dumps(
-            {
-                "updated_cycle_issues": update_cycle_issue_activity,
-                "created_cycle_issues": [],
-            }
-        ),
-        epoch=int(timezone.now().timestamp()),
-        notification=True,
-        origin=base_host(request=request, is_app=True),
-    )
+    if issue_ids:
+        issue_activity.delay(
+            type="cycle.activity.created",
+            requested_data=json.dumps({"cycles_list": []}),
+            actor_id=str(user_id),
+            issue_id=None,
+            project_id=str(project_id),
+            current_instance=json.dumps(
+                {
+                    "updated_cycle_issues": [
+                        {
+                            "old_cycle_id": str(cycle_id),
+                            "new_cycle_id": str(new_cycle_id),
+                            "issue_id": str(issue_id),
+                        }
+                        for issue_id in issue_ids
+                    ],
+                    "created_cycle_issues": [],
+                }
+            ),
+            epoch=int(timezone.now().timestamp()),
+            notification=True,
+            origin=origin or base_host(request=request, is_app=True),
+        )
 
-    return {"success": True}
+    return {"success": True, "transferred_issues": len(issue_ids)}
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Type, Union
+from typing import IO, Any, Dict, List, Type, Union
 
 from django.db.models import QuerySet
 
@@ -61,6 +61,37 @@ class Exporter:
 
         return self.formatter.format(filename, records, self.schema_class, format_options)
 
+    def write(
+        self,
+        file: IO[bytes],
+        data: Union[QuerySet, List[dict]],
+        fields: List[str] = None,
+    ) -> None:
+        """Stream an export into a binary file without building it in memory.
+
+        Querysets are read and serialized chunk by chunk, and each record is written
+        by the formatter as soon as it is serialized.
+
+        Args:
+            file: Binary file object to write the export to
+            data: Either a Django QuerySet or a list of already-serialized dicts
+            fields: Optional list of field names to include in export
+        """
+        if isinstance(data, QuerySet):
+            records = self.schema_class.iter_queryset(data, fields=fields)
+        else:
+            records = data
+
+        format_options = {**self.options}
+        if fields:
+            format_options["fields"] = fields
+
+        self.formatter.write(file, records, self.schema_class, format_options)
+
+    def get_filename(self, filename: str) -> str:
+        """Get the filename with the extension of the configured format."""
+        return self.formatter.get_filename(filename)
+
     @classmethod
     def get_available_formats(cls) -> List[str]:
         """Get list of available export formats."""
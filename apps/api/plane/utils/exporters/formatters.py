@@ -1,7 +1,7 @@
 import csv
 import io
 import json
-from typing import Any, Dict, List, Type
+from typing import IO, Any, Dict, Iterable, List, Type
 
 from openpyxl import Workbook
 
@@ -9,6 +9,9 @@ from openpyxl import Workbook
 class BaseFormatter:
     """Base class for export formatters."""
 
+    # File extension of the exported file
+    extension: str = ""
+
     def format(
         self,
         filename: str,
@@ -27,8 +30,31 @@ class BaseFormatter:
         Returns:
             Tuple of (filename_with_extension, content)
         """
+        buffer = io.BytesIO()
+        self.write(buffer, records, schema_class, options)
+        return (self.get_filename(filename), buffer.getvalue())
+
+    def write(
+        self,
+        file: IO[bytes],
+        records: Iterable[dict],
+        schema_class: Type,
+        options: Dict[str, Any] | None = None,
+    ) -> None:
+        """Write records to a binary file one at a time.
+
+        Args:
+            file: Binary file object to write the export to
+            records: Iterable of records to export, consumed lazily
+            schema_class: Schema class to extract field order and labels
+            options: Optional formatting options
+        """
         raise NotImplementedError
 
+    def get_filename(self, filename: str) -> str:
+        """Get the filename with the extension of the format."""
+        return f"{filename}.{self.extension}"
+
     @staticmethod
     def _get_field_info(schema_class: Type) -> tuple[List[str], Dict[str, str]]:
         """Extract field order and labels from schema.
@@ -51,10 +77,25 @@ class BaseFormatter:
 
         return field_order, field_labels
 
+    def _get_requested_field_info(
+        self, schema_class: Type, options: Dict[str, Any] | None = None
+    ) -> tuple[List[str], Dict[str, str]]:
+        """Extract field order and labels, filtered to the requested fields if specified."""
+        field_order, field_labels = self._get_field_info(schema_class)
+
+        opts = options or {}
+        requested_fields = opts.get("fields")
+        if requested_fields:
+            field_order = [f for f in field_order if f in requested_fields]
+
+        return field_order, field_labels
+
 
 class CSVFormatter(BaseFormatter):
     """Formatter for CSV exports."""
 
+    extension = "csv"
+
     @staticmethod
     def _format_field_value(value: Any, list_joiner: str = ", ") -> str:
         """Format a field value for CSV output."""
@@ -75,41 +116,32 @@ class CSVFormatter(BaseFormatter):
         list_joiner = opts.get("list_joiner", ", ")
         return [self._format_field_value(record.get(field, ""), list_joiner) for field in field_order]
 
-    def _create_csv_file(self, data: List[List[str]]) -> str:
-        """Create CSV file content from row data."""
-        buf = io.StringIO()
-        writer = csv.writer(buf, delimiter=",", quoting=csv.QUOTE_ALL)
-        for row in data:
-            writer.writerow(row)
-        buf.seek(0)
-        return buf.getvalue()
-
     def format(self, filename, records, schema_class, options: Dict[str, Any] | None = None) -> tuple[str, str]:
-        if not records:
-            return (f"{filename}.csv", "")
-
-        # Get field order and labels from schema
-        field_order, field_labels = self._get_field_info(schema_class)
-
-        # Filter to requested fields if specified
-        opts = options or {}
-        requested_fields = opts.get("fields")
-        if requested_fields:
-            field_order = [f for f in field_order if f in requested_fields]
+        filename, content = super().format(filename, records, schema_class, options)
+        return (filename, content.decode("utf-8"))
 
-        header = [field_labels[field] for field in field_order]
+    def write(self, file, records, schema_class, options: Dict[str, Any] | None = None) -> None:
+        field_order, field_labels = self._get_requested_field_info(schema_class, options)
 
-        rows = [header]
+        text = io.TextIOWrapper(file, encoding="utf-8", newline="", write_through=True)
+        writer = csv.writer(text, delimiter=",", quoting=csv.QUOTE_ALL)
+        header_written = False
         for record in records:
-            row = self._generate_table_row(record, field_order, options)
-            rows.append(row)
-        content = self._create_csv_file(rows)
-        return (f"{filename}.csv", content)
+            # The header is only written when there is at least one record
+            if not header_written:
+                writer.writerow([field_labels[field] for field in field_order])
+                header_written = True
+            writer.writerow(self._generate_table_row(record, field_order, options))
+
+        # Release the binary file so it is not closed along with the wrapper
+        text.detach()
 
 
 class JSONFormatter(BaseFormatter):
     """Formatter for JSON exports."""
 
+    extension = "json"
+
     def _generate_json_row(
         self, record: dict, field_labels: Dict[str, str], field_order: List[str], options: Dict[str, Any] | None = None
     ) -> dict:
@@ -120,29 +152,27 @@ class JSONFormatter(BaseFormatter):
         return {field_labels[field]: record.get(field) for field in field_order if field in record}
 
     def format(self, filename, records, schema_class, options: Dict[str, Any] | None = None) -> tuple[str, str]:
-        if not records:
-            return (f"{filename}.json", "[]")
+        filename, content = super().format(filename, records, schema_class, options)
+        return (filename, content.decode("utf-8"))
 
-        # Get field order and labels from schema
-        field_order, field_labels = self._get_field_info(schema_class)
+    def write(self, file, records, schema_class, options: Dict[str, Any] | None = None) -> None:
+        field_order, field_labels = self._get_requested_field_info(schema_class, options)
 
-        # Filter to requested fields if specified
-        opts = options or {}
-        requested_fields = opts.get("fields")
-        if requested_fields:
-            field_order = [f for f in field_order if f in requested_fields]
-
-        rows: List[dict] = []
-        for record in records:
+        # Write the array one object at a time, matching the output of json.dumps
+        file.write(b"[")
+        for index, record in enumerate(records):
+            if index:
+                file.write(b", ")
             row = self._generate_json_row(record, field_labels, field_order, options)
-            rows.append(row)
-        content = json.dumps(rows)
-        return (f"{filename}.json", content)
+            file.write(json.dumps(row).encode("utf-8"))
+        file.write(b"]")
 
 
 class XLSXFormatter(BaseFormatter):
     """Formatter for XLSX (Excel) exports."""
 
+    extension = "xlsx"
+
     @staticmethod
     def _format_field_value(value: Any, list_joiner: str = ", ") -> str:
         """Format a field value for XLSX output."""
@@ -163,37 +193,17 @@ class XLSXFormatter(BaseFormatter):
         list_joiner = opts.get("list_joiner", ", ")
         return [self._format_field_value(record.get(field, ""), list_joiner) for field in field_order]
 
-    def _create_xlsx_file(self, data: List[List[str]]) -> bytes:
-        """Create XLSX file content from row data."""
-        wb = Workbook()
-        sh = wb.active
-        for row in data:
-            sh.append(row)
-        out = io.BytesIO()
-        wb.save(out)
-        out.seek(0)
-        return out.getvalue()
-
-    def format(self, filename, records, schema_class, options: Dict[str, Any] | None = None) -> tuple[str, bytes]:
-        if not records:
-            # Create empty workbook
-            content = self._create_xlsx_file([])
-            return (f"{filename}.xlsx", content)
-
-        # Get field order and labels from schema
-        field_order, field_labels = self._get_field_info(schema_class)
-
-        # Filter to requested fields if specified
-        opts = options or {}
-        requested_fields = opts.get("fields")
-        if requested_fields:
-            field_order = [f for f in field_order if f in requested_fields]
-
-        header = [field_labels[field] for field in field_order]
+    def write(self, file, records, schema_class, options: Dict[str, Any] | None = None) -> None:
+        field_order, field_labels = self._get_requested_field_info(schema_class, options)
 
-        rows = [header]
+        # Write-only workbooks stream rows to disk instead of keeping the sheet in memory
+        wb = Workbook(write_only=True)
+        sh = wb.create_sheet(title="Sheet")
+        header_written = False
         for record in records:
-            row = self._generate_table_row(record, field_order, options)
-            rows.append(row)
-        content = self._create_xlsx_file(rows)
-        return (f"{filename}.xlsx", content)
+            # The header is only written when there is at least one record
+            if not header_written:
+                sh.append([field_labels[field] for field in field_order])
+                header_written = True
+            sh.append(self._generate_table_row(record, field_order, options))
+        wb.save(file)
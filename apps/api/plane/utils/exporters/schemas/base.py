@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
 
 from django.db.models import QuerySet
 
@@ -221,14 +222,35 @@ class ExportSchema(metaclass=ExportSchemaMeta):
         Returns:
             List of dictionaries containing serialized data
         """
-        # Get context data (can be extended by subclasses)
-        context = cls.get_context_data(queryset)
+        return list(cls.iter_queryset(queryset, fields=fields))
 
-        # Serialize each object, passing fields to only process requested fields
-        schema = cls(context=context)
-        data = []
-        for obj in queryset:
-            obj_data = schema.serialize(obj, fields=fields)
-            data.append(obj_data)
+    @classmethod
+    def iter_queryset(
+        cls, queryset: QuerySet, fields: List[str] = None, chunk_size: int = 500
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily serialize a queryset chunk by chunk.
+
+        Objects are read with `.iterator()` so prefetches and context data are
+        only held for one chunk at a time, which keeps memory bounded for large exports.
 
-        return data
+        Args:
+            queryset: QuerySet of objects to serialize
+            fields: Optional list of field names to include. Defaults to all fields.
+            chunk_size: Number of objects read, prefetched and serialized together
+
+        Yields:
+            Dictionaries containing serialized data
+        """
+        objects = queryset.iterator(chunk_size=chunk_size)
+        while True:
+            chunk = list(islice(objects, chunk_size))
+            if not chunk:
+                return
+
+            # Get context data for the objects of this chunk only
+            context = cls.get_context_data(queryset.filter(pk__in=[obj.pk for obj in chunk]))
+
+            # Serialize each object, passing fields to only process requested fields
+            schema = cls(context=context)
+            for obj in chunk:
+                yield schema.serialize(obj, fields=fields)
@@ -1,5 +1,7 @@
 # Python imports
 import json
+import threading
+from collections import OrderedDict
 
 # Django imports
 from django.db.models import Q
@@ -12,6 +14,11 @@ from rest_framework.exceptions import ValidationError as DRFValidationError
 
 from plane.utils.exception_logger import log_exception
 
+# Compiled Q trees keyed by backend, filterset and normalized filter JSON,
+# shared by the requests served from one process
+_compiled_filters = OrderedDict()
+_compiled_filters_lock = threading.Lock()
+
 
 class ComplexFilterBackend(filters.BaseFilterBackend):
     """
@@ -23,6 +30,10 @@ class ComplexFilterBackend(filters.BaseFilterBackend):
 
     filter_param = "filters"
     default_max_depth = 5
+    # Subclasses whose leaf preprocessing depends on the request or the
+    # queryset should turn the compiled filter cache off
+    cache_compiled_filters = True
+    compiled_filters_cache_size = 512
 
     def filter_queryset(self, request, queryset, view, filter_data=None):
         """Normalize filter input and apply JSON-based filtering.
@@ -78,21 +89,64 @@ class ComplexFilterBackend(filters.BaseFilterBackend):
         if not filter_data:
             return queryset
 
-        # Validate structure and depth before field allowlist checks
         max_depth = self._get_max_depth(view)
+
+        # A filter seen before was already validated, reuse its compiled Q tree
+        cache_key = self._get_cache_key(filter_data, view, max_depth)
+        combined_q = self._get_compiled_filter(cache_key)
+        if combined_q is not None:
+            return queryset.filter(combined_q)
+
+        # Validate structure and depth before field allowlist checks
         self._validate_structure(filter_data, max_depth=max_depth, current_depth=1)
 
         # Validate against the view's FilterSet (only declared filters are allowed)
         self._validate_fields(filter_data, view)
 
         # Build combined Q object from the filter tree
+        self._cacheable = True
         combined_q = self._evaluate_node(filter_data, view, queryset)
         if combined_q is None:
             return queryset
 
+        if self._cacheable:
+            self._set_compiled_filter(cache_key, combined_q)
+
         # Apply the combined Q object to the queryset once
         return queryset.filter(combined_q)
 
+    def _get_cache_key(self, filter_data, view, max_depth):
+        """Return the compiled filter cache key, or None when caching is off.
+
+        The filter JSON is dumped with sorted keys so that the same filter
+        sent with a different key order shares one entry.
+        """
+        if not self.cache_compiled_filters:
+            return None
+        try:
+            normalized = json.dumps(filter_data, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+        return (type(self), getattr(view, "filterset_class", None), max_depth, normalized)
+
+    def _get_compiled_filter(self, cache_key):
+        if cache_key is None:
+            return None
+        with _compiled_filters_lock:
+            combined_q = _compiled_filters.get(cache_key)
+            if combined_q is not None:
+                _compiled_filters.move_to_end(cache_key)
+            return combined_q
+
+    def _set_compiled_filter(self, cache_key, combined_q):
+        if cache_key is None:
+            return
+        with _compiled_filters_lock:
+            _compiled_filters[cache_key] = combined_q
+            _compiled_filters.move_to_end(cache_key)
+            while len(_compiled_filters) > self.compiled_filters_cache_size:
+                _compiled_filters.popitem(last=False)
+
     def _validate_fields(self, filter_data, view):
         """Validate that filtered fields are defined in the view's FilterSet."""
         filterset_class = getattr(view, "filterset_class", None)
@@ -289,7 +343,13 @@ class ComplexFilterBackend(filters.BaseFilterBackend):
                 }
             )
 
-        return fs.build_combined_q()
+        combined_q = fs.build_combined_q()
+
+        # A Q wrapping the filtered queryset is only valid for that queryset
+        if getattr(fs, "depends_on_queryset", False):
+            self._cacheable = False
+
+        return combined_q
 
     def _get_max_depth(self, view):
         """Return the maximum allowed nesting depth for complex filters.
@@ -1,10 +1,18 @@
 import copy
 
 from django.db import models
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from django_filters import FilterSet, filters
 
-from plane.db.models import Issue
+from plane.db.models import (
+    CycleIssue,
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    IssueMention,
+    IssueSubscriber,
+    ModuleIssue,
+)
 
 
 class UUIDInFilter(filters.BaseInFilter, filters.UUIDFilter):
@@ -16,6 +24,10 @@ class CharInFilter(filters.BaseInFilter, filters.CharFilter):
 
 
 class BaseFilterSet(FilterSet):
+    # Set when a filter method returned a QuerySet, the combined Q then embeds
+    # the queryset it was built for and cannot be reused
+    depends_on_queryset = False
+
     @classmethod
     def get_filters(cls):
         """
@@ -77,6 +89,7 @@ class BaseFilterSet(FilterSet):
                 elif isinstance(res, models.QuerySet):
                     # Backward compatibility: wrap QuerySet as subquery
                     q_piece = Q(pk__in=res.values("pk"))
+                    self.depends_on_queryset = True
                 else:
                     raise TypeError(
                         f"Filter method '{name}' must return Q object or QuerySet, got {type(res).__name__}"
@@ -184,86 +197,60 @@ class IssueFilterSet(BaseFilterSet):
 
     # Filter methods with soft delete exclusion for relations
 
+    def _related_exists(self, model, **lookups):
+        """
+        Match work items with a row in the given relation table, the default
+        manager leaves out the soft deleted rows.
+
+        An EXISTS semi-join keeps one row per work item, so relation filters
+        do not need a DISTINCT on the filtered queryset.
+        """
+        return Q(Exists(model.objects.filter(issue_id=OuterRef("pk"), **lookups)))
+
     def filter_assignee_id(self, queryset, name, value):
         """Filter by assignee ID, excluding soft deleted users"""
-        return Q(
-            issue_assignee__assignee_id=value,
-            issue_assignee__deleted_at__isnull=True,
-        )
+        return self._related_exists(IssueAssignee, assignee_id=value)
 
     def filter_assignee_id_in(self, queryset, name, value):
         """Filter by assignee IDs (in), excluding soft deleted users"""
-        return Q(
-            issue_assignee__assignee_id__in=value,
-            issue_assignee__deleted_at__isnull=True,
-        )
+        return self._related_exists(IssueAssignee, assignee_id__in=value)
 
     def filter_cycle_id(self, queryset, name, value):
         """Filter by cycle ID, excluding soft deleted cycles"""
-        return Q(
-            issue_cycle__cycle_id=value,
-            issue_cycle__deleted_at__isnull=True,
-        )
+        return self._related_exists(CycleIssue, cycle_id=value)
 
     def filter_cycle_id_in(self, queryset, name, value):
         """Filter by cycle IDs (in), excluding soft deleted cycles"""
-        return Q(
-            issue_cycle__cycle_id__in=value,
-            issue_cycle__deleted_at__isnull=True,
-        )
+        return self._related_exists(CycleIssue, cycle_id__in=value)
 
     def filter_module_id(self, queryset, name, value):
         """Filter by module ID, excluding soft deleted modules"""
-        return Q(
-            issue_module__module_id=value,
-            issue_module__deleted_at__isnull=True,
-        )
+        return self._related_exists(ModuleIssue, module_id=value)
 
     def filter_module_id_in(self, queryset, name, value):
         """Filter by module IDs (in), excluding soft deleted modules"""
-        return Q(
-            issue_module__module_id__in=value,
-            issue_module__deleted_at__isnull=True,
-        )
+        return self._related_exists(ModuleIssue, module_id__in=value)
 
     def filter_mention_id(self, queryset, name, value):
         """Filter by mention ID, excluding soft deleted users"""
-        return Q(
-            issue_mention__mention_id=value,
-            issue_mention__deleted_at__isnull=True,
-        )
+        return self._related_exists(IssueMention, mention_id=value)
 
     def filter_mention_id_in(self, queryset, name, value):
         """Filter by mention IDs (in), excluding soft deleted users"""
-        return Q(
-            issue_mention__mention_id__in=value,
-            issue_mention__deleted_at__isnull=True,
-        )
+        return self._related_exists(IssueMention, mention_id__in=value)
 
     def filter_label_id(self, queryset, name, value):
         """Filter by label ID, excluding soft deleted labels"""
-        return Q(
-            label_issue__label_id=value,
-            label_issue__deleted_at__isnull=True,
-        )
+        return self._related_exists(IssueLabel, label_id=value)
 
     def filter_label_id_in(self, queryset, name, value):
         """Filter by label IDs (in), excluding soft deleted labels"""
-        return Q(
-            label_issue__label_id__in=value,
-            label_issue__deleted_at__isnull=True,
-        )
+        return self._related_exists(IssueLabel, label_id__in=value)
 
     def filter_subscriber_id(self, queryset, name, value):
         """Filter by subscriber ID, excluding soft deleted users"""
-        return Q(
-            issue_subscribers__subscriber_id=value,
-            issue_subscribers__deleted_at__isnull=True,
-        )
+        return self._related_exists(IssueSubscriber, subscriber_id=value)
 
     def filter_subscriber_id_in(self, queryset, name, value):
         """Filter by subscriber IDs (in), excluding soft deleted users"""
-        return Q(
-            issue_subscribers__subscriber_id__in=value,
-            issue_subscribers__deleted_at__isnull=True,
-        )
+        return self._related_exists(IssueSubscriber, subscriber_id__in=value)
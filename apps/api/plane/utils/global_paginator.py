@@ -1,9 +1,20 @@
 # python imports
+import base64
+import json
+from datetime import timedelta
 from math import ceil
 
+# Django imports
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
 # constants
 PAGINATOR_MAX_LIMIT = 1000
 
+# How far behind the current time a delta sync stops so in flight writes are not skipped
+DELTA_SYNC_LAG = timedelta(seconds=5)
+
 
 class PaginateCursor:
     def __init__(self, current_page_size: int, current_page: int, offset: int):
@@ -81,3 +92,103 @@ def paginate(base_queryset, queryset, cursor, on_result):
     }
 
     return paginated_data
+
+
+class DeltaSyncCursor:
+    """
+    Opaque cursor of a delta sync. It carries the window of the sync, rows
+    updated after `since` and up to the `until` high-water mark, along with
+    the `(updated_at, id)` position of the last row sent
+    """
+
+    def __init__(self, since=None, until=None, position=None):
+        self.since = since
+        self.until = until
+        self.position = position
+
+    def __str__(self):
+        payload = {
+            "since": self.since.isoformat() if self.since else None,
+            "until": self.until.isoformat(),
+            "position": [self.position[0].isoformat(), str(self.position[1])] if self.position else None,
+        }
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+    @classmethod
+    def from_string(cls, value):
+        """Return the cursor value from its token"""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode((value + "=" * (-len(value) % 4)).encode()))
+            since = parse_datetime(payload["since"]) if payload.get("since") else None
+            until = parse_datetime(payload["until"])
+            position = payload.get("position")
+            if until is None or (payload.get("since") and since is None):
+                raise ValueError("Cursor window must hold datetimes")
+            if position is not None:
+                position = (parse_datetime(position[0]), position[1])
+                if position[0] is None:
+                    raise ValueError("Cursor position must hold a datetime")
+            return cls(since, until, position)
+        except (TypeError, ValueError, KeyError, IndexError) as e:
+            raise ValueError(f"Invalid cursor format: {e}")
+
+
+def delta_sync(queryset, tombstone_queryset, cursor, sync_token, on_result, page_size=PAGINATOR_MAX_LIMIT):
+    """
+    Sync the rows changed since a previous sync with keyset pages.
+
+    A sync starts from the `sync_token` returned by the previous one, or from
+    scratch without it, and freezes its high-water mark on the first page.
+    Rows are then sent in `(updated_at, id)` order up to that mark, so a row
+    updated while the sync runs moves past the mark and is sent exactly once,
+    by the next sync. The ids of the rows deleted or archived within the
+    window are sent as tombstones along with the first page.
+    """
+    if cursor:
+        cursor_object = DeltaSyncCursor.from_string(cursor)
+    else:
+        since = DeltaSyncCursor.from_string(sync_token).until if sync_token else None
+        # Leave a margin for the transactions still in flight so their rows are not skipped
+        cursor_object = DeltaSyncCursor(since=since, until=timezone.now() - DELTA_SYNC_LAG)
+
+    page_size = min(page_size, PAGINATOR_MAX_LIMIT)
+    window = Q(updated_at__lte=cursor_object.until)
+    if cursor_object.since:
+        window &= Q(updated_at__gt=cursor_object.since)
+
+    queryset = queryset.filter(window).order_by("updated_at", "id")
+    if cursor_object.position:
+        updated_at, pk = cursor_object.position
+        queryset = queryset.filter(Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, id__gt=pk))
+
+    # Fetch only the keys of the page and one more row to know if there is more
+    page_keys = list(queryset.values_list("updated_at", "id")[: page_size + 1])
+    has_more = len(page_keys) > page_size
+    page_keys = page_keys[:page_size]
+    results = queryset[:page_size] if page_keys else queryset.none()
+    if on_result:
+        results = on_result(results)
+
+    # Tombstones are only meaningful to a client that already holds the rows
+    deleted = []
+    if cursor_object.since and not cursor_object.position:
+        deleted = list(
+            tombstone_queryset.filter(
+                Q(updated_at__gt=cursor_object.since, updated_at__lte=cursor_object.until)
+                | Q(deleted_at__gt=cursor_object.since, deleted_at__lte=cursor_object.until)
+            ).values_list("id", flat=True)
+        )
+
+    next_cursor = None
+    if has_more:
+        next_cursor = str(DeltaSyncCursor(cursor_object.since, cursor_object.until, page_keys[-1]))
+
+    return {
+        "cursor": str(cursor_object),
+        "next_cursor": next_cursor,
+        "next_page_results": has_more,
+        "sync_token": str(DeltaSyncCursor(until=cursor_object.until)),
+        "page_count": len(results),
+        "deleted": deleted,
+        "results": results,
+    }
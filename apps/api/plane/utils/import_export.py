@@ -69,7 +69,29 @@ def build_description_result_list(description: str, result: str):
     return result_list
 
 
-def parser_excel(file_path, mapping: dict = None, sheet_name='case') -> list[dict]:
+def select_worksheet(workbook, sheet_name='case'):
+    # 选择工作表
+    if sheet_name in workbook.sheetnames:
+        return workbook[sheet_name]
+    elif '测试用例' in workbook.sheetnames:
+        return workbook['测试用例']
+    return workbook.active  # 默认活动工作表
+
+
+def count_excel_rows(file_path, sheet_name='case') -> int:
+    """工作表的数据行数，优先使用工作表记录的尺寸，不逐行解析"""
+    workbook = load_workbook(file_path, read_only=True)
+    try:
+        worksheet = select_worksheet(workbook, sheet_name)
+        if worksheet.max_row:
+            return max(worksheet.max_row - 1, 0)
+        return max(sum(1 for _ in worksheet.iter_rows(values_only=True)) - 1, 0)
+    finally:
+        workbook.close()
+
+
+def iter_excel(file_path, mapping: dict = None, sheet_name='case'):
+    """以只读模式逐行读取工作表，不在内存中构建整个工作簿"""
     mapping = mapping or {}
     mapping1 = {"功能": 'label', '测试内容': 'name', '用例等级': 'priority', '测试目的': 'remark',
                 '预置条件': 'precondition', '测试步骤': 'description', '预期结果': 'result', '模块': 'module',
@@ -77,40 +99,36 @@ def parser_excel(file_path, mapping: dict = None, sheet_name='case') -> list[dic
     mapping2 = {'功能模块': 'module', "测试项": 'label', '标题': 'name', '重要级别': 'priority', '测试目的': 'remark',
                 '测试数据及准备': 'precondition', '测试执行步骤': 'description', '预期结果': 'result',
                 '脚本编号': 'code'}
-    workbook = load_workbook(file_path)
+    workbook = load_workbook(file_path, read_only=True)
+    try:
+        rows = select_worksheet(workbook, sheet_name).iter_rows(values_only=True)
+        # 获取第一行作为列标题
+        headers = list(next(rows, None) or [])
+        header_mapping = mapping2 if '重要级别' in headers else mapping1
+        headers = [(header_mapping.get(value) or value) for value in headers]
+
+        # 读取数据行
+        for row in rows:
+            # 创建字典，跳过空行
+            if any(cell is not None for cell in row):
+                row_dict = dict(zip(headers, row))
+                yield {key: value for key, value in row_dict.items() if (not mapping or (key in mapping.values()))}
+    finally:
+        workbook.close()
 
-    # 选择工作表
-    if sheet_name in workbook.sheetnames:
-        worksheet = workbook[sheet_name]
-    elif '测试用例' in workbook.sheetnames:
-        worksheet = workbook['测试用例']
-    else:
-        worksheet = workbook.active  # 默认活动工作表
 
-    # 获取第一行作为列标题
-    headers = [cell.value for cell in worksheet[1]]
-    mapping = mapping2 if '重要级别' in headers else mapping1
-    headers = [(mapping.get(cell.value) or cell.value) for cell in worksheet[1]]
+def parser_excel(file_path, mapping: dict = None, sheet_name='case') -> list[dict]:
+    return list(iter_excel(file_path, mapping, sheet_name))
 
-    # 读取数据行
-    data = []
-    for row in worksheet.iter_rows(min_row=2, values_only=True):
-        # 创建字典，跳过空行
-        if any(cell is not None for cell in row):
-            row_dict = dict(zip(headers, row))
-            data.append({key: value for key, value in row_dict.items() if (not mapping or (key in mapping.values()))})
 
-    return data
+CASE_MAPPING = {"功能": 'label', '测试内容': 'name', '用例等级': 'priority', '测试目的': 'remark',
+                '预置条件': 'precondition', '测试步骤': 'description', '预期结果': 'result', '模块': 'module',
+                '编号': 'code'}
 
 
 def parser_excel_case(file_path, sheet_name='case'):
     """使用openpyxl将Excel转换为字典"""
-
-    mapping = {"功能": 'label', '测试内容': 'name', '用例等级': 'priority', '测试目的': 'remark',
-               '预置条件': 'precondition', '测试步骤': 'description', '预期结果': 'result', '模块': 'module',
-               '编号': 'code'}
-
-    return parser_excel(file_path, mapping, sheet_name)
+    return parser_excel(file_path, CASE_MAPPING, sheet_name)
 
 
 def parser_excel_issue(file_path, sheet_name='需求') -> list[dict]:
@@ -123,44 +141,76 @@ def get_extension_without_dot(filename):
     return extension[1:].lower() if extension else ''
 
 
+def clear_case_row(data: dict):
+    """整理一行 Excel 用例，无法解析的行返回 None"""
+    try:
+        description = data.pop('description')
+        result = data.pop('result')
+        steps = build_description_result_list(description, result)
+        data['steps'] = steps
+        if data.get('priority') and data['priority'] == 'H':
+            data['priority'] = 'HIGH'
+        elif data.get('priority') and data['priority'] == 'M':
+            data['priority'] = 'MEDIUM'
+        elif data.get('priority') and data['priority'] == 'L':
+            data['priority'] = 'LOW'
+        if isinstance(data.get('module'), str) and not data.get('module').strip():
+            del data['module']
+
+        # 标签
+        # data['label'] = [label.strip() for label in data['label'].split('\n') if data['label']]
+
+        return data
+    except Exception as e:
+
+        print(e)
+        return None
+
+
 def clear_excel_data(excel_data: list[dict]):
     excel = []
     for data in excel_data:
-        try:
-            description = data.pop('description')
-            result = data.pop('result')
-            steps = build_description_result_list(description, result)
-            data['steps'] = steps
-            if data.get('priority') and data['priority'] == 'H':
-                data['priority'] = 'HIGH'
-            elif data.get('priority') and data['priority'] == 'M':
-                data['priority'] = 'MEDIUM'
-            elif data.get('priority') and data['priority'] == 'L':
-                data['priority'] = 'LOW'
-            if isinstance(data.get('module'), str) and not data.get('module').strip():
-                del data['module']
-
-            # 标签
-            # data['label'] = [label.strip() for label in data['label'].split('\n') if data['label']]
-
+        data = clear_case_row(data)
+        if data is not None:
             excel.append(data)
-        except Exception as e:
-
-            print(e)
     return excel
 
 
-def parser_case_file(files: list[InMemoryUploadedFile]) -> list:
-    result = list()
+def iter_case_rows(file, name: str):
+    """逐行产出一个用例文件中的用例，xlsx 按行流式读取"""
+    if (suffix := get_extension_without_dot(name)) in ['json']:
+        yield from json.load(file)
+    elif suffix in ['xlsx']:
+        for data in iter_excel(file, CASE_MAPPING):
+            data = clear_case_row(data)
+            if data is not None:
+                yield data
+    else:
+        raise Exception('不是支持的文件类型')
+
+
+def iter_case_file(files: list[InMemoryUploadedFile]):
+    """逐行产出上传文件中的用例"""
+    for file in files:
+        yield from iter_case_rows(file, file.name)
+
+
+def count_case_file(files: list[InMemoryUploadedFile]) -> int:
+    """上传文件中的用例行数（xlsx 含空行，按工作表尺寸估算），读取后文件回到开头"""
+    count = 0
     for file in files:
         if (suffix := get_extension_without_dot(file.name)) in ['json']:
-            result.extend(json.load(file))
+            count += len(json.load(file))
         elif suffix in ['xlsx']:
-            data = parser_excel_case(BytesIO(file.read()))
-            result.extend(clear_excel_data(data))
+            count += count_excel_rows(file)
         else:
             raise Exception('不是支持的文件类型')
-    return result
+        file.seek(0)
+    return count
+
+
+def parser_case_file(files: list[InMemoryUploadedFile]) -> list:
+    return list(iter_case_file(files))
 
 
 def issue_data_build(excel_data) -> list[dict]:
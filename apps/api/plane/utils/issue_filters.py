@@ -2,6 +2,7 @@ import re
 import uuid
 from datetime import timedelta
 
+from django.core.exceptions import FieldDoesNotExist
 from django.utils import timezone
 
 # The date from pattern
@@ -496,3 +497,20 @@ def issue_filters(query_params, method, prefix=""):
             func = value
             func(query_params, issue_filter, method, prefix)
     return issue_filter
+
+
+def filters_require_distinct(model, lookups):
+    """
+    Return whether any of the lookups walks a to-many relation of the model,
+    the join then repeats a work item once per related row.
+    """
+    for lookup in lookups:
+        if not lookup:
+            continue
+        try:
+            field = model._meta.get_field(lookup.split("__")[0])
+        except FieldDoesNotExist:
+            continue
+        if field.many_to_many or field.one_to_many:
+            return True
+    return False
@@ -1,11 +1,19 @@
 # Python imports
+import base64
+import datetime
+import hashlib
+import json
 import math
 from collections import defaultdict
 from collections.abc import Sequence
 
 # Django imports
-from django.db.models import Count, F, Window
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, F, Q, Window
 from django.db.models.functions import RowNumber
+from django.utils.dateparse import parse_datetime
 
 # Third party imports
 from rest_framework.exceptions import ParseError
@@ -55,6 +63,69 @@ class Cursor:
             raise ValueError(f"Invalid cursor format: {e}")
 
 
+class KeysetPositionEncoder(DjangoJSONEncoder):
+    """
+    Keep the datetimes of a keyset position at full precision, the
+    DjangoJSONEncoder cuts them down to milliseconds
+    """
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return {"$datetime": o.isoformat()}
+        return super().default(o)
+
+
+def decode_keyset_position_value(value):
+    if isinstance(value, dict):
+        parsed = parse_datetime(value.get("$datetime") or "") if value.keys() == {"$datetime"} else None
+        if parsed is None:
+            raise ValueError("Invalid cursor position value")
+        return parsed
+    return value
+
+
+class KeysetCursor(Cursor):
+    """
+    Cursor for the keyset (seek) paginator. On top of the page size, page
+    number and direction it carries the ordering values of the boundary row
+    and the total computed on the first page
+    cursor=limit:page:is_prev:position
+    """
+
+    def __init__(self, value, offset=0, is_prev=False, has_results=None, position=None, total=None):
+        super().__init__(value, offset, is_prev, has_results)
+        self.position = position
+        self.total = total
+
+    # Return the cursor value in string format
+    def __str__(self):
+        if self.position is None:
+            return super().__str__()
+        token = json.dumps({"position": self.position, "total": self.total}, cls=KeysetPositionEncoder)
+        token = base64.urlsafe_b64encode(token.encode()).decode().rstrip("=")
+        return f"{super().__str__()}:{token}"
+
+    @classmethod
+    def from_string(cls, value):
+        """Return the cursor value from string format"""
+        try:
+            bits = value.split(":")
+            if len(bits) not in (3, 4):
+                raise ValueError("Cursor must be in the format 'value:offset:is_prev[:position]'")
+
+            position, total = None, None
+            if len(bits) == 4:
+                token = bits[3] + "=" * (-len(bits[3]) % 4)
+                payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+                position, total = payload["position"], payload.get("total")
+                if not isinstance(position, list):
+                    raise ValueError("Cursor position must be a list")
+                position = [decode_keyset_position_value(value) for value in position]
+            return cls(int(bits[0]), int(bits[1]), bool(int(bits[2])), position=position, total=total)
+        except (TypeError, ValueError, KeyError) as e:
+            raise ValueError(f"Invalid cursor format: {e}")
+
+
 class CursorResult(Sequence):
     def __init__(self, results, next, prev, hits=None, max_hits=None):
         self.results = results
@@ -82,6 +153,9 @@ class CursorResult(Sequence):
 
 MAX_LIMIT = 1000
 
+# Seconds the per group totals of a grouped list are reused for the next pages
+GROUP_STATS_CACHE_TIMEOUT = 30
+
 
 class BadPaginationError(Exception):
     pass
@@ -111,7 +185,7 @@ class OffsetPaginator:
             else (order_by[1::] if order_by.startswith("-") else order_by,)
         )
         # Set desc to true when `-` exists in the order by
-        self.desc = True if order_by and order_by.startswith("-") else False
+        self.desc = True if isinstance(order_by, str) and order_by.startswith("-") else False
         self.queryset = queryset
         self.max_limit = max_limit
         self.max_offset = max_offset
@@ -188,6 +262,135 @@ class OffsetPaginator:
         raise NotImplementedError
 
 
+class KeysetPaginator(OffsetPaginator):
+    """
+    The keyset (seek) paginator. Instead of skipping `offset` rows it seeks
+    past the `(order_key, created_at, id)` tuple of the last row of the
+    previous page, so every page costs the same as the first one
+    http://example.com/api/users/?cursor_mode=keyset&cursor=10:1:0:<position>
+    """
+
+    def __init__(self, queryset, count_total=True, *args, **kwargs):
+        super().__init__(queryset, *args, **kwargs)
+        # Set count total to false to skip the total count query altogether
+        self.count_total = count_total
+
+    def __get_key_fields(self):
+        # Ordering fields with their direction, `id` breaks every tie
+        keys = self.key or ("-created_at",)
+        fields = [(key.lstrip("-"), key.startswith("-") or self.desc) for key in keys]
+        names = [field for field, _ in fields]
+        if "id" not in names:
+            if "created_at" not in names:
+                fields.append(("created_at", True))
+            fields.append(("id", True))
+        return fields
+
+    def __get_ordering(self, reverse=False):
+        ordering = []
+        for field, desc in self.__get_key_fields():
+            # Nulls are only possible on the order key and always come last
+            expression = F(field).desc if desc != reverse else F(field).asc
+            ordering.append(expression(nulls_first=True) if reverse else expression(nulls_last=True))
+        return ordering
+
+    def __get_seek_filter(self, position, reverse=False, inclusive=False):
+        # Build the lexicographic "rows after position" filter from the last field
+        fields = self.__get_key_fields()
+        condition = Q(**{fields[-1][0]: position[-1]}) if inclusive else Q(pk__in=[])
+        for index in reversed(range(len(fields))):
+            field, desc = fields[index]
+            value = position[index]
+            lookup = "lt" if desc != reverse else "gt"
+            if value is None:
+                # Null keys are at the end going forward and at the start going back
+                beyond = Q(**{f"{field}__isnull": False}) if reverse else Q(pk__in=[])
+                equal = Q(**{f"{field}__isnull": True})
+            else:
+                beyond = Q(**{f"{field}__{lookup}": value})
+                if index == 0 and not reverse:
+                    beyond |= Q(**{f"{field}__isnull": True})
+                equal = Q(**{field: value})
+            condition = beyond | (equal & condition)
+        return condition
+
+    def get_result(self, limit=1000, cursor=None):
+        if cursor is None or not isinstance(cursor, KeysetCursor):
+            cursor = KeysetCursor(limit, 0, False)
+
+        # Get the min from limit and max limit
+        limit = min(limit, self.max_limit)
+        page = cursor.offset
+        if page < 0:
+            raise BadPaginationError("Pagination offset cannot be negative")
+        if cursor.position is not None and len(cursor.position) != len(self.__get_key_fields()):
+            raise BadPaginationError("Cursor does not match the ordering")
+
+        # Going backwards seeks in the reverse order from the first row of the page
+        is_prev = cursor.is_prev and cursor.position is not None
+        fields = [field for field, _ in self.__get_key_fields()]
+        queryset = self.queryset.order_by(*self.__get_ordering(reverse=is_prev))
+        if cursor.position is not None:
+            queryset = queryset.filter(self.__get_seek_filter(cursor.position, reverse=is_prev))
+
+        # Fetch only the key values of the page and one more row to know if there is more
+        page_keys = list(queryset.values_list(*fields)[: limit + 1])
+        has_more = len(page_keys) > limit
+        page_keys = page_keys[:limit]
+
+        if is_prev:
+            page_keys.reverse()
+            # Read the rows back in the forward order starting from the first row of the page
+            results = (
+                self.queryset.order_by(*self.__get_ordering()).filter(
+                    self.__get_seek_filter(list(page_keys[0]), inclusive=True)
+                )[: len(page_keys)]
+                if page_keys
+                else self.queryset.none()
+            )
+        else:
+            results = queryset[:limit]
+
+        # Count once on the first page and carry the total along in the cursor
+        if cursor.total is not None:
+            count = cursor.total
+        elif self.count_total:
+            count = self.total_count_queryset.count() if self.total_count_queryset else self.queryset.count()
+        else:
+            count = None
+
+        first = list(page_keys[0]) if page_keys else cursor.position
+        last = list(page_keys[-1]) if page_keys else cursor.position
+        next_cursor = KeysetCursor(
+            limit,
+            page + 1,
+            False,
+            (not is_prev and has_more) or (is_prev and bool(page_keys)),
+            position=last,
+            total=count,
+        )
+        prev_cursor = KeysetCursor(
+            limit,
+            max(page - 1, 0),
+            True,
+            (is_prev and has_more) or (not is_prev and page > 0),
+            position=first,
+            total=count,
+        )
+
+        # Process the results
+        if self.on_results:
+            results = self.on_results(results)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=count,
+            max_hits=math.ceil(count / limit) if count is not None else None,
+        )
+
+
 class GroupedOffsetPaginator(OffsetPaginator):
     # Field mappers - list m2m fields here
     FIELD_MAPPER = {
@@ -216,6 +419,48 @@ class GroupedOffsetPaginator(OffsetPaginator):
         # Set the count filter - this are extra filters that need to be passed
         # to calculate the counts with the filters
         self.count_filter = count_filter
+        # Per group totals and row counts, filled by get_result
+        self.group_stats = None
+
+    def __get_stats_cache_key(self):
+        # The compiled query identifies the filters applied on the grouped queryset
+        try:
+            query = str(self.queryset.query)
+        except EmptyResultSet:
+            return None
+        digest = hashlib.sha256(f"{self.group_by_field_name}:{query}".encode()).hexdigest()
+        return f"paginator:group_stats:{digest}"
+
+    def __get_group_stats(self, queryset, refresh=True):
+        # Serve the totals from the cache for the pages after the first one
+        cache_key = self.__get_stats_cache_key()
+        if cache_key is None:
+            return {}
+        if not refresh:
+            group_stats = cache.get(cache_key)
+            if group_stats is not None:
+                return group_stats
+
+        # Rows of every group, counted over the same partition as row_number
+        group_stats = {}
+        for group in (
+            queryset.annotate(
+                group_rows=Window(expression=Count("id"), partition_by=[F(self.group_by_field_name)]),
+            )
+            .filter(row_number=1)
+            .order_by()
+            .values(self.group_by_field_name, "group_rows")
+        ):
+            group_stats[str(group.get(self.group_by_field_name))] = {"total": 0, "rows": group["group_rows"]}
+
+        # A window cannot count distinct ids, the totals count an item joined
+        # to several rows of its group once
+        for group in self.__get_total_queryset():
+            group_stats.setdefault(str(group.get(self.group_by_field_name)), {"total": 0, "rows": 0})["total"] = (
+                group["count"]
+            )
+        cache.set(cache_key, group_stats, GROUP_STATS_CACHE_TIMEOUT)
+        return group_stats
 
     def get_result(self, limit=50, cursor=None):
         # offset is page #
@@ -263,24 +508,27 @@ class GroupedOffsetPaginator(OffsetPaginator):
             F("created_at").desc(),
         )
 
+        # Totals, row counts and has more flags for every group from a single query
+        self.group_stats = self.__get_group_stats(queryset, refresh=page == 0)
+
         # Adjust cursors based on the grouped results for pagination
-        next_cursor = Cursor(limit, page + 1, False, queryset.filter(row_number__gte=stop).exists())
+        next_cursor = Cursor(
+            limit,
+            page + 1,
+            False,
+            any(group["rows"] >= stop for group in self.group_stats.values()),
+        )
 
         # Add previous cursors
         prev_cursor = Cursor(limit, page - 1, True, page > 0)
 
         # Count the queryset
-        count = queryset.count()
+        count = sum(group["rows"] for group in self.group_stats.values())
 
         # Optionally, calculate the total count and max_hits if needed
         # This might require adjustments based on specific use cases
-        if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-                .order_by("-count")[0]["count"]
-                / limit
-            )
+        if self.group_stats:
+            max_hits = math.ceil(max(group["total"] for group in self.group_stats.values()) / limit)
         else:
             max_hits = 0
         return CursorResult(
@@ -300,6 +548,12 @@ class GroupedOffsetPaginator(OffsetPaginator):
         )
 
     def __get_total_dict(self):
+        # Reuse the totals computed along with the page
+        if self.group_stats is not None:
+            return {
+                group: (1 if stats["total"] == 0 else stats["total"]) for group, stats in self.group_stats.items()
+            }
+
         # Convert the total into dictionary of keys as group name and value as the total
         total_group_dict = {}
         for group in self.__get_total_queryset():
@@ -319,37 +573,34 @@ class GroupedOffsetPaginator(OffsetPaginator):
             for field in self.group_by_fields
         }
 
-    def __result_already_added(self, result, group):
-        # Check if the result is already added then add it
-        for existing_issue in group:
-            if existing_issue["id"] == result["id"]:
-                return True
-        return False
-
     def __query_multi_grouper(self, results):
         # Grouping for m2m values
         total_group_dict = self.__get_total_dict()
 
-        # Preparing a dict to keep track of group IDs associated with each entity ID
-        result_group_mapping = defaultdict(set)
+        # Group IDs of each entity ID, one list shared by all the rows of the entity
+        result_group_mapping = defaultdict(list)
+        # Entity IDs already added to each group
+        group_result_ids = defaultdict(set)
         # Preparing a dict to group result by group ID
         grouped_by_field_name = defaultdict(list)
 
-        # Iterate over results to fill the above dictionaries
-        for result in results:
-            result_id = result["id"]
-            group_id = result[self.group_by_field_name]
-            result_group_mapping[str(result_id)].add(str(group_id))
-
-        # Adding group_ids key to each issue and grouping by group_name
+        # Collect the group IDs and add each result once per group in a single pass
         for result in results:
-            result_id = result["id"]
-            group_ids = list(result_group_mapping[str(result_id)])
-            result[self.FIELD_MAPPER.get(self.group_by_field_name)] = [] if "None" in group_ids else group_ids
-            # If a result belongs to multiple groups, add it to each group
-            for group_id in group_ids:
-                if not self.__result_already_added(result, grouped_by_field_name[group_id]):
-                    grouped_by_field_name[group_id].append(result)
+            result_id = str(result["id"])
+            group_id = str(result[self.group_by_field_name])
+            group_ids = result_group_mapping[result_id]
+            if group_id not in group_ids:
+                group_ids.append(group_id)
+            result[self.FIELD_MAPPER.get(self.group_by_field_name)] = group_ids
+
+            if result_id not in group_result_ids[group_id]:
+                group_result_ids[group_id].add(result_id)
+                grouped_by_field_name[group_id].append(result)
+
+        # Entities without any m2m value are only in the `None` group
+        for group_ids in result_group_mapping.values():
+            if "None" in group_ids:
+                group_ids.clear()
 
         # Convert grouped_by_field_name back to a list for each group
         processed_results = {
@@ -564,45 +815,42 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
     def __query_multi_grouper(self, results):
         # Multi grouper
         processed_results = self.__get_field_dict()
-        # Preparing a dict to keep track of group IDs associated with each label ID
-        result_group_mapping = defaultdict(set)
-        result_sub_group_mapping = defaultdict(set)
-
-        # Iterate over results to fill the above dictionaries
-        if self.group_by_field_name in self.FIELD_MAPPER:
-            for result in results:
-                result_id = result["id"]
-                group_id = result[self.group_by_field_name]
-                result_group_mapping[str(result_id)].add(str(group_id))
-        # Use the same calculation for the sub group
-        if self.sub_group_by_field_name in self.FIELD_MAPPER:
-            for result in results:
-                result_id = result["id"]
-                sub_group_id = result[self.sub_group_by_field_name]
-                result_sub_group_mapping[str(result_id)].add(str(sub_group_id))
-
-        # Iterate over results
+        # Group and sub group IDs of each entity ID, one list shared by all the rows of the entity
+        result_group_mapping = defaultdict(list)
+        result_sub_group_mapping = defaultdict(list)
+        group_is_m2m = self.group_by_field_name in self.FIELD_MAPPER
+        sub_group_is_m2m = self.sub_group_by_field_name in self.FIELD_MAPPER
+
+        # Iterate over results once to collect the IDs and fill the groups
         for result in results:
+            result_id = str(result["id"])
             # Get the group value
             group_value = str(result.get(self.group_by_field_name))
             # Get the sub group value
             sub_group_value = str(result.get(self.sub_group_by_field_name))
+
+            if group_is_m2m:
+                # for multi grouper
+                group_ids = result_group_mapping[result_id]
+                if group_value not in group_ids:
+                    group_ids.append(group_value)
+                result[self.FIELD_MAPPER.get(self.group_by_field_name)] = group_ids
+            if sub_group_is_m2m:
+                # for multi groups
+                sub_group_ids = result_sub_group_mapping[result_id]
+                if sub_group_value not in sub_group_ids:
+                    sub_group_ids.append(sub_group_value)
+                result[self.FIELD_MAPPER.get(self.sub_group_by_field_name)] = sub_group_ids
+
             # Check if the group value is in the processed results
-            result_id = result["id"]
-
-            if group_value in processed_results and sub_group_value in processed_results[str(group_value)]["results"]:
-                if self.group_by_field_name in self.FIELD_MAPPER:
-                    # for multi grouper
-                    group_ids = list(result_group_mapping[str(result_id)])
-                    result[self.FIELD_MAPPER.get(self.group_by_field_name)] = [] if "None" in group_ids else group_ids
-                if self.sub_group_by_field_name in self.FIELD_MAPPER:
-                    sub_group_ids = list(result_sub_group_mapping[str(result_id)])
-                    # for multi groups
-                    result[self.FIELD_MAPPER.get(self.sub_group_by_field_name)] = (
-                        [] if "None" in sub_group_ids else sub_group_ids
-                    )
+            if group_value in processed_results and sub_group_value in processed_results[group_value]["results"]:
                 # If a result belongs to multiple groups, add it to each group
-                processed_results[str(group_value)]["results"][str(sub_group_value)]["results"].append(result)
+                processed_results[group_value]["results"][sub_group_value]["results"].append(result)
+
+        # Entities without any m2m value are only in the `None` group
+        for ids in (*result_group_mapping.values(), *result_sub_group_mapping.values()):
+            if "None" in ids:
+                ids.clear()
 
         return processed_results
 
@@ -635,6 +883,9 @@ class BasePaginator:
     # cursor query parameter name
     cursor_name = "cursor"
 
+    # cursor mode query parameter name, `keyset` switches plain lists to seek pagination
+    cursor_mode_name = "cursor_mode"
+
     # get the per page parameter from request
     def get_per_page(self, request, default_per_page=1000, max_per_page=1000):
         try:
@@ -669,6 +920,18 @@ class BasePaginator:
     ):
         """Paginate the request"""
         per_page = self.get_per_page(request, default_per_page, max_per_page)
+
+        # Keyset pagination is opt in and only available for ungrouped lists
+        if (
+            not paginator
+            and not group_by_field_name
+            and paginator_cls is OffsetPaginator
+            and request.GET.get(self.cursor_mode_name) == "keyset"
+        ):
+            paginator_cls = KeysetPaginator
+            cursor_cls = KeysetCursor
+            paginator_kwargs["count_total"] = request.GET.get("with_total", "true").lower() != "false"
+
         # Convert the cursor value to integer and float from string
         input_cursor = None
         try:
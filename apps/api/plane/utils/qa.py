@@ -1,4 +1,21 @@
-from plane.db.models import CaseReview, CaseReviewRecord, CaseReviewThrough, TestCase
+from django.db.models import OuterRef, Subquery
+
+from plane.db.models import CaseReview, CaseReviewRecord, CaseReviewThrough, TestCase, TestCaseVersion
+
+
+def annotate_case_list(queryset):
+    """用例列表一次取回关联对象、最新版本和最新评审结果，避免逐条查询"""
+    latest_version = TestCaseVersion.objects.filter(case_id=OuterRef('pk')).order_by('-version')
+    latest_review = CaseReviewRecord.objects.filter(crt__case_id=OuterRef('pk')).order_by('-created_at')
+    return (
+        queryset.select_related('repository', 'module', 'assignee')
+        .prefetch_related('labels', 'issues')
+        .annotate(
+            latest_version=Subquery(latest_version.values('version')[:1]),
+            latest_version_updated_at=Subquery(latest_version.values('updated_at')[:1]),
+            latest_review=Subquery(latest_review.values('result')[:1]),
+        )
+    )
 
 
 def update_case_review_status(cr, crt, assignee_id=None):
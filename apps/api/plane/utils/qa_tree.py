@@ -0,0 +1,164 @@
+# Python imports
+from collections import defaultdict
+
+# Django imports
+from django.core.cache import cache
+from django.db import transaction
+
+# Module imports
+from plane.db.models import CaseModule
+from plane.utils.cache import bump_cache_version, get_cache_version
+
+# Generation namespace of the cached modules of a repository
+MODULE_TREE_NAMESPACE = "qa_module_tree:{repository_id}"
+MODULE_TREE_CACHE_TIMEOUT = 60 * 60
+
+
+def invalidate_module_tree(repository_id):
+    """Drop the cached modules of a repository once the change to them commits"""
+    if repository_id:
+        namespace = MODULE_TREE_NAMESPACE.format(repository_id=repository_id)
+        # A read between an early bump and the commit would cache the old modules under the new generation
+        transaction.on_commit(lambda: bump_cache_version(namespace))
+
+
+def _module_tree_cache_key(repository_id):
+    namespace = MODULE_TREE_NAMESPACE.format(repository_id=repository_id)
+    return f"{namespace}:v{get_cache_version(namespace)}"
+
+
+def get_repository_modules(repository_ids):
+    """
+    Return the live modules of the repositories keyed by repository id.
+
+    The modules are cached per repository generation, the repositories
+    missing from the cache are loaded together in one query.
+    """
+    repository_ids = [str(repository_id) for repository_id in dict.fromkeys(repository_ids) if repository_id]
+    keys = {repository_id: _module_tree_cache_key(repository_id) for repository_id in repository_ids}
+    cached = cache.get_many(list(keys.values()))
+    modules = {repository_id: cached[key] for repository_id, key in keys.items() if key in cached}
+
+    missing = [repository_id for repository_id in repository_ids if repository_id not in modules]
+    if missing:
+        loaded = {repository_id: [] for repository_id in missing}
+        for module in CaseModule.objects.filter(repository_id__in=missing).values(
+            "id", "name", "parent_id", "repository_id"
+        ):
+            loaded[str(module["repository_id"])].append(
+                {
+                    "id": str(module["id"]),
+                    "name": module["name"],
+                    "parent_id": str(module["parent_id"]) if module["parent_id"] else None,
+                }
+            )
+        cache.set_many({keys[repository_id]: rows for repository_id, rows in loaded.items()}, MODULE_TREE_CACHE_TIMEOUT)
+        modules.update(loaded)
+    return modules
+
+
+def build_module_tree(repository_id, modules, module_counts=None, module_ids=None):
+    """
+    Build the module nodes of a repository.
+
+    `module_ids` limits the tree to these modules and their ancestors.
+    With `module_counts` every node carries the case count of its subtree,
+    totalled children first in a single pass.
+    """
+    by_id = {module["id"]: module for module in modules}
+    if module_ids is not None:
+        included = set()
+        for module_id in module_ids:
+            while module_id in by_id and module_id not in included:
+                included.add(module_id)
+                module_id = by_id[module_id]["parent_id"]
+        by_id = {module_id: module for module_id, module in by_id.items() if module_id in included}
+
+    nodes = {}
+    for module_id, module in by_id.items():
+        nodes[module_id] = {
+            "id": module_id,
+            "name": module["name"] or "-",
+            "kind": "module",
+            "repository_id": repository_id,
+            "children": [],
+        }
+
+    # Attaching in name order keeps the roots and every children list sorted
+    roots = []
+    for module_id in sorted(by_id, key=lambda module_id: (by_id[module_id]["name"] or "").lower()):
+        parent_id = by_id[module_id]["parent_id"]
+        siblings = nodes[parent_id]["children"] if parent_id in nodes else roots
+        siblings.append(nodes[module_id])
+
+    if module_counts is not None:
+        # A reversed pre-order visits every module after all of its children
+        order = []
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node["children"])
+        for node in reversed(order):
+            node["count"] = int(module_counts.get(node["id"], 0)) + sum(child["count"] for child in node["children"])
+    return roots
+
+
+def build_case_tree(repositories, module_ids_by_repository=None, case_counts=None):
+    """
+    Build the repository and module tree of the QA case pickers.
+
+    `repositories` are (id, name) pairs in display order.
+    `module_ids_by_repository` limits each repository to the modules of its
+    cases. `case_counts` maps (repository id, module id or None) to a case
+    count and adds subtree totals to every node.
+    """
+    repository_ids = [str(repository_id) for repository_id, _ in repositories]
+    modules_by_repository = get_repository_modules(repository_ids)
+
+    module_counts = None
+    repository_counts = None
+    if case_counts is not None:
+        module_counts = defaultdict(int)
+        repository_counts = defaultdict(int)
+        for (repository_id, module_id), count in case_counts.items():
+            repository_counts[str(repository_id)] += count
+            if module_id:
+                module_counts[str(module_id)] += count
+
+    children = []
+    for repository_id, repository_name in repositories:
+        repository_id = str(repository_id)
+        module_ids = None
+        if module_ids_by_repository is not None:
+            module_ids = module_ids_by_repository.get(repository_id, set())
+        module_tree = build_module_tree(
+            repository_id,
+            modules_by_repository.get(repository_id, []),
+            module_counts=module_counts,
+            module_ids=module_ids,
+        )
+
+        all_modules = {
+            "id": f"{repository_id}:all_modules",
+            "name": "全部模块",
+            "kind": "repository_modules_all",
+            "repository_id": repository_id,
+        }
+        repository = {
+            "id": repository_id,
+            "name": repository_name or "-",
+            "kind": "repository",
+            "repository_id": repository_id,
+        }
+        if repository_counts is not None:
+            all_modules["count"] = repository["count"] = repository_counts.get(repository_id, 0)
+        all_modules["children"] = module_tree
+        repository["children"] = [all_modules]
+        children.append(repository)
+
+    root = {"id": "all", "name": "全部用例库", "kind": "root"}
+    if repository_counts is not None:
+        root["count"] = sum(repository_counts.get(str(repository_id), 0) for repository_id in repository_ids)
+    root["children"] = children
+    return root